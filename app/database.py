@@ -1,16 +1,129 @@
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, text, make_url
 from sqlalchemy.orm import sessionmaker, declarative_base
 from dotenv import load_dotenv
+from fastapi import Request
+from app.utils.db_pool import InstrumentedAsyncQueuePool, InstrumentedQueuePool
+from app.utils.read_your_writes import is_pinned_to_primary
+import itertools
 import os
 
 load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL")
 
-engine = create_engine(DATABASE_URL)
+# Optional comma-separated read replicas for list, report and timeline reads
+DATABASE_REPLICA_URLS = [
+    url.strip()
+    for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",")
+    if url.strip()
+]
+
+
+def to_async_url(url: str) -> str:
+    return (
+        make_url(url)
+        .set(drivername="postgresql+asyncpg")
+        .render_as_string(hide_password=False)
+    )
+
+
+# Serve requests from async handlers on an asyncpg engine instead of the
+# threadpool + blocking engine. The handler bodies then run on the event loop:
+# database round trips and Redis cache calls (see run_blocking) are awaited,
+# but serialization and the short lock-protected sections of the in-process
+# caches and metrics still run on the loop
+DATABASE_ASYNC = os.getenv("DATABASE_ASYNC", "false").lower() == "true"
+DATABASE_ASYNC_URL = os.getenv("DATABASE_ASYNC_URL") or (
+    to_async_url(DATABASE_URL) if DATABASE_URL else None
+)
+
+# Connection pool settings
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "-1"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "false").lower() == "true"
+
+# Server-side timeouts applied to every pooled connection (0 disables them)
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "0"))
+DB_IDLE_IN_TRANSACTION_TIMEOUT_MS = int(
+    os.getenv("DB_IDLE_IN_TRANSACTION_TIMEOUT_MS", "0")
+)
+
+
+def engine_options(is_async: bool = False) -> dict:
+    server_settings = {
+        "statement_timeout": str(DB_STATEMENT_TIMEOUT_MS),
+        "idle_in_transaction_session_timeout": str(DB_IDLE_IN_TRANSACTION_TIMEOUT_MS),
+    }
+    if is_async:
+        connect_args = {"server_settings": server_settings}
+    else:
+        connect_args = {
+            "options": " ".join(
+                f"-c {name}={value}" for name, value in server_settings.items()
+            )
+        }
+    return {
+        "poolclass": InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool,
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+        "connect_args": connect_args,
+    }
+
+
+# Sessions only check out a connection on their first query, so requests that
+# never touch the database never take one from the pool
+engine = create_engine(DATABASE_URL, **engine_options())
 sessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
+replica_engines = [
+    create_engine(url, **engine_options()) for url in DATABASE_REPLICA_URLS
+]
+replica_sessions = itertools.cycle(
+    [
+        sessionmaker(autocommit=False, autoflush=False, bind=replica_engine)
+        for replica_engine in replica_engines
+    ]
+)
+
+async_engine = None
+asyncSessionLocal = None
+async_replica_engines = []
+if DATABASE_ASYNC:
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    async_engine = create_async_engine(
+        DATABASE_ASYNC_URL, **engine_options(is_async=True)
+    )
+    # Handlers return ORM objects that are serialized after the session work is
+    # done, so attributes must not expire (and lazily reload) on commit
+    asyncSessionLocal = async_sessionmaker(
+        bind=async_engine,
+        autocommit=False,
+        autoflush=False,
+        expire_on_commit=False,
+    )
+    async_replica_engines = [
+        create_async_engine(to_async_url(url), **engine_options(is_async=True))
+        for url in DATABASE_REPLICA_URLS
+    ]
+    async_replica_sessions = itertools.cycle(
+        [
+            async_sessionmaker(
+                bind=replica_engine,
+                autocommit=False,
+                autoflush=False,
+                expire_on_commit=False,
+            )
+            for replica_engine in async_replica_engines
+        ]
+    )
+
 
 # Function to test database connection
 def test_connection():
@@ -26,3 +139,36 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# Session factory for read-only work. Sessions round-robin across the
+# replicas, falling back to the primary when none are configured or the client
+# wrote something recently.
+def read_session_factory(request: Request):
+    if not replica_engines or is_pinned_to_primary(request):
+        return sessionLocal
+    return next(replica_sessions)
+
+
+# Dependency to get a DB session for read-only endpoints
+def get_read_db(request: Request):
+    db = read_session_factory(request)()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+# Dependency to get an async DB session (DATABASE_ASYNC=true)
+async def get_async_db():
+    async with asyncSessionLocal() as db:
+        yield db
+
+
+async def get_async_read_db(request: Request):
+    if not async_replica_engines or is_pinned_to_primary(request):
+        session_factory = asyncSessionLocal
+    else:
+        session_factory = next(async_replica_sessions)
+    async with session_factory() as db:
+        yield db
@@ -1,11 +1,43 @@
-from fastapi import FastAPI
-from app.database import Base, test_connection, engine
+from fastapi import FastAPI, Request
+from app.database import Base, test_connection, engine, sessionLocal
 from app.models import *
-from app.routers import comments, users, issues, labels, reports
+from app.routers import (
+    comments,
+    users,
+    issues,
+    labels,
+    reports,
+    imports,
+    metrics,
+    sync,
+)
+from app.utils.read_your_writes import WRITE_METHODS, pin_to_primary
+from app.utils.change_feed import start_change_feed, stop_change_feed
+from app.utils.cache_invalidation import (
+    start_invalidation_listener,
+    stop_invalidation_listener,
+)
+from app.utils.event_partitions import (
+    maintain_event_partitions,
+    start_event_maintenance,
+    stop_event_maintenance,
+)
+from app.utils.report_stats import rebuild_report_stats
+from app.utils.timeline import start_event_writer, stop_event_writer
 
 app = FastAPI()
 
 
+# Pin clients to the primary database for a short while after they write, so
+# reads routed to replicas always include their own changes
+@app.middleware("http")
+async def read_your_writes(request: Request, call_next):
+    response = await call_next(request)
+    if request.method in WRITE_METHODS and response.status_code < 400:
+        pin_to_primary(response)
+    return response
+
+
 @app.get("/")
 def health_check():
     return {"status": "Issue Tracker API is running"}
@@ -28,6 +60,27 @@ def on_startup():
     # Issue.__table__.create(bind=engine, checkfirst=True)
     # Comment.__table__.create(bind=engine, checkfirst=True)
     Base.metadata.create_all(bind=engine)
+    maintain_event_partitions()
+
+    # Backfill the report aggregates the first time they are created
+    db = sessionLocal()
+    try:
+        rebuild_report_stats(db, only_if_empty=True)
+    finally:
+        db.close()
+
+    start_invalidation_listener()
+    start_event_writer()
+    start_event_maintenance()
+    start_change_feed()
+
+
+@app.on_event("shutdown")
+def on_shutdown():
+    stop_change_feed()
+    stop_event_maintenance()
+    stop_event_writer()
+    stop_invalidation_listener()
 
 
 app.include_router(users.router)
@@ -35,3 +88,6 @@ app.include_router(issues.router)
 app.include_router(comments.router)
 app.include_router(labels.router)
 app.include_router(reports.router)
+app.include_router(imports.router)
+app.include_router(metrics.router)
+app.include_router(sync.router)
@@ -3,3 +3,10 @@ from app.models.issue import Issue
 from app.models.comment import Comment
 from app.models.label import Label
 from app.models.issue_label import issue_labels
+from app.models.issue_event import IssueEvent
+from app.models.sync import DeletedRecord
+from app.models.report_stats import (
+    AssigneeIssueCount,
+    IssueDailyRollup,
+    ResolutionStats,
+)
@@ -1,7 +1,19 @@
-from sqlalchemy import Column, Integer, Text, ForeignKey, DateTime
-from sqlalchemy.orm import relationship
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    Computed,
+    Integer,
+    Text,
+    ForeignKey,
+    DateTime,
+    Index,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred, relationship
 from datetime import datetime
 from app.database import Base
+from app.models.issue import TEXT_SEARCH_CONFIG
+from app.models.sync import CURRENT_XID
 
 
 class Comment(Base):
@@ -11,5 +23,26 @@ class Comment(Base):
     issue_id = Column(Integer, ForeignKey("issues.id"), nullable=False)
     author_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    search_vector = deferred(
+        Column(
+            TSVECTOR,
+            Computed(f"to_tsvector('{TEXT_SEARCH_CONFIG}', content)", persisted=True),
+        )
+    )
+    # Transaction that last wrote the comment, for GET /sync
+    sync_xid = deferred(
+        Column(
+            BigInteger,
+            nullable=False,
+            server_default=CURRENT_XID,
+            onupdate=CURRENT_XID,
+        )
+    )
     issue = relationship("Issue", back_populates="comments")
     author = relationship("User", back_populates="comments")
+
+    __table_args__ = (
+        Index("ix_comments_issue_id_created_at", "issue_id", "created_at"),
+        Index("ix_comments_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_comments_sync_xid_id", "sync_xid", "id"),
+    )
@@ -1,4 +1,5 @@
 from sqlalchemy import (
+    BigInteger,
     Column,
     Integer,
     String,
@@ -6,16 +7,27 @@ from sqlalchemy import (
     ForeignKey,
     DateTime,
     CheckConstraint,
+    Computed,
+    Index,
+    text,
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred, relationship
 from datetime import datetime
 from app.database import Base
 from app.models.issue_label import issue_labels
+from app.models.sync import CURRENT_XID
+
+# Text search configuration of the generated search columns and their queries
+TEXT_SEARCH_CONFIG = "english"
+
+ISSUE_STATUSES = ("open", "in_progress", "resolved", "closed")
+ISSUE_PRIORITIES = ("low", "medium", "high", "critical")
 
 
 class Issue(Base):
     __tablename__ = "issues"
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     title = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
     status = Column(String(20), nullable=False, default="open")
@@ -27,6 +39,26 @@ class Issue(Base):
         DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
     )
     resolved_at = Column(DateTime, nullable=True)
+    # Transaction that last wrote the issue, for GET /sync
+    sync_xid = deferred(
+        Column(
+            BigInteger,
+            nullable=False,
+            server_default=CURRENT_XID,
+            onupdate=CURRENT_XID,
+        )
+    )
+    # Maintained by PostgreSQL; deferred so regular issue queries skip it
+    search_vector = deferred(
+        Column(
+            TSVECTOR,
+            Computed(
+                f"setweight(to_tsvector('{TEXT_SEARCH_CONFIG}', coalesce(title, '')), 'A')"
+                f" || setweight(to_tsvector('{TEXT_SEARCH_CONFIG}', coalesce(description, '')), 'B')",
+                persisted=True,
+            ),
+        )
+    )
     comments = relationship(
         "Comment", back_populates="issue", cascade="all, delete-orphan"
     )
@@ -37,13 +69,52 @@ class Issue(Base):
 
     __table_args__ = (
         CheckConstraint(
-            "status IN ('open', 'in_progress', 'resolved', 'closed')",
+            f"status IN ({', '.join(repr(value) for value in ISSUE_STATUSES)})",
             name="check_status_valid",
         ),
         CheckConstraint(
-            "priority IN ('low', 'medium', 'high', 'critical')",
+            f"priority IN ({', '.join(repr(value) for value in ISSUE_PRIORITIES)})",
             name="check_priority_valid",
         ),
+        # Sort columns paired with id so keyset pagination can seek on the index
+        Index("ix_issues_created_at_id", "created_at", "id"),
+        Index("ix_issues_updated_at_id", "updated_at", "id"),
+        Index("ix_issues_status_id", "status", "id"),
+        Index("ix_issues_priority_id", "priority", "id"),
+        # Common filter + default sort combinations for GET /issues/
+        Index("ix_issues_status_created_at_id", "status", "created_at", "id"),
+        Index("ix_issues_priority_created_at_id", "priority", "created_at", "id"),
+        Index("ix_issues_assignee_id_updated_at_id", "assignee_id", "updated_at", "id"),
+        Index(
+            "ix_issues_unresolved_created_at_id",
+            "created_at",
+            "id",
+            postgresql_where=text("resolved_at IS NULL"),
+        ),
+        # Resolved issues by resolution time, for the latency percentile reports
+        Index(
+            "ix_issues_resolved_at_id",
+            "resolved_at",
+            "id",
+            postgresql_where=text("resolved_at IS NOT NULL"),
+        ),
+        Index("ix_issues_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_issues_sync_xid_id", "sync_xid", "id"),
     )
 
     assignee = relationship("User", back_populates="issues")
+
+
+# Columns of IssueResponse, for queries that return rows instead of ORM objects
+ISSUE_COLUMNS = (
+    Issue.id,
+    Issue.title,
+    Issue.description,
+    Issue.status,
+    Issue.priority,
+    Issue.assignee_id,
+    Issue.version,
+    Issue.created_at,
+    Issue.updated_at,
+    Issue.resolved_at,
+)
@@ -1,22 +1,46 @@
 from typing import Optional
 from pydantic import BaseModel
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime
-from sqlalchemy.orm import relationship
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    Integer,
+    String,
+    ForeignKey,
+    DateTime,
+    Index,
+)
+from sqlalchemy.orm import deferred, relationship
 from datetime import datetime
 from app.database import Base
+from app.models.sync import CURRENT_XID
 
 
 class IssueEvent(Base):
     __tablename__ = "issue_events"
 
-    id = Column(Integer, primary_key=True, index=True)
+    # Partitioned by month of created_at, which must be part of the key
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     issue_id = Column(Integer, ForeignKey("issues.id"), nullable=False)
     event_type = Column(String(50), nullable=False)
     old_value = Column(String(255), nullable=True)
     new_value = Column(String(255), nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(
+        DateTime, primary_key=True, nullable=False, default=datetime.utcnow
+    )
+    # Transaction that wrote the event; orders GET /issues/changes
+    sync_xid = deferred(
+        Column(BigInteger, nullable=False, server_default=CURRENT_XID)
+    )
 
     issue = relationship("Issue", back_populates="events")
 
+    __table_args__ = (
+        Index(
+            "ix_issue_events_issue_id_created_at_id", "issue_id", "created_at", "id"
+        ),
+        Index("ix_issue_events_sync_xid_id", "sync_xid", "id"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+
     def __repr__(self):
         return f"<IssueEvent(id={self.id}, issue_id={self.issue_id}, event_type='{self.event_type}', created_at={self.created_at})>"
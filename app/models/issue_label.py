@@ -1,5 +1,6 @@
-from sqlalchemy import Column, Integer, Table, ForeignKey
+from sqlalchemy import BigInteger, Column, Index, Integer, Table, ForeignKey
 from app.database import Base
+from app.models.sync import CURRENT_XID
 
 issue_labels = Table(
     "issue_labels",
@@ -16,4 +17,9 @@ issue_labels = Table(
         ForeignKey("labels.id", ondelete="CASCADE"),
         primary_key=True,
     ),
+    # Transaction that added the label, for GET /sync
+    Column("sync_xid", BigInteger, nullable=False, server_default=CURRENT_XID),
+    # The primary key serves issue -> labels; this serves label -> issues
+    Index("ix_issue_labels_label_id_issue_id", "label_id", "issue_id"),
+    Index("ix_issue_labels_sync_xid", "sync_xid", "issue_id", "label_id"),
 )
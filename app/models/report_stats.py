@@ -0,0 +1,46 @@
+from sqlalchemy import BigInteger, Column, Date, Float, ForeignKey, Integer, String
+from app.database import Base
+
+
+class AssigneeIssueCount(Base):
+    """Number of issues currently assigned to each user."""
+
+    __tablename__ = "assignee_issue_counts"
+
+    assignee_id = Column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    issue_count = Column(Integer, nullable=False, default=0)
+
+
+class ResolutionStats(Base):
+    """Running count and total resolution time of resolved issues.
+
+    Writers add to a random shard so concurrent resolutions do not queue on a
+    single row; readers sum the few shards.
+    """
+
+    __tablename__ = "resolution_stats"
+
+    shard = Column(Integer, primary_key=True, autoincrement=False)
+    resolved_count = Column(BigInteger, nullable=False, default=0)
+    total_resolution_seconds = Column(Float, nullable=False, default=0)
+
+
+class IssueDailyRollup(Base):
+    """Issues created and resolved per day, priority and assignee.
+
+    `assignee_id` is 0 for unassigned issues so it can be part of the key.
+    Like ResolutionStats, each key is split into shards that writers pick at
+    random, so concurrent creates of the same day, priority and assignee do
+    not queue on one row; readers sum over the shards.
+    """
+
+    __tablename__ = "issue_daily_rollups"
+
+    bucket_date = Column(Date, primary_key=True)
+    priority = Column(String(20), primary_key=True)
+    assignee_id = Column(Integer, primary_key=True, autoincrement=False)
+    shard = Column(Integer, primary_key=True, autoincrement=False, default=0)
+    created_count = Column(Integer, nullable=False, default=0)
+    resolved_count = Column(Integer, nullable=False, default=0)
@@ -0,0 +1,26 @@
+from sqlalchemy import BigInteger, Column, DateTime, Index, Integer, String, text
+from datetime import datetime
+from app.database import Base
+
+# Id of the transaction writing a row. Rows returned by GET /sync carry it in
+# their sync_xid column, which app/utils/sync.py compares with snapshots.
+CURRENT_XID = text("pg_current_xact_id()::text::bigint")
+
+
+class DeletedRecord(Base):
+    """Tombstone of a deleted row, so incremental syncs can remove it too."""
+
+    __tablename__ = "deleted_records"
+
+    id = Column(BigInteger, primary_key=True)
+    # issue_label: record_id is the label removed from issue_id
+    record_type = Column(String(20), nullable=False)
+    issue_id = Column(Integer, nullable=False)
+    record_id = Column(Integer, nullable=False)
+    deleted_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    sync_xid = Column(BigInteger, nullable=False, server_default=CURRENT_XID)
+
+    __table_args__ = (
+        Index("ix_deleted_records_sync_xid_id", "sync_xid", "id"),
+        Index("ix_deleted_records_deleted_at", "deleted_at"),
+    )
@@ -1,7 +1,9 @@
 from fastapi import APIRouter, HTTPException, Depends, status, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import asc, desc, func
-from app.database import get_db
+from app.database import get_db, get_read_db
+from app.utils.async_db import supports_async_db
 from app.models.comment import Comment
 from app.models.issue import Issue
 from app.models.user import User
@@ -10,14 +12,22 @@ from typing import Optional, Literal
 from datetime import datetime
 
 from app.utils.timeline import log_issue_event
+from app.utils.cache_invalidation import invalidate_issues
+from app.utils.counting import count_total
+from app.utils.serialization import column_names, rows_to_dicts, schema_columns
 
 router = APIRouter(
     prefix="/issues/{issue_id}/comments",
     tags=["comments"],
 )
 
+# Comment lists are read as column rows and serialized with orjson
+COMMENT_COLUMNS = schema_columns(Comment, CommentResponse)
+COMMENT_FIELDS = column_names(COMMENT_COLUMNS)
+
 
 @router.post("/", response_model=CommentResponse, status_code=status.HTTP_201_CREATED)
+@supports_async_db
 def create_comment(
     issue_id: int, comment: CommentCreate, db: Session = Depends(get_db)
 ):
@@ -47,6 +57,7 @@ def create_comment(
         event_type="comment added",
         new_value=f"Comment Content: {db_comment.content[:30]}...",
     )
+    invalidate_issues(db, [issue_id])
     db.commit()
     db.refresh(db_comment)
     return db_comment
@@ -57,6 +68,7 @@ def create_comment(
     response_model=CommentListResponse,
     status_code=status.HTTP_200_OK,
 )
+@supports_async_db
 def list_comments(
     issue_id: int,
     author_id: Optional[int] = Query(None),
@@ -66,16 +78,17 @@ def list_comments(
     page_size: int = Query(10, ge=1, le=100),
     sort_by: Literal["created_at"] = Query("created_at"),
     sort_order: Literal["asc", "desc"] = Query("desc"),
-    db: Session = Depends(get_db),
+    total_mode: Literal["exact", "estimated", "none"] = Query("exact"),
+    db: Session = Depends(get_read_db),
 ):
-    issue = db.query(Issue).filter(Issue.id == issue_id).first()
+    issue = db.query(Issue.id).filter(Issue.id == issue_id).first()
     if not issue:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Issue not found",
         )
 
-    query = db.query(Comment).filter(Comment.issue_id == issue_id)
+    query = db.query(*COMMENT_COLUMNS).filter(Comment.issue_id == issue_id)
 
     if author_id is not None:
         query = query.filter(Comment.author_id == author_id)
@@ -86,17 +99,33 @@ def list_comments(
     if created_before is not None:
         query = query.filter(Comment.created_at <= created_before)
 
-    total = query.count()
+    total = count_total(
+        db,
+        query,
+        total_mode,
+        table_name=Comment.__tablename__,
+        filters={
+            "issue_id": issue_id,
+            "author_id": author_id,
+            "created_after": created_after,
+            "created_before": created_before,
+        },
+    )
     sort_column = getattr(Comment, sort_by)
     query = query.order_by(
         asc(sort_column) if sort_order == "asc" else desc(sort_column)
     )
     offset = (page - 1) * page_size
     comments = query.offset(offset).limit(page_size).all()
-    db_comment = CommentListResponse(
-        total=total, page=page, page_size=page_size, comments=comments
+    return ORJSONResponse(
+        {
+            "total": total,
+            "total_mode": total_mode,
+            "page": page,
+            "page_size": page_size,
+            "comments": rows_to_dicts(COMMENT_FIELDS, comments),
+        }
     )
-    return db_comment
 
 
 @router.get(
@@ -104,7 +133,10 @@ def list_comments(
     response_model=CommentResponse,
     status_code=status.HTTP_200_OK,
 )
-def get_comment_by_id(issue_id: int, comment_id: int, db: Session = Depends(get_db)):
+@supports_async_db
+def get_comment_by_id(
+    issue_id: int, comment_id: int, db: Session = Depends(get_read_db)
+):
     db_comment = (
         db.query(Comment)
         .filter(Comment.id == comment_id, Comment.issue_id == issue_id)
@@ -0,0 +1,65 @@
+from fastapi import APIRouter, HTTPException, status, UploadFile, File
+from app.schemas.import_job import ImportJobResponse
+from app.utils.csv_import import validate_csv_upload
+from app.utils.import_jobs import (
+    FINISHED_STATUSES,
+    cancel_import_job,
+    job_store,
+    submit_import_job,
+)
+import shutil
+import tempfile
+
+router = APIRouter(
+    prefix="/imports",
+    tags=["imports"],
+)
+
+
+def get_job_or_404(job_id: str):
+    job = job_store.get(job_id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Import job not found",
+        )
+    return job
+
+
+@router.post(
+    "/", response_model=ImportJobResponse, status_code=status.HTTP_202_ACCEPTED
+)
+def create_import_job(file: UploadFile = File(...)):
+    validate_csv_upload(file)
+
+    # The upload is closed once the request ends, so spool it to a file the
+    # worker owns
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".csv") as spool:
+        shutil.copyfileobj(file.file, spool)
+
+    job = submit_import_job(file.filename, spool.name)
+    return ImportJobResponse(**job.snapshot())
+
+
+@router.get(
+    "/{job_id}", response_model=ImportJobResponse, status_code=status.HTTP_200_OK
+)
+def get_import_job(job_id: str):
+    job = get_job_or_404(job_id)
+    return ImportJobResponse(**job.snapshot())
+
+
+@router.post(
+    "/{job_id}/cancel",
+    response_model=ImportJobResponse,
+    status_code=status.HTTP_200_OK,
+)
+def cancel_job(job_id: str):
+    job = get_job_or_404(job_id)
+    if job.status in FINISHED_STATUSES:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Import job already {job.status}",
+        )
+    cancel_import_job(job)
+    return ImportJobResponse(**job.snapshot())
@@ -1,33 +1,291 @@
-from fastapi import APIRouter, HTTPException, Depends, status, Query, UploadFile, File
-from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy import asc, desc, func
+from fastapi import (
+    APIRouter,
+    HTTPException,
+    Depends,
+    status,
+    Query,
+    Request,
+    UploadFile,
+    File,
+)
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy import (
+    ARRAY,
+    Date,
+    Float,
+    Integer,
+    any_,
+    asc,
+    bindparam,
+    case,
+    cast,
+    delete,
+    desc,
+    exists,
+    func,
+    literal,
+    select,
+    true,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
-from app.database import get_db
-from app.models.issue import Issue
+from app.database import get_db, get_read_db, read_session_factory
+from app.utils.async_db import supports_async_db
+from app.models.comment import Comment
+from app.models.issue import (
+    ISSUE_COLUMNS,
+    ISSUE_PRIORITIES,
+    ISSUE_STATUSES,
+    TEXT_SEARCH_CONFIG,
+    Issue,
+)
 from app.models.issue_event import IssueEvent
+from app.models.issue_label import issue_labels
+from app.models.label import Label
 from app.models.user import User
 from app.schemas.issue import (
+    BatchIssueRequest,
+    BatchIssueResponse,
+    BatchIssueResult,
     BulkStatusUpdate,
     IssueCreate,
     IssueUpdate,
     IssueResponse,
     IssueListResponse,
+    IssueSearchResponse,
+    IssueSearchResult,
     CSVImportContent,
     IssueEventResponse,
 )
+from app.schemas.label import BulkLabelUpdate, LabelResponse
+from app.schemas.user import UserSummary
 from datetime import datetime
 from typing import List, Optional, Literal
-import csv
 import io
 from app.utils.timeline import log_issue_event
+from app.utils.pagination import InvalidCursorError, decode_cursor, encode_cursor
+from app.utils.counting import count_total
+from app.utils.change_feed import (
+    InvalidEventIdError,
+    parse_event_id,
+    stream_changes,
+)
+from app.utils.csv_import import import_issues_csv, validate_csv_upload
+from app.utils.issue_export import EXPORT_MEDIA_TYPES, stream_issue_export
+from app.utils.read_your_writes import is_pinned_to_primary
+from app.utils.response_cache import (
+    ISSUE,
+    TIMELINE,
+    CachedResponse,
+    cached_json_response,
+    response_cache,
+)
+from app.utils.cache_invalidation import invalidate_issues
+from app.utils.labels import normalize_label_names, resolve_labels
+from app.utils.serialization import (
+    column_names,
+    dump_json,
+    rows_to_dicts,
+    schema_columns,
+)
+from app.utils.sync import record_label_removals
+from app.utils.report_stats import (
+    UNASSIGNED,
+    adjust_resolution_stats,
+    adjust_rollups,
+    issue_state,
+    record_issue_change,
+    record_issue_changes,
+)
+from collections import defaultdict
 
 router = APIRouter(
     prefix="/issues",
     tags=["issues"],
 )
 
+TIMELINE_PAGE_SIZE = 100
+
+
+def apply_issue_filters(
+    query,
+    status: Optional[str] = None,
+    priority: Optional[str] = None,
+    assignee_id: Optional[int] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    updated_after: Optional[datetime] = None,
+    updated_before: Optional[datetime] = None,
+    resolved: Optional[bool] = None,
+    labels: Optional[tuple] = None,
+    labels_all: Optional[tuple] = None,
+):
+    """Apply the issue list filters shared by the list and search endpoints."""
+    if status:
+        query = query.filter(Issue.status == status)
+
+    if priority:
+        query = query.filter(Issue.priority == priority)
+
+    if assignee_id:
+        query = query.filter(Issue.assignee_id == assignee_id)
+
+    if created_after:
+        query = query.filter(Issue.created_at >= created_after)
+
+    if created_before:
+        query = query.filter(Issue.created_at <= created_before)
+
+    if updated_after:
+        query = query.filter(Issue.updated_at >= updated_after)
+
+    if updated_before:
+        query = query.filter(Issue.updated_at <= updated_before)
+
+    if resolved is not None:
+        if resolved:
+            query = query.filter(Issue.resolved_at.isnot(None))
+        else:
+            query = query.filter(Issue.resolved_at.is_(None))
+
+    # Semi-joins rather than joins, so an issue with several matching labels
+    # is returned once and a LIMIT can stop at the first page of matches
+    if labels:
+        query = query.filter(
+            exists().where(
+                issue_labels.c.issue_id == Issue.id,
+                issue_labels.c.label_id.in_(
+                    select(Label.id).where(Label.name.in_(labels))
+                ),
+            )
+        )
+
+    for label_name in labels_all or ():
+        query = query.filter(
+            exists().where(
+                issue_labels.c.issue_id == Issue.id,
+                issue_labels.c.label_id
+                == select(Label.id).where(Label.name == label_name).scalar_subquery(),
+            )
+        )
+
+    return query
+
+
+def parse_labels(labels: Optional[str]) -> Optional[tuple]:
+    """Normalize a comma-separated list of label names like the label endpoints do."""
+    if not labels:
+        return None
+    names = {name.strip().lower() for name in labels.split(",") if name.strip()}
+    return tuple(sorted(names)) or None
+
+
+ISSUE_EXPANSIONS = ("labels", "assignee", "comment_count")
+
+# List items and expansions are read as column rows and serialized with orjson,
+# skipping ORM objects and Pydantic validation (see app/utils/serialization.py)
+ISSUE_FIELDS = column_names(ISSUE_COLUMNS)
+ISSUE_COLUMNS_BY_NAME = dict(zip(ISSUE_FIELDS, ISSUE_COLUMNS))
+LABEL_COLUMNS = schema_columns(Label, LabelResponse)
+LABEL_FIELDS = column_names(LABEL_COLUMNS)
+ASSIGNEE_COLUMNS = schema_columns(User, UserSummary)
+ASSIGNEE_FIELDS = column_names(ASSIGNEE_COLUMNS)
+TIMELINE_COLUMNS = schema_columns(IssueEvent, IssueEventResponse)
+TIMELINE_FIELDS = column_names(TIMELINE_COLUMNS)
+
+
+def parse_expand(expand: Optional[str]) -> set:
+    """Parse a comma-separated `expand` parameter into a set of expansions."""
+    if not expand:
+        return set()
+    requested = {name.strip() for name in expand.split(",") if name.strip()}
+    unknown = requested.difference(ISSUE_EXPANSIONS)
+    if unknown:
+        raise ValueError(
+            f"Unknown expand value(s): {', '.join(sorted(unknown))}. "
+            f"Allowed: {', '.join(ISSUE_EXPANSIONS)}"
+        )
+    return requested
+
+
+def parse_fields(fields: Optional[str]) -> tuple:
+    """Parse a comma-separated `fields` parameter, keeping the response order."""
+    if not fields:
+        return ISSUE_FIELDS
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = requested.difference(ISSUE_FIELDS)
+    if unknown:
+        raise ValueError(
+            f"Unknown field(s): {', '.join(sorted(unknown))}. "
+            f"Allowed: {', '.join(ISSUE_FIELDS)}"
+        )
+    return tuple(name for name in ISSUE_FIELDS if name in requested)
+
+
+def expand_issues(db, items: list, rows, expand: set):
+    """Add the requested expansions to the list items, one query for each."""
+    issue_ids = [row.id for row in rows]
+    if "labels" in expand:
+        issue_label_rows = (
+            db.query(issue_labels.c.issue_id, *LABEL_COLUMNS)
+            .join(Label, Label.id == issue_labels.c.label_id)
+            .filter(issue_labels.c.issue_id.in_(issue_ids))
+            .order_by(Label.id)
+            .all()
+        )
+        labels = defaultdict(list)
+        for issue_id, *label in issue_label_rows:
+            labels[issue_id].append(dict(zip(LABEL_FIELDS, label)))
+        for item, row in zip(items, rows):
+            item["labels"] = labels[row.id]
+
+    if "assignee" in expand:
+        assignee_ids = {row.assignee_id for row in rows} - {None}
+        assignees = {}
+        if assignee_ids:
+            user_rows = (
+                db.query(*ASSIGNEE_COLUMNS).filter(User.id.in_(assignee_ids)).all()
+            )
+            assignees = {
+                user["id"]: user for user in rows_to_dicts(ASSIGNEE_FIELDS, user_rows)
+            }
+        for item, row in zip(items, rows):
+            item["assignee"] = assignees.get(row.assignee_id)
+
+    if "comment_count" in expand:
+        # One grouped count for the whole page instead of one per issue
+        comment_counts = {}
+        if issue_ids:
+            comment_counts = dict(
+                db.query(Comment.issue_id, func.count(Comment.id))
+                .filter(Comment.issue_id.in_(issue_ids))
+                .group_by(Comment.issue_id)
+                .all()
+            )
+        for item, row in zip(items, rows):
+            item["comment_count"] = comment_counts.get(row.id, 0)
+
+
+# SQLSTATE of foreign key violations, reported as `pgcode` by psycopg2 and asyncpg
+FOREIGN_KEY_VIOLATION = "23503"
+
+
+def is_foreign_key_violation(error: IntegrityError) -> bool:
+    return getattr(error.orig, "pgcode", None) == FOREIGN_KEY_VIOLATION
+
+
+def seek_past(query, sort_column, sort_order: str, last_value, last_id: int):
+    """Keyset pagination: seek past the last row instead of skipping with OFFSET."""
+    if sort_order == "asc":
+        return query.filter(tuple_(sort_column, Issue.id) > tuple_(last_value, last_id))
+    return query.filter(tuple_(sort_column, Issue.id) < tuple_(last_value, last_id))
+
 
 @router.post("/", response_model=IssueResponse, status_code=status.HTTP_201_CREATED)
+@supports_async_db
 def create_issue(issue: IssueCreate, db: Session = Depends(get_db)):
     if issue.assignee_id:
         user = db.query(User).filter(User.id == issue.assignee_id).first()
@@ -44,103 +302,369 @@ def create_issue(issue: IssueCreate, db: Session = Depends(get_db)):
         assignee_id=issue.assignee_id,
     )
     db.add(db_issue)
-    db.commit()
-    db.refresh(db_issue)
+    db.flush()
+    record_issue_change(db, new=issue_state(db_issue))
     log_issue_event(
         db_session=db,
         issue_id=db_issue.id,
         event_type="issue created",
         new_value=db_issue.title,
     )
+    db.commit()
+    db.refresh(db_issue)
     return db_issue
 
 
 @router.patch(
     "/{issue_id}", response_model=IssueResponse, status_code=status.HTTP_200_OK
 )
+@supports_async_db
 def update_issue(issue_id: int, issue: IssueUpdate, db: Session = Depends(get_db)):
-
-    db_issue = db.query(Issue).filter(Issue.id == issue_id).first()
-
-    if not db_issue:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Issue not found",
+    # Compare-and-swap in one statement: the CTE locks the row only if it still
+    # has the expected version (re-checked after waiting for a concurrent
+    # writer), and hands the previous values to the timeline and reports
+    now = datetime.utcnow()
+    locked = (
+        select(
+            Issue.id,
+            Issue.status,
+            Issue.priority,
+            Issue.assignee_id,
+            Issue.resolved_at,
+        )
+        .where(Issue.id == issue_id, Issue.version == issue.version)
+        .with_for_update()
+        .cte("locked")
+    )
+    values = {"version": Issue.version + 1, "updated_at": now}
+    if issue.title is not None:
+        values["title"] = issue.title
+    if issue.description is not None:
+        values["description"] = issue.description
+    if issue.status is not None:
+        values["status"] = issue.status
+        # resolved_at only moves when the status actually changes
+        values["resolved_at"] = case(
+            (locked.c.status == issue.status, Issue.resolved_at),
+            else_=now if issue.status == "resolved" else None,
         )
+    if issue.priority is not None:
+        values["priority"] = issue.priority
+    if issue.assignee_id is not None:
+        # Validated by the foreign key instead of a separate SELECT
+        values["assignee_id"] = issue.assignee_id
 
-    if issue.version != db_issue.version:
+    try:
+        row = db.execute(
+            update(Issue)
+            .where(Issue.id == locked.c.id)
+            .values(values)
+            .returning(
+                *ISSUE_COLUMNS,
+                locked.c.status.label("old_status"),
+                locked.c.priority.label("old_priority"),
+                locked.c.assignee_id.label("old_assignee_id"),
+                locked.c.resolved_at.label("old_resolved_at"),
+            )
+            .execution_options(synchronize_session=False)
+        ).first()
+    except IntegrityError as e:
+        db.rollback()
+        if is_foreign_key_violation(e):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Assignee user not found",
+            )
+        raise
+
+    if row is None:
+        db.rollback()
+        if db.query(Issue.id).filter(Issue.id == issue_id).first() is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Issue not found",
+            )
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Version conflict: Issue has been modified by another process",
         )
 
-    if issue.title is not None:
-        db_issue.title = issue.title
-
-    if issue.description is not None:
-        db_issue.description = issue.description
-
-    if issue.status is not None and issue.status != db_issue.status:
-        old_status = db_issue.status
-        new_status = issue.status
-        db_issue.status = new_status
+    if row.status != row.old_status:
         log_issue_event(
             db_session=db,
-            issue_id=db_issue.id,
+            issue_id=issue_id,
             event_type="status updated",
-            old_value=old_status,
-            new_value=new_status,
+            old_value=row.old_status,
+            new_value=row.status,
         )
-        if issue.status == "resolved":
-            db_issue.resolved_at = datetime.utcnow()
-        elif issue.status != "resolved":
-            db_issue.resolved_at = None
-
-    if issue.priority is not None and issue.priority != db_issue.priority:
+    if row.priority != row.old_priority:
         log_issue_event(
             db_session=db,
-            issue_id=db_issue.id,
+            issue_id=issue_id,
             event_type="priority updated",
-            old_value=db_issue.priority,
-            new_value=issue.priority,
+            old_value=row.old_priority,
+            new_value=row.priority,
         )
-        db_issue.priority = issue.priority
-
-    if issue.assignee_id is not None and issue.assignee_id != db_issue.assignee_id:
-        user = db.query(User).filter(User.id == issue.assignee_id).first()
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Assignee user not found",
-            )
+    if row.assignee_id != row.old_assignee_id:
         log_issue_event(
             db_session=db,
-            issue_id=db_issue.id,
+            issue_id=issue_id,
             event_type="assignee updated",
-            old_value=str(db_issue.assignee_id),
-            new_value=str(issue.assignee_id),
+            old_value=str(row.old_assignee_id),
+            new_value=str(row.assignee_id),
         )
-        db_issue.assignee_id = issue.assignee_id
 
-    db_issue.version += 1
+    old_state = {
+        "created_at": row.created_at,
+        "resolved_at": row.old_resolved_at,
+        "priority": row.old_priority,
+        "assignee_id": row.old_assignee_id,
+    }
+    new_state = issue_state(row)
+    if new_state != old_state:
+        record_issue_change(db, old=old_state, new=new_state)
 
+    invalidate_issues(db, [issue_id])
     db.commit()
-    db.refresh(db_issue)
-    return db_issue
+    return {column.key: getattr(row, column.key) for column in ISSUE_COLUMNS}
+
+
+# Declared before /{issue_id} so that "search" is not taken for an issue id
+@router.get(
+    "/search", response_model=IssueSearchResponse, status_code=status.HTTP_200_OK
+)
+@supports_async_db
+def search_issues(
+    q: str = Query(..., min_length=1, max_length=200),
+    include_comments: bool = Query(False),
+    status: Optional[str] = Query(None),
+    priority: Optional[str] = Query(None),
+    assignee_id: Optional[int] = Query(None),
+    created_after: Optional[datetime] = Query(None),
+    created_before: Optional[datetime] = Query(None),
+    updated_after: Optional[datetime] = Query(None),
+    updated_before: Optional[datetime] = Query(None),
+    resolved: Optional[bool] = Query(None),
+    labels: Optional[str] = Query(None, description="Comma-separated, any of"),
+    labels_all: Optional[str] = Query(None, description="Comma-separated, all of"),
+    page: int = Query(1, ge=1),
+    page_size: int = Query(10, ge=1, le=100),
+    sort_by: Literal["rank", "created_at", "updated_at", "priority", "status"] = Query(
+        "rank"
+    ),
+    sort_order: Literal["asc", "desc"] = Query("desc"),
+    cursor: Optional[str] = Query(None),
+    total_mode: Literal["exact", "estimated", "none"] = Query("exact"),
+    db: Session = Depends(get_read_db),
+):
+    # Web search syntax: quoted phrases, OR and -excluded words
+    ts_query = func.websearch_to_tsquery(TEXT_SEARCH_CONFIG, q)
+    matches = Issue.search_vector.op("@@")(ts_query)
+    if include_comments:
+        # An OR of the two matches would scan every issue; a union of ids lets
+        # each side use its own GIN index
+        matches = Issue.id.in_(
+            select(Issue.id)
+            .where(matches)
+            # Not correlated with the outer query on issues
+            .correlate(None)
+            .union(
+                select(Comment.issue_id).where(
+                    Comment.search_vector.op("@@")(ts_query)
+                )
+            )
+        )
+
+    filters = {
+        "status": status,
+        "priority": priority,
+        "assignee_id": assignee_id,
+        "created_after": created_after,
+        "created_before": created_before,
+        "updated_after": updated_after,
+        "updated_before": updated_before,
+        "resolved": resolved,
+        "labels": parse_labels(labels),
+        "labels_all": parse_labels(labels_all),
+    }
+    query = apply_issue_filters(db.query(Issue).filter(matches), **filters)
+
+    total = count_total(
+        db,
+        query,
+        total_mode,
+        table_name="issues_search",
+        filters={**filters, "q": q, "include_comments": include_comments},
+    )
+
+    # Title matches weigh more than description matches (see Issue.search_vector).
+    # ts_rank returns real; as double precision it round-trips through the cursor
+    rank = cast(func.ts_rank(Issue.search_vector, ts_query), Float)
+    sort_column = rank if sort_by == "rank" else getattr(Issue, sort_by)
+    order = asc if sort_order == "asc" else desc
+    query = query.add_columns(rank.label("rank")).order_by(
+        order(sort_column), order(Issue.id)
+    )
+
+    if cursor:
+        try:
+            last_value, last_id = decode_cursor(cursor, sort_by, sort_order)
+        except InvalidCursorError as e:
+            # `status` is shadowed by the query parameter in this handler
+            raise HTTPException(
+                status_code=400,
+                detail=str(e),
+            )
+        query = seek_past(query, sort_column, sort_order, last_value, last_id)
+    else:
+        query = query.offset((page - 1) * page_size)
+
+    rows = query.limit(page_size + 1).all()
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        last_issue, last_rank = rows[-1]
+        last_value = last_rank if sort_by == "rank" else getattr(last_issue, sort_by)
+        next_cursor = encode_cursor(sort_by, sort_order, last_value, last_issue.id)
+
+    return IssueSearchResponse(
+        total=total,
+        total_mode=total_mode,
+        page=page,
+        page_size=page_size,
+        next_cursor=next_cursor,
+        issues=[
+            IssueSearchResult(
+                **IssueResponse.model_validate(issue).model_dump(), rank=issue_rank
+            )
+            for issue, issue_rank in rows
+        ],
+    )
+
+
+# Declared before /{issue_id} so that "changes" is not taken for an issue id
+@router.get(
+    "/changes",
+    status_code=status.HTTP_200_OK,
+    description=(
+        "Server-sent events of timeline events. `status` and `assignee_id` "
+        "match the issue's current state when an event is sent, not its state "
+        "when the event happened: events replayed after a reconnect are "
+        "matched against the state at that time, so they can differ from the "
+        "ones the live stream sent before."
+    ),
+)
+async def stream_issue_changes(
+    request: Request,
+    status: Optional[str] = Query(None, description="Issue's current status"),
+    assignee_id: Optional[int] = Query(
+        None, description="Issue's current assignee"
+    ),
+    last_event_id: Optional[str] = Query(None),
+):
+    # EventSource sends the id of the last event it received when reconnecting
+    last_event_id = last_event_id or request.headers.get("last-event-id")
+    position = None
+    if last_event_id:
+        try:
+            position = parse_event_id(last_event_id)
+        except InvalidEventIdError:
+            # `status` is shadowed by the query parameter in this handler
+            raise HTTPException(
+                status_code=400,
+                detail="Invalid Last-Event-ID",
+            )
+    return StreamingResponse(
+        stream_changes(position, status, assignee_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+# Declared before /{issue_id} so that "export" is not taken for an issue id.
+# No session dependency: the stream opens its own, see stream_issue_export.
+@router.get("/export", status_code=status.HTTP_200_OK)
+def export_issues(
+    request: Request,
+    export_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+    status: Optional[str] = Query(None),
+    priority: Optional[str] = Query(None),
+    assignee_id: Optional[int] = Query(None),
+    created_after: Optional[datetime] = Query(None),
+    created_before: Optional[datetime] = Query(None),
+    updated_after: Optional[datetime] = Query(None),
+    updated_before: Optional[datetime] = Query(None),
+    resolved: Optional[bool] = Query(None),
+    labels: Optional[str] = Query(None, description="Comma-separated, any of"),
+    labels_all: Optional[str] = Query(None, description="Comma-separated, all of"),
+):
+    statement = apply_issue_filters(
+        select(*ISSUE_COLUMNS),
+        status=status,
+        priority=priority,
+        assignee_id=assignee_id,
+        created_after=created_after,
+        created_before=created_before,
+        updated_after=updated_after,
+        updated_before=updated_before,
+        resolved=resolved,
+        labels=parse_labels(labels),
+        labels_all=parse_labels(labels_all),
+    ).order_by(Issue.id)
+    return StreamingResponse(
+        stream_issue_export(read_session_factory(request), statement, export_format),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="issues.{export_format}"'
+        },
+    )
 
 
 @router.get("/{issue_id}", response_model=IssueResponse, status_code=status.HTTP_200_OK)
-def get_issue_by_id(issue_id: int, db: Session = Depends(get_db)):
-    db_issue = db.query(Issue).filter(Issue.id == issue_id).first()
-    if not db_issue:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Issue not found",
+@supports_async_db
+def get_issue_by_id(issue_id: int, request: Request, db: Session = Depends(get_db)):
+    # Misses fill the cache shared by every client, so they read the primary: a
+    # lagging replica would cache the pre-write issue. Hits open no connection.
+    cache_key = (ISSUE, issue_id)
+    # Clients that just wrote read their own change from the primary
+    cached = None
+    if not is_pinned_to_primary(request):
+        cached = response_cache.get(cache_key)
+
+    if cached is None:
+        fill_token = response_cache.fill_token(cache_key)
+        db_issue = db.query(Issue).filter(Issue.id == issue_id).first()
+        if not db_issue:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Issue not found",
+            )
+        cached = response_cache.set(
+            cache_key,
+            CachedResponse(
+                etag=f'"{issue_id}-{db_issue.version}"',
+                body=IssueResponse.model_validate(db_issue).model_dump_json().encode(),
+            ),
+            fill_token,
         )
-    return db_issue
+    return cached_json_response(request, cached)
 
 
-@router.get("/", response_model=IssueListResponse, status_code=status.HTTP_200_OK)
+# The handler builds its JSON response itself; IssueListResponse only
+# documents it
+@router.get(
+    "/",
+    response_model=None,
+    responses={
+        200: {
+            "model": IssueListResponse,
+            "description": "Issues hold only the requested `fields`, if given, "
+            "and the requested `expand` values",
+        }
+    },
+    status_code=status.HTTP_200_OK,
+)
+@supports_async_db
 def get_issue(
     status: Optional[str] = Query(None),
     priority: Optional[str] = Query(None),
@@ -150,99 +674,235 @@ def get_issue(
     updated_after: Optional[datetime] = Query(None),
     updated_before: Optional[datetime] = Query(None),
     resolved: Optional[bool] = Query(None),
+    labels: Optional[str] = Query(None, description="Comma-separated, any of"),
+    labels_all: Optional[str] = Query(None, description="Comma-separated, all of"),
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=100),
     sort_by: Literal["created_at", "updated_at", "priority", "status"] = Query(
         "created_at"
     ),
     sort_order: Literal["asc", "desc"] = Query("desc"),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(None),
+    total_mode: Literal["exact", "estimated", "none"] = Query("exact"),
+    expand: Optional[str] = Query(None),
+    fields: Optional[str] = Query(
+        None, description="Comma-separated issue fields to return, e.g. id,title"
+    ),
+    db: Session = Depends(get_read_db),
 ):
-    query = db.query(Issue)
-
-    if status:
-        query = query.filter(Issue.status == status)
-
-    if priority:
-        query = query.filter(Issue.priority == priority)
-
-    if assignee_id:
-        query = query.filter(Issue.assignee_id == assignee_id)
-
-    if created_after:
-        query = query.filter(Issue.created_at >= created_after)
+    try:
+        expansions = parse_expand(expand)
+        selected = parse_fields(fields)
+    except ValueError as e:
+        # `status` is shadowed by the query parameter in this handler
+        raise HTTPException(
+            status_code=400,
+            detail=str(e),
+        )
 
-    if created_before:
-        query = query.filter(Issue.created_at <= created_before)
+    filters = {
+        "status": status,
+        "priority": priority,
+        "assignee_id": assignee_id,
+        "created_after": created_after,
+        "created_before": created_before,
+        "updated_after": updated_after,
+        "updated_before": updated_before,
+        "resolved": resolved,
+        "labels": parse_labels(labels),
+        "labels_all": parse_labels(labels_all),
+    }
+    # The selected fields first, then what the cursor and expansions need
+    names = dict.fromkeys((*selected, "id", sort_by, "assignee_id"))
+    query = apply_issue_filters(
+        db.query(*(ISSUE_COLUMNS_BY_NAME[name] for name in names)), **filters
+    )
 
-    if updated_after:
-        query = query.filter(Issue.updated_at >= updated_after)
+    total = count_total(
+        db,
+        query,
+        total_mode,
+        table_name=Issue.__tablename__,
+        filters=filters,
+    )
+    sort_column = getattr(Issue, sort_by)
+    order = asc if sort_order == "asc" else desc
+    # Issue.id breaks ties so that every row has a unique position for the cursor
+    query = query.order_by(order(sort_column), order(Issue.id))
 
-    if updated_before:
-        query = query.filter(Issue.updated_at <= updated_before)
+    if cursor:
+        try:
+            last_value, last_id = decode_cursor(cursor, sort_by, sort_order)
+        except InvalidCursorError as e:
+            # `status` is shadowed by the query parameter in this handler
+            raise HTTPException(
+                status_code=400,
+                detail=str(e),
+            )
+        query = seek_past(query, sort_column, sort_order, last_value, last_id)
+    else:
+        query = query.offset((page - 1) * page_size)
 
-    if resolved is not None:
-        if resolved:
-            query = query.filter(Issue.resolved_at.isnot(None))
-        else:
-            query = query.filter(Issue.resolved_at.is_(None))
+    # Fetch one extra row to know whether another page exists
+    rows = query.limit(page_size + 1).all()
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        last_row = rows[-1]
+        next_cursor = encode_cursor(
+            sort_by, sort_order, getattr(last_row, sort_by), last_row.id
+        )
 
-    total = query.count()
-    sort_column = getattr(Issue, sort_by)
-    query = query.order_by(
-        asc(sort_column) if sort_order == "asc" else desc(sort_column)
-    )
-    offset = (page - 1) * page_size
-    issues = query.offset(offset).limit(page_size).all()
-    db_issue = IssueListResponse(
-        total=total,
-        page=page,
-        page_size=page_size,
-        issues=issues,
+    items = rows_to_dicts(selected, rows)
+    expand_issues(db, items, rows, expansions)
+    return ORJSONResponse(
+        {
+            "total": total,
+            "total_mode": total_mode,
+            "page": page,
+            "page_size": page_size,
+            "next_cursor": next_cursor,
+            "issues": items,
+        }
     )
-    return db_issue
 
 
 @router.post("/bulk-status", status_code=status.HTTP_200_OK)
+@supports_async_db
 def bulk_update_status(
     bulk_status_update: BulkStatusUpdate,
     db: Session = Depends(get_db),
 ):
+    new_status = bulk_status_update.status
+    issue_ids = set(bulk_status_update.issue_ids)
+    # Bound as a single array parameter rather than one placeholder per id
+    ids_param = bindparam("issue_ids", list(issue_ids), type_=ARRAY(Integer))
     try:
-        issues = (
-            db.query(Issue)
-            .filter(Issue.id.in_(bulk_status_update.issue_ids))
-            .with_for_update()
-            .all()
-        )
+        now = datetime.utcnow()
+        values = {
+            "status": new_status,
+            "version": Issue.version + 1,
+            "updated_at": now,
+        }
+        if new_status == "resolved":
+            values["resolved_at"] = now
+        elif new_status == "open" or new_status == "in_progress":
+            values["resolved_at"] = None
 
-        if len(issues) != len(bulk_status_update.issue_ids):
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Some issues not found",
+        # Lock the rows and remember their previous status for the timeline.
+        # Missing issues and unresolved issues to close are left out, which
+        # the count of updated rows below reveals
+        locked = select(
+            Issue.id, Issue.status, Issue.created_at, Issue.resolved_at
+        ).where(Issue.id == any_(ids_param))
+        if new_status == "closed":
+            locked = locked.where(Issue.status == "resolved")
+        locked = locked.order_by(Issue.id).with_for_update().cte("locked")
+
+        updated = (
+            update(Issue)
+            .where(Issue.id == locked.c.id)
+            .values(**values)
+            .returning(
+                Issue.id,
+                Issue.priority,
+                Issue.assignee_id,
+                Issue.created_at,
+                Issue.resolved_at,
+                locked.c.status.label("old_status"),
+                locked.c.resolved_at.label("old_resolved_at"),
+            )
+            .cte("updated")
+        )
+        # Written here rather than through log_issue_event, whatever the
+        # TIMELINE_EVENT_MODE: one set-based INSERT in this statement costs less
+        # than handing every row to the buffer, and the events commit with the
+        # status change. invalidate_issues below covers the cached timelines,
+        # which the buffer writer would otherwise invalidate.
+        logged = (
+            insert(IssueEvent)
+            .from_select(
+                ["issue_id", "event_type", "old_value", "new_value", "created_at"],
+                select(
+                    updated.c.id,
+                    literal("status updated"),
+                    updated.c.old_status,
+                    literal(new_status),
+                    literal(now),
+                ).where(updated.c.old_status != new_status),
             )
+            .cte("logged")
+        )
+        # Net change to the report aggregates, grouped in the database so only
+        # one row per (priority, assignee, old day, new day) comes back
+        resolution_seconds = func.extract(
+            "epoch", updated.c.resolved_at - updated.c.created_at
+        )
+        old_resolution_seconds = func.extract(
+            "epoch", updated.c.old_resolved_at - updated.c.created_at
+        )
+        assignee_key = func.coalesce(updated.c.assignee_id, UNASSIGNED)
+        old_day = cast(updated.c.old_resolved_at, Date)
+        new_day = cast(updated.c.resolved_at, Date)
+        groups = db.execute(
+            select(
+                updated.c.priority,
+                assignee_key,
+                old_day,
+                new_day,
+                func.count(),
+                func.coalesce(func.sum(old_resolution_seconds), 0),
+                func.coalesce(func.sum(resolution_seconds), 0),
+            )
+            .group_by(updated.c.priority, assignee_key, old_day, new_day)
+            .add_cte(logged)
+        ).all()
+
+        total = 0
+        resolved_delta = 0
+        seconds_delta = 0.0
+        rollup_deltas = defaultdict(lambda: [0, 0])
+        for priority, assignee, old_date, new_date, count, old_sum, new_sum in groups:
+            total += count
+            if old_date is not None:
+                rollup_deltas[(old_date, priority, assignee)][1] -= count
+                resolved_delta -= count
+                seconds_delta -= float(old_sum)
+            if new_date is not None:
+                rollup_deltas[(new_date, priority, assignee)][1] += count
+                resolved_delta += count
+                seconds_delta += float(new_sum)
 
-        for issue in issues:
-            if bulk_status_update.status == "closed" and issue.status != "resolved":
+        if total != len(issue_ids):
+            # Rare, so the reason is only looked up once the update is undone
+            db.rollback()
+            found_count, first_unresolved_id = (
+                db.query(
+                    func.count(Issue.id),
+                    func.min(Issue.id).filter(Issue.status != "resolved"),
+                )
+                .filter(Issue.id == any_(ids_param))
+                .one()
+            )
+            if found_count != len(issue_ids):
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Some issues not found",
+                )
+            if new_status == "closed" and first_unresolved_id is not None:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Issue ID {issue.id} must be resolved before closing",
+                    detail=f"Issue ID {first_unresolved_id} must be resolved before closing",
                 )
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Issues were modified concurrently, transaction rolled back",
+            )
 
-            issue.status = bulk_status_update.status
-
-            if bulk_status_update.status == "resolved":
-                issue.resolved_at = datetime.utcnow()
-            elif (
-                bulk_status_update.status == "open"
-                or bulk_status_update.status == "in_progress"
-            ):
-                issue.resolved_at = None
-
-            issue.version += 1
-
+        adjust_resolution_stats(db, resolved_delta, seconds_delta)
+        adjust_rollups(db, rollup_deltas)
+        invalidate_issues(db, issue_ids)
         db.commit()
-        total = len(issues)
         return {
             "message": "Bulk status update successful",
             "updated_count": total,
@@ -261,104 +921,456 @@ def bulk_update_status(
         )
 
 
-@router.post(
-    "/import-csv", response_model=CSVImportContent, status_code=status.HTTP_201_CREATED
-)
-def import_issues_from_csv(
-    file: UploadFile = File(...),
+@router.post("/bulk-labels", status_code=status.HTTP_200_OK)
+@supports_async_db
+def bulk_update_labels(
+    bulk_label_update: BulkLabelUpdate,
     db: Session = Depends(get_db),
 ):
-    if not file.filename.endswith(".csv"):
+    issue_ids = set(bulk_label_update.issue_ids)
+    add_names = normalize_label_names(bulk_label_update.add)
+    remove_names = normalize_label_names(bulk_label_update.remove)
+    if not add_names and not remove_names:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid file extension. Please upload a CSV file.",
+            detail="No labels to add or remove",
         )
-
-    if file.content_type != "text/csv":
+    both = sorted(set(add_names) & set(remove_names))
+    if both:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid file type. Please upload a CSV file.",
+            detail=f"Labels cannot be both added and removed: {', '.join(both)}",
         )
 
-    content = file.file.read().decode("utf-8")
-    reader = csv.DictReader(io.StringIO(content))
+    ids_param = bindparam("issue_ids", list(issue_ids), type_=ARRAY(Integer))
+    try:
+        found_count = (
+            db.query(func.count(Issue.id)).filter(Issue.id == any_(ids_param)).scalar()
+        )
+        if found_count != len(issue_ids):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Some issues not found",
+            )
 
-    total_rows = 0
-    created_issues = 0
-    failed_rows = 0
-    errors = []
+        add_labels = resolve_labels(db, add_names)
+        remove_labels = resolve_labels(db, remove_names, create=False)
+        label_names = {label.id: label.name for label in add_labels + remove_labels}
 
-    allowed_priorities = {"low", "medium", "high", "critical"}
+        added = []
+        if add_labels:
+            # Every (issue, label) pair in one INSERT ... SELECT; pairs that
+            # already exist are skipped and not returned
+            issue_rows = select(func.unnest(ids_param).label("issue_id")).subquery()
+            label_rows = select(
+                func.unnest(
+                    bindparam(
+                        "label_ids",
+                        [label.id for label in add_labels],
+                        type_=ARRAY(Integer),
+                    )
+                ).label("label_id")
+            ).subquery()
+            added = db.execute(
+                insert(issue_labels)
+                .from_select(
+                    ["issue_id", "label_id"],
+                    select(issue_rows.c.issue_id, label_rows.c.label_id)
+                    .select_from(issue_rows.join(label_rows, true()))
+                    .order_by(issue_rows.c.issue_id, label_rows.c.label_id),
+                )
+                .on_conflict_do_nothing()
+                .returning(issue_labels.c.issue_id, issue_labels.c.label_id)
+            ).all()
 
-    for index, row in enumerate(reader, start=1):
-        total_rows += 1
-        try:
-            title = row.get("title")
-            if not title or not (5 <= len(title) <= 200):
-                raise ValueError("Title must be between 5 and 200 characters.")
+        removed = []
+        if remove_labels:
+            removed = db.execute(
+                delete(issue_labels)
+                .where(
+                    issue_labels.c.issue_id == any_(ids_param),
+                    issue_labels.c.label_id.in_([label.id for label in remove_labels]),
+                )
+                .returning(issue_labels.c.issue_id, issue_labels.c.label_id)
+            ).all()
+            record_label_removals(db, removed)
+
+        # One timeline event per issue and direction
+        changes = defaultdict(lambda: ([], []))
+        for issue_id, label_id in added:
+            changes[issue_id][0].append(label_names[label_id])
+        for issue_id, label_id in removed:
+            changes[issue_id][1].append(label_names[label_id])
+        for issue_id, (added_names, removed_names) in sorted(changes.items()):
+            if added_names:
+                log_issue_event(
+                    db_session=db,
+                    issue_id=issue_id,
+                    event_type="labels added",
+                    new_value=", ".join(sorted(added_names)),
+                )
+            if removed_names:
+                log_issue_event(
+                    db_session=db,
+                    issue_id=issue_id,
+                    event_type="labels removed",
+                    old_value=", ".join(sorted(removed_names)),
+                )
+
+        invalidate_issues(db, changes.keys())
+        db.commit()
+        return {
+            "message": "Bulk label update successful",
+            "added_count": len(added),
+            "removed_count": len(removed),
+            "issue_ids": bulk_label_update.issue_ids,
+        }
+
+    except HTTPException:
+        db.rollback()
+        raise
+
+    except SQLAlchemyError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Bulk label update failed, transaction rolled back",
+        )
 
-            description = row.get("description", "")
 
-            priority = row.get("priority")
-            if priority not in allowed_priorities:
-                raise ValueError(
-                    f"Invalid priority '{priority}'. Must be one of {allowed_priorities}."
+@router.post(
+    "/batch", response_model=BatchIssueResponse, status_code=status.HTTP_200_OK
+)
+@supports_async_db
+def batch_issues(batch: BatchIssueRequest, db: Session = Depends(get_db)):
+    operations = batch.operations
+    update_ids = sorted({op.issue_id for op in operations if op.op == "update"})
+    assignee_ids = sorted(
+        {op.assignee_id for op in operations if op.assignee_id is not None}
+    )
+    try:
+        # Lock every issue to update in one query, in id order so that
+        # concurrent batches cannot deadlock
+        original = {}
+        if update_ids:
+            original = {
+                row.id: row
+                for row in db.execute(
+                    select(*ISSUE_COLUMNS)
+                    .where(
+                        Issue.id
+                        == any_(bindparam("issue_ids", update_ids, type_=ARRAY(Integer)))
+                    )
+                    .order_by(Issue.id)
+                    .with_for_update()
                 )
+            }
+        known_assignees = set()
+        if assignee_ids:
+            known_assignees = set(
+                db.execute(select(User.id).where(User.id.in_(assignee_ids))).scalars()
+            )
 
-            assignee_id = row.get("assignee_id")
-            if assignee_id:
-                assignee = db.query(User).filter(User.id == int(assignee_id)).first()
-                if not assignee:
-                    raise ValueError(f"Assignee with ID {assignee_id} does not exist.")
-
-            db_issue = Issue(
-                title=title,
-                description=description,
-                priority=priority,
-                assignee_id=int(assignee_id) if assignee_id else None,
-                status="open",
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow(),
+        # Operations are applied in order to the locked rows held in memory, so
+        # later operations on the same issue see (and version-check) earlier ones
+        now = datetime.utcnow()
+        current = {issue_id: row._asdict() for issue_id, row in original.items()}
+        results = [None] * len(operations)
+        new_issues = []
+        for index, op in enumerate(operations):
+            invalid = None
+            if op.priority is not None and op.priority not in ISSUE_PRIORITIES:
+                invalid = f"Invalid priority: {op.priority}"
+            elif op.op == "update" and op.status is not None and (
+                op.status not in ISSUE_STATUSES
+            ):
+                invalid = f"Invalid status: {op.status}"
+            if invalid:
+                results[index] = BatchIssueResult(
+                    index=index,
+                    status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                    result="invalid",
+                    detail=invalid,
+                )
+                continue
+            if op.assignee_id is not None and op.assignee_id not in known_assignees:
+                results[index] = BatchIssueResult(
+                    index=index,
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    result="not_found",
+                    detail="Assignee user not found",
+                )
+                continue
+
+            if op.op == "create":
+                new_issues.append(
+                    (
+                        index,
+                        {
+                            "title": op.title,
+                            "description": op.description,
+                            "status": "open",
+                            "priority": op.priority or "low",
+                            "assignee_id": op.assignee_id,
+                            "version": 1,
+                            "created_at": now,
+                            "updated_at": now,
+                            "resolved_at": None,
+                        },
+                    )
+                )
+                continue
+
+            db_issue = current.get(op.issue_id)
+            if db_issue is None:
+                results[index] = BatchIssueResult(
+                    index=index,
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    result="not_found",
+                    detail="Issue not found",
+                )
+                continue
+            if op.version != db_issue["version"]:
+                results[index] = BatchIssueResult(
+                    index=index,
+                    status_code=status.HTTP_409_CONFLICT,
+                    result="conflict",
+                    detail="Version conflict: Issue has been modified by another process",
+                )
+                continue
+
+            # Same changes and timeline events as PATCH /issues/{issue_id}
+            if op.title is not None:
+                db_issue["title"] = op.title
+            if op.description is not None:
+                db_issue["description"] = op.description
+            if op.status is not None and op.status != db_issue["status"]:
+                log_issue_event(
+                    db_session=db,
+                    issue_id=op.issue_id,
+                    event_type="status updated",
+                    old_value=db_issue["status"],
+                    new_value=op.status,
+                )
+                db_issue["status"] = op.status
+                db_issue["resolved_at"] = now if op.status == "resolved" else None
+            if op.priority is not None and op.priority != db_issue["priority"]:
+                log_issue_event(
+                    db_session=db,
+                    issue_id=op.issue_id,
+                    event_type="priority updated",
+                    old_value=db_issue["priority"],
+                    new_value=op.priority,
+                )
+                db_issue["priority"] = op.priority
+            if op.assignee_id is not None and op.assignee_id != db_issue["assignee_id"]:
+                log_issue_event(
+                    db_session=db,
+                    issue_id=op.issue_id,
+                    event_type="assignee updated",
+                    old_value=str(db_issue["assignee_id"]),
+                    new_value=str(op.assignee_id),
+                )
+                db_issue["assignee_id"] = op.assignee_id
+            db_issue["version"] += 1
+            db_issue["updated_at"] = now
+            results[index] = BatchIssueResult(
+                index=index,
+                status_code=status.HTTP_200_OK,
+                result="updated",
+                issue=IssueResponse(**db_issue),
             )
-            db.add(db_issue)
-            db.commit()
-            created_issues += 1
 
-        except ValueError as e:
-            db.rollback()
-            failed_rows += 1
-            errors.append(
-                {
-                    "row": index,
-                    "error": str(e),
-                }
+        report_changes = []
+        if new_issues:
+            # One multi-row INSERT; RETURNING rows come back in parameter order
+            created = db.execute(
+                insert(Issue).returning(*ISSUE_COLUMNS, sort_by_parameter_order=True),
+                [values for _, values in new_issues],
+            ).all()
+            for (index, _), row in zip(new_issues, created):
+                log_issue_event(
+                    db_session=db,
+                    issue_id=row.id,
+                    event_type="issue created",
+                    new_value=row.title,
+                )
+                results[index] = BatchIssueResult(
+                    index=index,
+                    status_code=status.HTTP_201_CREATED,
+                    result="created",
+                    issue=IssueResponse(**row._asdict()),
+                )
+                report_changes.append((None, issue_state(row)))
+
+        updated_ids = [
+            issue_id
+            for issue_id in update_ids
+            if issue_id in current
+            and current[issue_id]["version"] != original[issue_id].version
+        ]
+        if updated_ids:
+            # Final state of every updated issue in one UPDATE ... FROM unnest()
+            columns = [
+                column.key
+                for column in ISSUE_COLUMNS
+                if column.key not in ("id", "created_at")
+            ]
+            changes = select(
+                func.unnest(
+                    bindparam("updated_ids", updated_ids, type_=ARRAY(Integer))
+                ).label("id"),
+                *(
+                    func.unnest(
+                        bindparam(
+                            f"new_{column}",
+                            [current[issue_id][column] for issue_id in updated_ids],
+                            type_=ARRAY(Issue.__table__.c[column].type),
+                        )
+                    ).label(column)
+                    for column in columns
+                ),
+            ).subquery("changes")
+            db.execute(
+                update(Issue)
+                .where(Issue.id == changes.c.id)
+                .values({column: changes.c[column] for column in columns})
+                .execution_options(synchronize_session=False)
             )
+            report_changes.extend(
+                (issue_state(original[issue_id]), current[issue_id])
+                for issue_id in updated_ids
+            )
+            invalidate_issues(db, updated_ids)
+
+        if report_changes:
+            record_issue_changes(db, report_changes)
+        db.commit()
 
-    return CSVImportContent(
-        total_rows=total_rows,
-        created_issues=created_issues,
-        failed_rows=failed_rows,
-        errors=errors,
+    except SQLAlchemyError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Batch failed, transaction rolled back",
+        )
+
+    created_count = sum(result.result == "created" for result in results)
+    updated_count = sum(result.result == "updated" for result in results)
+    return BatchIssueResponse(
+        created_count=created_count,
+        updated_count=updated_count,
+        failed_count=len(results) - created_count - updated_count,
+        results=results,
     )
 
 
+@router.post(
+    "/import-csv", response_model=CSVImportContent, status_code=status.HTTP_201_CREATED
+)
+def import_issues_from_csv(
+    file: UploadFile = File(...),
+    db: Session = Depends(get_db),
+):
+    validate_csv_upload(file)
+
+    # Decode the upload incrementally instead of reading it into memory
+    text_stream = io.TextIOWrapper(file.file, encoding="utf-8", newline="")
+    try:
+        return import_issues_csv(db, text_stream)
+    finally:
+        text_stream.detach()
+
+
 @router.get(
     "/{issue_id}/timeline",
     response_model=List[IssueEventResponse],
     status_code=status.HTTP_200_OK,
 )
-def get_issue_timeline(issue_id: int, db: Session = Depends(get_db)):
-    issue = db.query(Issue).filter(Issue.id == issue_id).first()
+@supports_async_db
+def get_issue_timeline(
+    issue_id: int,
+    request: Request,
+    event_type: Optional[str] = Query(
+        None, description="Comma-separated event types, e.g. status updated"
+    ),
+    created_after: Optional[datetime] = Query(None),
+    created_before: Optional[datetime] = Query(None),
+    page_size: int = Query(TIMELINE_PAGE_SIZE, ge=1, le=1000),
+    cursor: Optional[str] = Query(None),
+    db: Session = Depends(get_read_db),
+    primary_db: Session = Depends(get_db),
+):
+    # Oldest events first, one page at a time; the next page's cursor is sent
+    # in the X-Next-Cursor header. Only the unfiltered first page is cached,
+    # and like get_issue_by_id it is filled from the primary, never a replica;
+    # every other page is read from a replica. The unused session opens no
+    # connection.
+    cacheable = (
+        event_type is None
+        and created_after is None
+        and created_before is None
+        and page_size == TIMELINE_PAGE_SIZE
+        and cursor is None
+    )
+    if cacheable:
+        db = primary_db
+    cache_key = (TIMELINE, issue_id)
+    cached = None
+    if cacheable and not is_pinned_to_primary(request):
+        cached = response_cache.get(cache_key)
+    if cached is not None:
+        return cached_json_response(request, cached)
+
+    fill_token = response_cache.fill_token(cache_key)
+    issue = db.query(Issue.version).filter(Issue.id == issue_id).first()
     if not issue:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Issue not found",
         )
 
+    query = db.query(*TIMELINE_COLUMNS).filter(IssueEvent.issue_id == issue_id)
+    if event_type:
+        event_types = [name.strip() for name in event_type.split(",") if name.strip()]
+        query = query.filter(IssueEvent.event_type.in_(event_types))
+    # Time bounds also prune the monthly partitions that are scanned
+    if created_after:
+        query = query.filter(IssueEvent.created_at >= created_after)
+    if created_before:
+        query = query.filter(IssueEvent.created_at <= created_before)
+    if cursor:
+        try:
+            last_created_at, last_id = decode_cursor(cursor, "created_at", "asc")
+        except InvalidCursorError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e),
+            )
+        query = query.filter(
+            tuple_(IssueEvent.created_at, IssueEvent.id)
+            > tuple_(last_created_at, last_id)
+        )
+
     events = (
-        db.query(IssueEvent)
-        .filter(IssueEvent.issue_id == issue_id)
-        .order_by(asc(IssueEvent.created_at))
+        query.order_by(asc(IssueEvent.created_at), asc(IssueEvent.id))
+        .limit(page_size + 1)
         .all()
     )
-    return events
+    next_cursor = None
+    if len(events) > page_size:
+        events = events[:page_size]
+        next_cursor = encode_cursor(
+            "created_at", "asc", events[-1].created_at, events[-1].id
+        )
+
+    # Label and comment events do not bump the version, so the ETag also
+    # covers the newest event of the page
+    last_event_id = max((event.id for event in events), default=0)
+    response = CachedResponse(
+        etag=f'"{issue_id}-{issue.version}-{last_event_id}"',
+        body=dump_json(rows_to_dicts(TIMELINE_FIELDS, events)),
+        next_cursor=next_cursor,
+    )
+    if cacheable:
+        response = response_cache.set(cache_key, response, fill_token)
+    return cached_json_response(request, response)
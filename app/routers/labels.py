@@ -1,10 +1,17 @@
 from fastapi import APIRouter, HTTPException, Depends, status
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 from app.database import get_db
+from app.utils.async_db import supports_async_db
 from app.models.issue import Issue
+from app.models.issue_label import issue_labels
 from app.models.label import Label
 from app.schemas.label import IssueLabelUpdate, LabelListResponse
 from app.utils.timeline import log_issue_event
+from app.utils.cache_invalidation import invalidate_issues
+from app.utils.labels import normalize_label_names, resolve_labels
+from app.utils.sync import record_label_removals
 
 router = APIRouter(
     prefix="/issues/{issue_id}/labels",
@@ -13,12 +20,13 @@ router = APIRouter(
 
 
 @router.put("/", response_model=LabelListResponse, status_code=status.HTTP_200_OK)
+@supports_async_db
 def replace_issue_labels(
     issue_id: int,
     label_update: IssueLabelUpdate,
     db: Session = Depends(get_db),
 ):
-    issue = db.query(Issue).filter(Issue.id == issue_id).first()
+    issue = db.query(Issue.id).filter(Issue.id == issue_id).first()
     if not issue:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -26,17 +34,41 @@ def replace_issue_labels(
         )
 
     try:
-        old_labels_str = ", ".join([label.name for label in issue.labels])
-        new_labels = []
-        for label_name in label_update.labels:
-            normalized_name = label_name.strip().lower()
-            label = db.query(Label).filter(Label.name == normalized_name).first()
-            if not label:
-                label = Label(name=normalized_name)
-                db.add(label)
-                db.flush()
-            new_labels.append(label)
-        issue.labels = new_labels
+        old_labels = db.execute(
+            select(Label.id, Label.name)
+            .join(issue_labels, issue_labels.c.label_id == Label.id)
+            .where(issue_labels.c.issue_id == issue_id)
+        ).all()
+        new_labels = resolve_labels(db, normalize_label_names(label_update.labels))
+
+        # Only write the association rows that actually change
+        old_ids = {label.id for label in old_labels}
+        new_ids = {label.id for label in new_labels}
+        removed_ids = old_ids - new_ids
+        added_ids = new_ids - old_ids
+        if removed_ids:
+            db.execute(
+                delete(issue_labels).where(
+                    issue_labels.c.issue_id == issue_id,
+                    issue_labels.c.label_id.in_(removed_ids),
+                )
+            )
+            record_label_removals(
+                db, [(issue_id, label_id) for label_id in sorted(removed_ids)]
+            )
+        if added_ids:
+            db.execute(
+                insert(issue_labels)
+                .values(
+                    [
+                        {"issue_id": issue_id, "label_id": label_id}
+                        for label_id in sorted(added_ids)
+                    ]
+                )
+                .on_conflict_do_nothing()
+            )
+
+        old_labels_str = ", ".join(label.name for label in old_labels)
         new_labels_str = ", ".join(label.name for label in new_labels)
         log_issue_event(
             db_session=db,
@@ -45,9 +77,9 @@ def replace_issue_labels(
             old_value=old_labels_str,
             new_value=new_labels_str,
         )
+        invalidate_issues(db, [issue_id])
         db.commit()
-        db.refresh(issue)
-        return LabelListResponse(total=len(issue.labels), labels=issue.labels)
+        return LabelListResponse(total=len(new_labels), labels=new_labels)
     except Exception:
         db.rollback()
         raise HTTPException(
@@ -0,0 +1,43 @@
+from fastapi import APIRouter
+from app.database import (
+    async_engine,
+    async_replica_engines,
+    engine,
+    replica_engines,
+)
+from app.utils.change_feed import change_feed
+from app.utils.db_pool import pool_status
+from app.utils.response_cache import response_cache
+from app.utils.timeline import event_buffer
+
+router = APIRouter(
+    prefix="/metrics",
+    tags=["metrics"],
+)
+
+
+@router.get("/db-pool")
+def get_db_pool_metrics():
+    pools = {"primary": pool_status(engine)}
+    if async_engine is not None:
+        pools["primary_async"] = pool_status(async_engine.sync_engine)
+    for index, replica_engine in enumerate(replica_engines):
+        pools[f"replica_{index}"] = pool_status(replica_engine)
+    for index, replica_engine in enumerate(async_replica_engines):
+        pools[f"replica_{index}_async"] = pool_status(replica_engine.sync_engine)
+    return pools
+
+
+@router.get("/response-cache")
+def get_response_cache_metrics():
+    return response_cache.stats()
+
+
+@router.get("/timeline-events")
+def get_timeline_event_metrics():
+    return event_buffer.stats()
+
+
+@router.get("/change-feed")
+def get_change_feed_metrics():
+    return {"subscribers": change_feed.subscriber_count()}
@@ -1,11 +1,28 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 from sqlalchemy import func
-from app.database import get_db
+from app.database import get_read_db
+from app.utils.async_db import supports_async_db
 from app.models.issue import Issue
+from app.models.report_stats import AssigneeIssueCount, ResolutionStats
 from app.models.user import User
-from app.schemas.report import TopAssigneesReport, AverageLatencyReport
-from typing import List
+from app.schemas.report import (
+    TopAssigneesReport,
+    AverageLatencyReport,
+    ThroughputReport,
+    BacklogReport,
+    ResolutionLatencyReport,
+)
+from app.utils.reporting import (
+    bucket_of,
+    bucket_series,
+    daily_activity,
+    in_day_range,
+    issue_filters,
+    report_range,
+)
+from datetime import date
+from typing import List, Literal, Optional
 
 router = APIRouter(
     prefix="/reports",
@@ -17,19 +34,21 @@ router = APIRouter(
     "/top-assignees",
     response_model=List[TopAssigneesReport],
 )
+@supports_async_db
 def get_top_assignees(
     limit: int = 100,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
+    # Counts are maintained incrementally by every issue write path
     results = (
         db.query(
             User.id.label("assignee_id"),
             User.username.label("assignee_name"),
-            func.count(Issue.id).label("issue_count"),
+            AssigneeIssueCount.issue_count.label("issue_count"),
         )
-        .join(Issue, Issue.assignee_id == User.id)
-        .group_by(User.id, User.username)
-        .order_by(func.count(Issue.id).desc())
+        .join(User, User.id == AssigneeIssueCount.assignee_id)
+        .filter(AssigneeIssueCount.issue_count > 0)
+        .order_by(AssigneeIssueCount.issue_count.desc())
         .limit(limit)
         .all()
     )
@@ -40,17 +59,162 @@ def get_top_assignees(
     "/average-latency",
     response_model=AverageLatencyReport,
 )
+@supports_async_db
 def get_average_latency(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
-    avg_seconds = (
-        db.query(func.avg(func.extract("epoch", Issue.resolved_at - Issue.created_at)))
-        .filter(Issue.resolved_at.isnot(None))
-        .scalar()
-    )
+    resolved_count, total_seconds = db.query(
+        func.sum(ResolutionStats.resolved_count),
+        func.sum(ResolutionStats.total_resolution_seconds),
+    ).one()
 
-    if avg_seconds is None:
+    if not resolved_count:
         return AverageLatencyReport(average_latency_hours=0)
 
+    avg_seconds = total_seconds / int(resolved_count)
     avg_hours = round(avg_seconds / 3600, 2)
     return AverageLatencyReport(average_latency_hours=avg_hours or 0)
+
+
+@router.get(
+    "/throughput",
+    response_model=List[ThroughputReport],
+)
+@supports_async_db
+def get_throughput(
+    interval: Literal["day", "week"] = Query("day"),
+    start: Optional[date] = Query(None),
+    end: Optional[date] = Query(None),
+    priority: Optional[str] = Query(None),
+    assignee_id: Optional[int] = Query(None),
+    label: Optional[str] = Query(None),
+    db: Session = Depends(get_read_db),
+):
+    start, end = report_range(start, end)
+    activity = daily_activity(start, end, priority, assignee_id, label)
+    bucket = bucket_of(activity.c.day, interval)
+    totals = (
+        db.query(
+            bucket.label("bucket"),
+            func.sum(activity.c.created).label("created_count"),
+            func.sum(activity.c.resolved).label("resolved_count"),
+        )
+        .group_by(bucket)
+        .subquery("totals")
+    )
+    buckets = bucket_series(interval, start, end)
+
+    results = (
+        db.query(
+            buckets.c.bucket,
+            func.coalesce(totals.c.created_count, 0).label("created_count"),
+            func.coalesce(totals.c.resolved_count, 0).label("resolved_count"),
+        )
+        .outerjoin(totals, totals.c.bucket == buckets.c.bucket)
+        .order_by(buckets.c.bucket)
+        .all()
+    )
+    return results
+
+
+@router.get(
+    "/backlog",
+    response_model=List[BacklogReport],
+)
+@supports_async_db
+def get_backlog(
+    interval: Literal["day", "week"] = Query("day"),
+    start: Optional[date] = Query(None),
+    end: Optional[date] = Query(None),
+    priority: Optional[str] = Query(None),
+    assignee_id: Optional[int] = Query(None),
+    label: Optional[str] = Query(None),
+    db: Session = Depends(get_read_db),
+):
+    start, end = report_range(start, end)
+    activity = daily_activity(None, end, priority, assignee_id, label)
+    # Everything before the range folds into the first bucket as its baseline
+    bucket = bucket_of(func.greatest(activity.c.day, start), interval)
+    net = (
+        db.query(
+            bucket.label("bucket"),
+            func.sum(activity.c.created - activity.c.resolved).label("opened"),
+        )
+        .group_by(bucket)
+        .subquery("net")
+    )
+    buckets = bucket_series(interval, start, end)
+
+    # Unresolved issues at the end of each bucket
+    results = (
+        db.query(
+            buckets.c.bucket,
+            func.sum(func.coalesce(net.c.opened, 0))
+            .over(order_by=buckets.c.bucket)
+            .label("open_count"),
+        )
+        .outerjoin(net, net.c.bucket == buckets.c.bucket)
+        .order_by(buckets.c.bucket)
+        .all()
+    )
+    return results
+
+
+@router.get(
+    "/resolution-latency",
+    response_model=List[ResolutionLatencyReport],
+)
+@supports_async_db
+def get_resolution_latency(
+    interval: Literal["day", "week"] = Query("day"),
+    start: Optional[date] = Query(None),
+    end: Optional[date] = Query(None),
+    priority: Optional[str] = Query(None),
+    assignee_id: Optional[int] = Query(None),
+    label: Optional[str] = Query(None),
+    db: Session = Depends(get_read_db),
+):
+    start, end = report_range(start, end)
+    bucket = bucket_of(Issue.resolved_at, interval)
+    resolution_hours = (
+        func.extract("epoch", Issue.resolved_at - Issue.created_at) / 3600
+    )
+    latency = (
+        db.query(
+            bucket.label("bucket"),
+            func.count(Issue.id).label("resolved_count"),
+            func.percentile_cont(0.5).within_group(resolution_hours).label("p50"),
+            func.percentile_cont(0.9).within_group(resolution_hours).label("p90"),
+            func.percentile_cont(0.99).within_group(resolution_hours).label("p99"),
+        )
+        .filter(
+            *in_day_range(Issue.resolved_at, start, end),
+            *issue_filters(priority, assignee_id, label),
+        )
+        .group_by(bucket)
+        .subquery("latency")
+    )
+    buckets = bucket_series(interval, start, end)
+
+    results = (
+        db.query(
+            buckets.c.bucket,
+            func.coalesce(latency.c.resolved_count, 0).label("resolved_count"),
+            latency.c.p50,
+            latency.c.p90,
+            latency.c.p99,
+        )
+        .outerjoin(latency, latency.c.bucket == buckets.c.bucket)
+        .order_by(buckets.c.bucket)
+        .all()
+    )
+    return [
+        ResolutionLatencyReport(
+            bucket=row.bucket,
+            resolved_count=row.resolved_count,
+            p50_hours=round(row.p50, 2) if row.p50 is not None else None,
+            p90_hours=round(row.p90, 2) if row.p90 is not None else None,
+            p99_hours=round(row.p99, 2) if row.p99 is not None else None,
+        )
+        for row in results
+    ]
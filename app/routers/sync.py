@@ -0,0 +1,114 @@
+from fastapi import APIRouter, HTTPException, Depends, status, Query
+from sqlalchemy import exists, select
+from sqlalchemy.orm import Session
+from typing import Optional
+from app.database import get_db
+from app.utils.async_db import supports_async_db
+from app.models.comment import Comment
+from app.models.issue import ISSUE_COLUMNS, Issue
+from app.models.issue_label import issue_labels
+from app.models.label import Label
+from app.models.sync import DeletedRecord
+from app.schemas.sync import SyncResponse
+from app.utils.sync import (
+    ExpiredSyncTokenError,
+    InvalidSyncTokenError,
+    SyncToken,
+    fetch_sync_page,
+    next_sync_token,
+    open_sync_window,
+)
+
+router = APIRouter(
+    prefix="/sync",
+    tags=["sync"],
+)
+
+
+@router.get("/", response_model=SyncResponse)
+@supports_async_db
+def sync(
+    since: Optional[str] = Query(
+        None, description="Token of the previous response; omit for a full sync"
+    ),
+    # Not a replica: windows are bounded by the commit horizon of the node
+    # that opened them, and a page read on a node that is behind it would skip
+    # the rows it has not replayed yet for good
+    db: Session = Depends(get_db),
+):
+    try:
+        token = SyncToken.decode(since) if since else None
+    except ExpiredSyncTokenError:
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail="Sync token expired, sync again without a token",
+        )
+    except InvalidSyncTokenError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if token is None or token.high is None:
+        token = open_sync_window(db, token)
+
+    issues = fetch_sync_page(
+        db,
+        token,
+        "issues",
+        select(*ISSUE_COLUMNS, Issue.sync_xid),
+        (Issue.sync_xid, Issue.id),
+    )
+    comments = fetch_sync_page(
+        db,
+        token,
+        "comments",
+        select(
+            Comment.id,
+            Comment.content,
+            Comment.issue_id,
+            Comment.author_id,
+            Comment.created_at,
+            Comment.sync_xid,
+        ),
+        (Comment.sync_xid, Comment.id),
+    )
+    label_assignments = fetch_sync_page(
+        db,
+        token,
+        "label_assignments",
+        select(issue_labels),
+        (issue_labels.c.sync_xid, issue_labels.c.issue_id, issue_labels.c.label_id),
+    )
+    # A removed label that is back on the issue needs no tombstone
+    tombstones = fetch_sync_page(
+        db,
+        token,
+        "tombstones",
+        select(
+            DeletedRecord.id,
+            DeletedRecord.record_type,
+            DeletedRecord.issue_id,
+            DeletedRecord.record_id,
+            DeletedRecord.deleted_at,
+            DeletedRecord.sync_xid,
+        ).where(
+            ~exists().where(
+                issue_labels.c.issue_id == DeletedRecord.issue_id,
+                issue_labels.c.label_id == DeletedRecord.record_id,
+            )
+        ),
+        (DeletedRecord.sync_xid, DeletedRecord.id),
+    )
+
+    label_ids = {row.label_id for row in label_assignments}
+    labels = (
+        db.query(Label).filter(Label.id.in_(label_ids)).order_by(Label.id).all()
+        if label_ids
+        else []
+    )
+    return {
+        "issues": issues,
+        "comments": comments,
+        "labels": labels,
+        "label_assignments": label_assignments,
+        "tombstones": tombstones,
+        "token": next_sync_token(token),
+        "has_more": bool(token.positions),
+    }
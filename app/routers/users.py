@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from app.database import get_db
+from app.utils.async_db import supports_async_db
 from app.models.user import User
 from app.schemas.user import UserCreate, UserResponse
 from app.utils.security import hash_password
@@ -12,6 +13,7 @@ router = APIRouter(
 
 
 @router.post("/", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
+@supports_async_db
 def create_user(user: UserCreate, db: Session = Depends(get_db)):
     # Check if username or email already exists
     existing_user = (
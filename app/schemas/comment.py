@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Optional, Literal
 from datetime import datetime
 
 
@@ -20,7 +20,8 @@ class CommentResponse(BaseModel):
 
 
 class CommentListResponse(BaseModel):
-    total: int
+    total: Optional[int] = None
+    total_mode: Literal["exact", "estimated", "none"] = "exact"
     page: int
     page_size: int
     comments: list[CommentResponse]
@@ -0,0 +1,17 @@
+from pydantic import BaseModel
+from typing import Optional, Literal, List
+from datetime import datetime
+
+
+class ImportJobResponse(BaseModel):
+    job_id: str
+    status: Literal["queued", "running", "completed", "failed", "cancelled"]
+    filename: Optional[str] = None
+    rows_processed: int
+    created_issues: int
+    failed_rows: int
+    errors: List[dict]
+    detail: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
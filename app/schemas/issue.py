@@ -1,6 +1,8 @@
 from pydantic import BaseModel, Field
-from typing import Optional, Literal, List
+from typing import Annotated, Optional, Literal, List, Union
 from datetime import datetime
+from app.schemas.label import LabelResponse
+from app.schemas.user import UserSummary
 
 
 class IssueCreate(BaseModel):
@@ -35,6 +37,35 @@ class IssueResponse(BaseModel):
         from_attributes = True
 
 
+class ExpandedIssueResponse(IssueResponse):
+    """Issue with the related data requested through `expand`.
+
+    Fields that were not requested are left unset and omitted from responses.
+    """
+
+    labels: Optional[List[LabelResponse]] = None
+    assignee: Optional[UserSummary] = None
+    comment_count: Optional[int] = None
+
+
+class PartialIssueResponse(BaseModel):
+    """Issue listed with `fields`: only the requested fields are present."""
+
+    id: Optional[int] = None
+    title: Optional[str] = None
+    description: Optional[str] = None
+    status: Optional[str] = None
+    priority: Optional[str] = None
+    assignee_id: Optional[int] = None
+    version: Optional[int] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    resolved_at: Optional[datetime] = None
+    labels: Optional[List[LabelResponse]] = None
+    assignee: Optional[UserSummary] = None
+    comment_count: Optional[int] = None
+
+
 class IssueFilter(BaseModel):
     status: Optional[str] = None
     priority: Optional[str] = None
@@ -51,10 +82,29 @@ class IssueFilter(BaseModel):
 
 
 class IssueListResponse(BaseModel):
-    total: int
+    total: Optional[int] = None
+    total_mode: Literal["exact", "estimated", "none"] = "exact"
+    page: int
+    page_size: int
+    next_cursor: Optional[str] = None
+    # Partial issues when the list is requested with `fields`
+    issues: list[Union[ExpandedIssueResponse, PartialIssueResponse]]
+
+    class Config:
+        from_attributes = True
+
+
+class IssueSearchResult(IssueResponse):
+    rank: float
+
+
+class IssueSearchResponse(BaseModel):
+    total: Optional[int] = None
+    total_mode: Literal["exact", "estimated", "none"] = "exact"
     page: int
     page_size: int
-    issues: list[IssueResponse]
+    next_cursor: Optional[str] = None
+    issues: list[IssueSearchResult]
 
     class Config:
         from_attributes = True
@@ -65,6 +115,42 @@ class BulkStatusUpdate(BaseModel):
     status: Literal["open", "in_progress", "resolved", "closed"]
 
 
+# Most operations accepted by one POST /issues/batch request
+BATCH_MAX_OPERATIONS = 1000
+
+
+class BatchIssueCreate(IssueCreate):
+    op: Literal["create"]
+
+
+class BatchIssueUpdate(IssueUpdate):
+    op: Literal["update"]
+    issue_id: int
+
+
+class BatchIssueRequest(BaseModel):
+    operations: List[
+        Annotated[
+            Union[BatchIssueCreate, BatchIssueUpdate], Field(discriminator="op")
+        ]
+    ] = Field(..., min_items=1, max_items=BATCH_MAX_OPERATIONS)
+
+
+class BatchIssueResult(BaseModel):
+    index: int
+    status_code: int
+    result: Literal["created", "updated", "not_found", "conflict", "invalid"]
+    detail: Optional[str] = None
+    issue: Optional[IssueResponse] = None
+
+
+class BatchIssueResponse(BaseModel):
+    created_count: int
+    updated_count: int
+    failed_count: int
+    results: List[BatchIssueResult]
+
+
 class CSVImportContent(BaseModel):
     total_rows: int
     created_issues: int
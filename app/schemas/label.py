@@ -26,3 +26,9 @@ class LabelListResponse(BaseModel):
 
 class IssueLabelUpdate(BaseModel):
     labels: List[str] = Field(..., min_items=1)
+
+
+class BulkLabelUpdate(BaseModel):
+    issue_ids: List[int] = Field(..., min_items=1)
+    add: List[str] = Field(default_factory=list)
+    remove: List[str] = Field(default_factory=list)
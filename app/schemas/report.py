@@ -1,4 +1,5 @@
 from pydantic import BaseModel
+from datetime import date
 from typing import Optional
 
 
@@ -16,3 +17,31 @@ class AverageLatencyReport(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class ThroughputReport(BaseModel):
+    bucket: date
+    created_count: int
+    resolved_count: int
+
+    class Config:
+        from_attributes = True
+
+
+class BacklogReport(BaseModel):
+    bucket: date
+    open_count: int
+
+    class Config:
+        from_attributes = True
+
+
+class ResolutionLatencyReport(BaseModel):
+    bucket: date
+    resolved_count: int
+    p50_hours: Optional[float] = None
+    p90_hours: Optional[float] = None
+    p99_hours: Optional[float] = None
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,35 @@
+from pydantic import BaseModel
+from typing import List, Literal
+from datetime import datetime
+from app.schemas.comment import CommentResponse
+from app.schemas.issue import IssueResponse
+from app.schemas.label import LabelResponse
+
+
+class SyncLabelAssignment(BaseModel):
+    issue_id: int
+    label_id: int
+
+    class Config:
+        from_attributes = True
+
+
+class SyncTombstone(BaseModel):
+    record_type: Literal["issue_label"]
+    issue_id: int
+    record_id: int
+    deleted_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class SyncResponse(BaseModel):
+    issues: List[IssueResponse]
+    comments: List[CommentResponse]
+    # Definitions of the labels used by label_assignments
+    labels: List[LabelResponse]
+    label_assignments: List[SyncLabelAssignment]
+    tombstones: List[SyncTombstone]
+    token: str
+    has_more: bool
@@ -0,0 +1,80 @@
+import functools
+import inspect
+
+from fastapi import Depends, params
+from sqlalchemy.util import await_only
+from sqlalchemy.util.concurrency import in_greenlet
+from starlette.concurrency import run_in_threadpool
+
+from app.database import (
+    DATABASE_ASYNC,
+    get_async_db,
+    get_async_read_db,
+    get_db,
+    get_read_db,
+)
+
+# Sync session dependencies and the async dependency that replaces each one
+ASYNC_DEPENDENCIES = {get_db: get_async_db, get_read_db: get_async_read_db}
+
+
+def supports_async_db(handler):
+    """Let a sync handler run on the event loop when DATABASE_ASYNC is on.
+
+    The handler is exposed as an `async def` endpoint whose session
+    dependencies yield AsyncSessions. Its body runs through
+    `AsyncSession.run_sync`, so the existing ORM code is reused as-is while
+    every database round trip awaits asyncpg instead of blocking a threadpool
+    thread. A handler may take several sessions (e.g. a replica and the
+    primary); all of them can be used inside that one `run_sync` call.
+
+    With DATABASE_ASYNC off the handler is returned unchanged.
+    """
+    if not DATABASE_ASYNC:
+        return handler
+
+    signature = inspect.signature(handler)
+    session_params = []
+    parameters = []
+    for parameter in signature.parameters.values():
+        dependency = parameter.default
+        if (
+            isinstance(dependency, params.Depends)
+            and dependency.dependency in ASYNC_DEPENDENCIES
+        ):
+            session_params.append(parameter.name)
+            parameter = parameter.replace(
+                default=Depends(ASYNC_DEPENDENCIES[dependency.dependency]),
+                annotation=inspect.Parameter.empty,
+            )
+        parameters.append(parameter)
+
+    if not session_params:
+        raise TypeError(f"{handler.__name__} does not depend on a database session")
+
+    @functools.wraps(handler)
+    async def async_handler(**kwargs):
+        async_sessions = {name: kwargs.pop(name) for name in session_params}
+        sessions = {
+            name: async_session.sync_session
+            for name, async_session in async_sessions.items()
+        }
+        return await async_sessions[session_params[0]].run_sync(
+            lambda _: handler(**kwargs, **sessions)
+        )
+
+    async_handler.__signature__ = signature.replace(parameters=parameters)
+    return async_handler
+
+
+def run_blocking(function, *args, **kwargs):
+    """Call a blocking `function`, off the event loop inside async handlers.
+
+    The body of a supports_async_db handler runs on the event loop, where a
+    blocking call such as a Redis round trip would stall every other request;
+    there `function` is awaited in the threadpool instead. Anywhere else it is
+    simply called.
+    """
+    if in_greenlet():
+        return await_only(run_in_threadpool(function, *args, **kwargs))
+    return function(*args, **kwargs)
@@ -0,0 +1,137 @@
+import logging
+import os
+import select
+import threading
+
+import psycopg2
+from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from app.database import engine
+from app.utils.response_cache import RESPONSE_CACHE_BACKEND, response_cache
+
+CACHE_INVALIDATION_CHANNEL = os.getenv(
+    "CACHE_INVALIDATION_CHANNEL", "issue_cache_invalidation"
+)
+CACHE_LISTENER_RECONNECT_SECONDS = float(
+    os.getenv("CACHE_LISTENER_RECONNECT_SECONDS", "5")
+)
+
+# NOTIFY payloads are limited to 8000 bytes
+NOTIFY_IDS_PER_PAYLOAD = 500
+
+PENDING_INVALIDATIONS = "invalidated_issue_ids"
+
+logger = logging.getLogger(__name__)
+
+
+def invalidate_issues(db, issue_ids):
+    """Drop the cached responses of these issues once `db` commits.
+
+    Call it before committing. With the postgres backend the ids are sent with
+    NOTIFY inside the same transaction, so every worker hears about them
+    exactly when the change becomes visible, and never for a rollback.
+    """
+    db.info.setdefault(PENDING_INVALIDATIONS, set()).update(issue_ids)
+
+
+def invalidation_payloads(issue_ids) -> list:
+    """NOTIFY payloads carrying these issue ids to the other workers."""
+    issue_ids = sorted(issue_ids)
+    return [
+        ",".join(str(issue_id) for issue_id in issue_ids[i : i + NOTIFY_IDS_PER_PAYLOAD])
+        for i in range(0, len(issue_ids), NOTIFY_IDS_PER_PAYLOAD)
+    ]
+
+
+def apply_invalidation_payload(cache, payload: str):
+    """Invalidate the issues of a payload received from another worker."""
+    cache.invalidate_issues([int(issue_id) for issue_id in payload.split(",")])
+
+
+def notify_invalidations(session, payloads: list):
+    """NOTIFY every worker of these payloads when `session` commits."""
+    session.execute(
+        text(
+            "SELECT pg_notify(:channel, payload) "
+            "FROM unnest(CAST(:payloads AS text[])) AS payload"
+        ),
+        {"channel": CACHE_INVALIDATION_CHANNEL, "payloads": payloads},
+    )
+
+
+@event.listens_for(Session, "before_commit")
+def _publish_invalidations(session):
+    # Also fires when a savepoint is released; wait for the outer transaction
+    if RESPONSE_CACHE_BACKEND != "postgres" or session.in_nested_transaction():
+        return
+    payloads = invalidation_payloads(session.info.get(PENDING_INVALIDATIONS, ()))
+    if payloads:
+        notify_invalidations(session, payloads)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_invalidations(session):
+    if session.in_nested_transaction():
+        return
+    issue_ids = session.info.pop(PENDING_INVALIDATIONS, None)
+    if issue_ids:
+        response_cache.invalidate_issues(issue_ids)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_invalidations(session, previous_transaction):
+    # Invalidations recorded in a rolled back savepoint are kept: the outer
+    # transaction may still commit, and an extra invalidation is harmless
+    if previous_transaction.nested:
+        return
+    session.info.pop(PENDING_INVALIDATIONS, None)
+
+
+def _listen_for_invalidations(stop: threading.Event):
+    dsn = engine.url.set(drivername="postgresql").render_as_string(
+        hide_password=False
+    )
+    while not stop.is_set():
+        connection = None
+        try:
+            connection = psycopg2.connect(dsn)
+            connection.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+            with connection.cursor() as cursor:
+                cursor.execute(f'LISTEN "{CACHE_INVALIDATION_CHANNEL}"')
+            # Anything published while disconnected was missed
+            response_cache.clear()
+            while not stop.is_set():
+                if select.select([connection], [], [], 1) == ([], [], []):
+                    continue
+                connection.poll()
+                while connection.notifies:
+                    notify = connection.notifies.pop(0)
+                    apply_invalidation_payload(response_cache, notify.payload)
+        except (psycopg2.Error, OSError):
+            logger.warning("Cache invalidation listener disconnected", exc_info=True)
+            stop.wait(CACHE_LISTENER_RECONNECT_SECONDS)
+        finally:
+            if connection is not None:
+                connection.close()
+
+
+_listener_stop = threading.Event()
+
+
+def start_invalidation_listener():
+    """Follow invalidations from other workers when the postgres backend is on."""
+    if RESPONSE_CACHE_BACKEND != "postgres":
+        return
+    _listener_stop.clear()
+    threading.Thread(
+        target=_listen_for_invalidations,
+        args=(_listener_stop,),
+        name="cache-invalidation",
+        daemon=True,
+    ).start()
+
+
+def stop_invalidation_listener():
+    _listener_stop.set()
@@ -0,0 +1,286 @@
+import asyncio
+import json
+import logging
+import os
+import threading
+
+from sqlalchemy import select, tuple_
+from sqlalchemy.exc import SQLAlchemyError
+from starlette.concurrency import run_in_threadpool
+
+from app.database import sessionLocal
+from app.models.issue import Issue
+from app.models.issue_event import IssueEvent
+from app.utils.sync import commit_horizon
+
+CHANGE_FEED_POLL_INTERVAL_SECONDS = float(
+    os.getenv("CHANGE_FEED_POLL_INTERVAL_SECONDS", "0.5")
+)
+# Batches a subscriber may fall behind before it is disconnected to resume
+CHANGE_FEED_QUEUE_SIZE = int(os.getenv("CHANGE_FEED_QUEUE_SIZE", "100"))
+CHANGE_FEED_KEEPALIVE_SECONDS = float(os.getenv("CHANGE_FEED_KEEPALIVE_SECONDS", "15"))
+
+CHANGE_FEED_BATCH_SIZE = 1000
+
+CHANGE_COLUMNS = (
+    IssueEvent.sync_xid,
+    IssueEvent.id,
+    IssueEvent.issue_id,
+    IssueEvent.event_type,
+    IssueEvent.old_value,
+    IssueEvent.new_value,
+    IssueEvent.created_at,
+    Issue.status,
+    Issue.assignee_id,
+    Issue.version,
+)
+
+CHANGE_KEY = tuple_(IssueEvent.sync_xid, IssueEvent.id)
+
+logger = logging.getLogger(__name__)
+
+
+class InvalidEventIdError(ValueError):
+    pass
+
+
+def parse_event_id(value: str) -> tuple:
+    """The ``(sync_xid, id)`` position of a server-sent event id."""
+    try:
+        sync_xid, event_id = value.split("-")
+        return int(sync_xid), int(event_id)
+    except ValueError:
+        raise InvalidEventIdError("Invalid event id")
+
+
+def change_position(row) -> tuple:
+    return row.sync_xid, row.id
+
+
+def changes_query(after: tuple, until=None, below=None, status=None, assignee_id=None):
+    """Events after `after` up to `until` (inclusive) in feed order.
+
+    `below` limits them to transactions with lower ids, i.e. to the ones that
+    are known to have ended. `status` and `assignee_id` match the issue's
+    current row, not its state when the event happened.
+    """
+    query = (
+        select(*CHANGE_COLUMNS)
+        .join(Issue, Issue.id == IssueEvent.issue_id)
+        .where(CHANGE_KEY > tuple_(*after))
+        .order_by(IssueEvent.sync_xid, IssueEvent.id)
+        .limit(CHANGE_FEED_BATCH_SIZE)
+    )
+    if until is not None:
+        query = query.where(CHANGE_KEY <= tuple_(*until))
+    if below is not None:
+        query = query.where(IssueEvent.sync_xid < below)
+    if status is not None:
+        query = query.where(Issue.status == status)
+    if assignee_id is not None:
+        query = query.where(Issue.assignee_id == assignee_id)
+    return query
+
+
+def fetch_changes(after: tuple, until: tuple, status=None, assignee_id=None) -> list:
+    """Committed events in (after, until], with their issue's current state."""
+    db = sessionLocal()
+    try:
+        return db.execute(changes_query(after, until, None, status, assignee_id)).all()
+    finally:
+        db.close()
+
+
+def fetch_committed_changes(after: tuple) -> list:
+    """Events after `after` from transactions below the commit horizon."""
+    db = sessionLocal()
+    try:
+        return db.execute(changes_query(after, below=commit_horizon(db))).all()
+    finally:
+        db.close()
+
+
+def start_position() -> tuple:
+    """Position just before the events of transactions still running."""
+    db = sessionLocal()
+    try:
+        return commit_horizon(db), 0
+    finally:
+        db.close()
+
+
+def format_change(row) -> str:
+    """One server-sent event; its id is the resume point for Last-Event-ID."""
+    data = json.dumps(
+        {
+            "id": row.id,
+            "issue_id": row.issue_id,
+            "event_type": row.event_type,
+            "old_value": row.old_value,
+            "new_value": row.new_value,
+            "created_at": row.created_at.isoformat(),
+            "status": row.status,
+            "assignee_id": row.assignee_id,
+            "version": row.version,
+        }
+    )
+    return f"id: {row.sync_xid}-{row.id}\ndata: {data}\n\n"
+
+
+class Subscriber:
+    """An open stream, fed from the poller thread through its event loop."""
+
+    def __init__(self, loop, status=None, assignee_id=None, after=None):
+        self.loop = loop
+        self.status = status
+        self.assignee_id = assignee_id
+        # Resume point from another worker whose feed may be further along
+        self.after = after
+        self.queue = asyncio.Queue(maxsize=CHANGE_FEED_QUEUE_SIZE)
+        self.overflowed = False
+
+    def matches(self, row) -> bool:
+        # The issue's state when the batch was read, like changes_query
+        return (
+            (self.status is None or row.status == self.status)
+            and (self.assignee_id is None or row.assignee_id == self.assignee_id)
+            and (self.after is None or change_position(row) > self.after)
+        )
+
+    def publish(self, changes):
+        chunk = "".join(text for row, text in changes if self.matches(row))
+        if chunk:
+            try:
+                self.loop.call_soon_threadsafe(self._put, chunk)
+            except RuntimeError:
+                # The event loop has shut down
+                pass
+
+    def _put(self, chunk: str):
+        # Once a batch is dropped nothing newer may be sent; the stream ends
+        # after the queued batches and the client resumes from the database
+        if self.overflowed:
+            return
+        try:
+            self.queue.put_nowait(chunk)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+
+class ChangeFeed:
+    """Tails issue_events once per process and fans it out to every stream.
+
+    Event ids are assigned before commit, so a lower id can become visible
+    after a higher one. The feed therefore orders events by the transaction
+    that wrote them, then by id, and only publishes those of transactions
+    below the snapshot xmin: every one of them has ended, so no event can
+    later appear before the last one published, however long its transaction
+    took to commit. That keeps every stream in one order and makes the last
+    event a client saw a safe resume point. A long-running transaction holds
+    the feed back until it ends.
+    """
+
+    def __init__(self):
+        self._subscribers = set()
+        self._position = None
+        self._lock = threading.Lock()
+
+    def subscribe(self, subscriber: Subscriber) -> tuple:
+        """Register a stream; returns the position after which it receives events."""
+        with self._lock:
+            if self._position is None:
+                self._position = start_position()
+            self._subscribers.add(subscriber)
+            return self._position
+
+    def unsubscribe(self, subscriber: Subscriber):
+        with self._lock:
+            self._subscribers.discard(subscriber)
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
+
+    def poll(self) -> bool:
+        """Publish new events; returns True if more may be waiting."""
+        with self._lock:
+            if not self._subscribers:
+                # Idle: nothing is read until someone subscribes again
+                self._position = None
+                return False
+            position = self._position
+
+        rows = fetch_committed_changes(position)
+        if not rows:
+            return False
+        changes = [(row, format_change(row)) for row in rows]
+
+        with self._lock:
+            self._position = change_position(rows[-1])
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            subscriber.publish(changes)
+        return len(rows) == CHANGE_FEED_BATCH_SIZE
+
+
+change_feed = ChangeFeed()
+
+
+async def stream_changes(last_event_id=None, status=None, assignee_id=None):
+    """Server-sent events of issue changes, resuming after `last_event_id`.
+
+    `last_event_id` is a ``(sync_xid, id)`` position, see parse_event_id.
+    """
+    subscriber = Subscriber(
+        asyncio.get_running_loop(), status, assignee_id, last_event_id
+    )
+    live_after = await run_in_threadpool(change_feed.subscribe, subscriber)
+    try:
+        # Catch up from the table until the live stream takes over
+        after = last_event_id
+        while after is not None and after < live_after:
+            rows = await run_in_threadpool(
+                fetch_changes, after, live_after, status, assignee_id
+            )
+            if not rows:
+                break
+            yield "".join(format_change(row) for row in rows)
+            after = change_position(rows[-1])
+
+        while not (subscriber.overflowed and subscriber.queue.empty()):
+            try:
+                yield await asyncio.wait_for(
+                    subscriber.queue.get(), CHANGE_FEED_KEEPALIVE_SECONDS
+                )
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+    finally:
+        change_feed.unsubscribe(subscriber)
+
+
+def _poll_changes(stop: threading.Event):
+    while not stop.is_set():
+        try:
+            more = change_feed.poll()
+        except SQLAlchemyError:
+            logger.exception("Change feed poll failed")
+            more = False
+        if not more:
+            stop.wait(CHANGE_FEED_POLL_INTERVAL_SECONDS)
+
+
+_poller_stop = threading.Event()
+
+
+def start_change_feed():
+    _poller_stop.clear()
+    threading.Thread(
+        target=_poll_changes,
+        args=(_poller_stop,),
+        name="change-feed",
+        daemon=True,
+    ).start()
+
+
+def stop_change_feed():
+    _poller_stop.set()
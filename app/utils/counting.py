@@ -0,0 +1,81 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from sqlalchemy import text
+
+COUNT_CACHE_TTL_SECONDS = float(os.getenv("COUNT_CACHE_TTL_SECONDS", "30"))
+COUNT_CACHE_MAX_ENTRIES = int(os.getenv("COUNT_CACHE_MAX_ENTRIES", "1024"))
+
+
+class CountCache:
+    """Small TTL cache of row counts keyed by table and filter set."""
+
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key) -> Optional[int]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value: int):
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+count_cache = CountCache(COUNT_CACHE_TTL_SECONDS, COUNT_CACHE_MAX_ENTRIES)
+
+
+def _planner_row_estimate(db, table_name: str) -> Optional[int]:
+    # reltuples is -1 for tables that have never been vacuumed or analyzed
+    estimate = db.execute(
+        text("SELECT reltuples FROM pg_class WHERE oid = to_regclass(:table_name)"),
+        {"table_name": table_name},
+    ).scalar()
+    if estimate is None or estimate < 0:
+        return None
+    return int(estimate)
+
+
+def count_total(db, query, total_mode: str, table_name: str, filters: dict):
+    """Return the total for a list query according to `total_mode`.
+
+    - exact: COUNT(*) over the filtered query.
+    - estimated: planner statistics when the query is unfiltered, otherwise a
+      TTL-cached exact count keyed by the filter set.
+    - none: no count at all.
+    """
+    if total_mode == "none":
+        return None
+
+    if total_mode == "exact":
+        return query.count()
+
+    active_filters = {key: value for key, value in filters.items() if value is not None}
+    if not active_filters:
+        estimate = _planner_row_estimate(db, table_name)
+        if estimate is not None:
+            return estimate
+
+    cache_key = (table_name, tuple(sorted(active_filters.items())))
+    total = count_cache.get(cache_key)
+    if total is None:
+        total = query.count()
+        count_cache.set(cache_key, total)
+    return total
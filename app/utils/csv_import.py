@@ -0,0 +1,164 @@
+import csv
+import os
+from datetime import datetime
+from itertools import islice
+
+from fastapi import HTTPException, UploadFile, status
+from sqlalchemy import insert
+
+from app.models.issue import Issue
+from app.models.user import User
+from app.schemas.issue import CSVImportContent
+from app.utils.report_stats import record_issue_changes
+
+CSV_IMPORT_BATCH_SIZE = int(os.getenv("CSV_IMPORT_BATCH_SIZE", "1000"))
+
+allowed_priorities = {"low", "medium", "high", "critical"}
+
+
+def validate_csv_upload(file: UploadFile):
+    if not file.filename.endswith(".csv"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid file extension. Please upload a CSV file.",
+        )
+
+    if file.content_type != "text/csv":
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid file type. Please upload a CSV file.",
+        )
+
+
+def validate_csv_row(row: dict) -> dict:
+    """Validate the fields of one CSV row that do not need the database.
+
+    Raises ValueError with the message reported back to the client.
+    """
+    title = row.get("title")
+    if not title or not (5 <= len(title) <= 200):
+        raise ValueError("Title must be between 5 and 200 characters.")
+
+    description = row.get("description", "")
+
+    priority = row.get("priority")
+    if priority not in allowed_priorities:
+        raise ValueError(
+            f"Invalid priority '{priority}'. Must be one of {allowed_priorities}."
+        )
+
+    assignee_id = row.get("assignee_id")
+    return {
+        "title": title,
+        "description": description,
+        "priority": priority,
+        "assignee_id": int(assignee_id) if assignee_id else None,
+        "raw_assignee_id": assignee_id,
+    }
+
+
+def _import_batch(db, batch):
+    """Validate and insert one chunk of (row number, row) pairs.
+
+    Returns the number of created issues and the list of row errors.
+    """
+    validated = []
+    errors = []
+    for index, row in batch:
+        try:
+            validated.append((index, validate_csv_row(row)))
+        except ValueError as e:
+            validated.append((index, None))
+            errors.append({"row": index, "error": str(e)})
+
+    # One lookup per chunk instead of one SELECT per row
+    assignee_ids = {
+        fields["assignee_id"]
+        for _, fields in validated
+        if fields and fields["assignee_id"] is not None
+    }
+    existing_assignees = set()
+    if assignee_ids:
+        existing_assignees = {
+            user_id
+            for (user_id,) in db.query(User.id).filter(User.id.in_(assignee_ids))
+        }
+
+    now = datetime.utcnow()
+    new_issues = []
+    for index, fields in validated:
+        if fields is None:
+            continue
+        if (
+            fields["assignee_id"] is not None
+            and fields["assignee_id"] not in existing_assignees
+        ):
+            errors.append(
+                {
+                    "row": index,
+                    "error": f"Assignee with ID {fields['raw_assignee_id']} does not exist.",
+                }
+            )
+            continue
+        new_issues.append(
+            {
+                "title": fields["title"],
+                "description": fields["description"],
+                "priority": fields["priority"],
+                "assignee_id": fields["assignee_id"],
+                "status": "open",
+                "resolved_at": None,
+                "created_at": now,
+                "updated_at": now,
+            }
+        )
+
+    if new_issues:
+        # executemany on a Core insert is sent as multi-row INSERT ... VALUES
+        db.execute(insert(Issue), new_issues)
+        record_issue_changes(db, [(None, new_issue) for new_issue in new_issues])
+    db.commit()
+
+    errors.sort(key=lambda error: error["row"])
+    return len(new_issues), errors
+
+
+def import_issues_csv(
+    db,
+    text_stream,
+    batch_size: int = CSV_IMPORT_BATCH_SIZE,
+    on_batch=None,
+    is_cancelled=None,
+):
+    """Import issues from a text stream of CSV data, one chunk at a time.
+
+    Only `batch_size` rows are held in memory at once, and each chunk is
+    validated and inserted in a single transaction. `on_batch` is called with
+    (rows, created, errors) after every committed chunk, and the import stops
+    before the next chunk once `is_cancelled()` returns True.
+    """
+    reader = enumerate(csv.DictReader(text_stream), start=1)
+
+    total_rows = 0
+    created_issues = 0
+    errors = []
+
+    while True:
+        if is_cancelled is not None and is_cancelled():
+            break
+        batch = list(islice(reader, batch_size))
+        if not batch:
+            break
+        total_rows += len(batch)
+        created, batch_errors = _import_batch(db, batch)
+        created_issues += created
+        errors.extend(batch_errors)
+        if on_batch is not None:
+            on_batch(len(batch), created, batch_errors)
+
+    return CSVImportContent(
+        total_rows=total_rows,
+        created_issues=created_issues,
+        failed_rows=len(errors),
+        errors=errors,
+    )
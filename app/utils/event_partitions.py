@@ -0,0 +1,178 @@
+import logging
+import os
+import re
+import threading
+from datetime import date, datetime
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.database import sessionLocal
+from app.utils.sync import expire_tombstones
+
+# issue_events is partitioned by month of created_at. Partitions are created
+# this many months ahead; rows outside every partition land in the default one.
+TIMELINE_PARTITION_MONTHS_AHEAD = int(
+    os.getenv("TIMELINE_PARTITION_MONTHS_AHEAD", "3")
+)
+# Months of events to keep (0 keeps everything). Expired partitions are
+# detached and dropped, or moved to TIMELINE_ARCHIVE_SCHEMA when it is set.
+TIMELINE_RETENTION_MONTHS = int(os.getenv("TIMELINE_RETENTION_MONTHS", "0"))
+TIMELINE_ARCHIVE_SCHEMA = os.getenv("TIMELINE_ARCHIVE_SCHEMA", "")
+TIMELINE_MAINTENANCE_INTERVAL_SECONDS = float(
+    os.getenv("TIMELINE_MAINTENANCE_INTERVAL_SECONDS", "3600")
+)
+
+DEFAULT_PARTITION = "issue_events_default"
+PARTITION_NAME = re.compile(r"^issue_events_y(\d{4})m(\d{2})$")
+
+# Serializes maintenance across workers
+MAINTENANCE_LOCK_KEY = 7_390_412
+
+logger = logging.getLogger(__name__)
+
+
+def is_event_partition(name: str) -> bool:
+    return name == DEFAULT_PARTITION or PARTITION_NAME.match(name) is not None
+
+
+def month_start(day: date) -> date:
+    return date(day.year, day.month, 1)
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"issue_events_y{month.year}m{month.month:02d}"
+
+
+def ensure_event_partitions(db, today: date = None):
+    """Create the default partition and the monthly ones up to the horizon."""
+    month = month_start(today or datetime.utcnow().date())
+    db.execute(
+        text(
+            f"CREATE TABLE IF NOT EXISTS {DEFAULT_PARTITION} "
+            "PARTITION OF issue_events DEFAULT"
+        )
+    )
+    for offset in range(TIMELINE_PARTITION_MONTHS_AHEAD + 1):
+        start = add_months(month, offset)
+        try:
+            # A savepoint, so one failed month does not abort the others
+            with db.begin_nested():
+                db.execute(
+                    text(
+                        f"CREATE TABLE IF NOT EXISTS {partition_name(start)} "
+                        "PARTITION OF issue_events "
+                        f"FOR VALUES FROM ('{start}') TO ('{add_months(start, 1)}')"
+                    )
+                )
+        except SQLAlchemyError:
+            # The default partition already holds rows of this month
+            logger.exception("Could not create partition %s", partition_name(start))
+
+
+def expire_event_partitions(db, today: date = None) -> list:
+    """Detach the partitions older than the retention window.
+
+    Returns the names of the expired partitions, which are dropped, or moved to
+    TIMELINE_ARCHIVE_SCHEMA to be dumped or queried later.
+    """
+    if TIMELINE_RETENTION_MONTHS <= 0:
+        return []
+    cutoff = add_months(
+        month_start(today or datetime.utcnow().date()), -TIMELINE_RETENTION_MONTHS
+    )
+    partitions = db.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE pg_inherits.inhparent = 'issue_events'::regclass"
+        )
+    ).scalars()
+
+    expired = []
+    for name in sorted(partitions):
+        match = PARTITION_NAME.match(name)
+        if match is None:
+            continue
+        month = date(int(match.group(1)), int(match.group(2)), 1)
+        if add_months(month, 1) <= cutoff:
+            expired.append(name)
+
+    for name in expired:
+        db.execute(text(f"ALTER TABLE issue_events DETACH PARTITION {name}"))
+        if TIMELINE_ARCHIVE_SCHEMA:
+            db.execute(
+                text(f'CREATE SCHEMA IF NOT EXISTS "{TIMELINE_ARCHIVE_SCHEMA}"')
+            )
+            db.execute(
+                text(f'ALTER TABLE {name} SET SCHEMA "{TIMELINE_ARCHIVE_SCHEMA}"')
+            )
+        else:
+            db.execute(text(f"DROP TABLE {name}"))
+    db.execute(
+        text(f"DELETE FROM {DEFAULT_PARTITION} WHERE created_at < :cutoff"),
+        {"cutoff": cutoff},
+    )
+    return expired
+
+
+def maintain_event_partitions(today: date = None) -> list:
+    """Run partition creation and retention once; a no-op if another worker is.
+
+    Also expires the tombstones of GET /sync, the other retention-bound table.
+    """
+    db = sessionLocal()
+    try:
+        locked = db.execute(
+            text("SELECT pg_try_advisory_xact_lock(:key)"),
+            {"key": MAINTENANCE_LOCK_KEY},
+        ).scalar()
+        if not locked:
+            return []
+        ensure_event_partitions(db, today)
+        expired = expire_event_partitions(db, today)
+        tombstones = expire_tombstones(db)
+        db.commit()
+        if expired:
+            logger.info("Expired timeline partitions: %s", ", ".join(expired))
+        if tombstones:
+            logger.info("Expired %d sync tombstones", tombstones)
+        return expired
+    finally:
+        db.close()
+
+
+def _run_event_maintenance(stop: threading.Event):
+    while not stop.wait(TIMELINE_MAINTENANCE_INTERVAL_SECONDS):
+        try:
+            maintain_event_partitions()
+        except SQLAlchemyError:
+            logger.exception("Timeline partition maintenance failed")
+
+
+_maintenance_stop = threading.Event()
+
+
+def start_event_maintenance():
+    _maintenance_stop.clear()
+    threading.Thread(
+        target=_run_event_maintenance,
+        args=(_maintenance_stop,),
+        name="timeline-partitions",
+        daemon=True,
+    ).start()
+
+
+def stop_event_maintenance():
+    _maintenance_stop.set()
+
+
+if __name__ == "__main__":
+    # For cron: python -m app.utils.event_partitions
+    logging.basicConfig(level=logging.INFO)
+    maintain_event_partitions()
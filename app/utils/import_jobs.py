@@ -0,0 +1,138 @@
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from app.database import sessionLocal
+from app.utils.csv_import import import_issues_csv
+
+IMPORT_JOB_WORKERS = int(os.getenv("IMPORT_JOB_WORKERS", "2"))
+IMPORT_JOB_HISTORY = int(os.getenv("IMPORT_JOB_HISTORY", "1000"))
+
+FINISHED_STATUSES = {"completed", "failed", "cancelled"}
+
+
+class ImportJob:
+    def __init__(self, filename: str, path: str):
+        self.job_id = uuid.uuid4().hex
+        self.filename = filename
+        self.path = path
+        self.status = "queued"
+        self.rows_processed = 0
+        self.created_issues = 0
+        self.failed_rows = 0
+        self.errors = []
+        self.detail = None
+        self.created_at = datetime.utcnow()
+        self.started_at = None
+        self.finished_at = None
+        self.future = None
+        self.cancel_requested = threading.Event()
+        self._lock = threading.Lock()
+
+    def record_batch(self, rows: int, created: int, errors: list):
+        with self._lock:
+            self.rows_processed += rows
+            self.created_issues += created
+            self.failed_rows += len(errors)
+            self.errors.extend(errors)
+
+    def set_status(self, status: str, detail: str = None):
+        with self._lock:
+            self.status = status
+            if detail is not None:
+                self.detail = detail
+            if status == "running":
+                self.started_at = datetime.utcnow()
+            elif status in FINISHED_STATUSES:
+                self.finished_at = datetime.utcnow()
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "job_id": self.job_id,
+                "status": self.status,
+                "filename": self.filename,
+                "rows_processed": self.rows_processed,
+                "created_issues": self.created_issues,
+                "failed_rows": self.failed_rows,
+                "errors": list(self.errors),
+                "detail": self.detail,
+                "created_at": self.created_at,
+                "started_at": self.started_at,
+                "finished_at": self.finished_at,
+            }
+
+
+class ImportJobStore:
+    """In-process registry of import jobs, oldest finished jobs evicted first."""
+
+    def __init__(self, max_jobs: int):
+        self.max_jobs = max_jobs
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, job: ImportJob):
+        with self._lock:
+            self._jobs[job.job_id] = job
+            if len(self._jobs) > self.max_jobs:
+                for job_id, old_job in list(self._jobs.items()):
+                    if old_job.status in FINISHED_STATUSES:
+                        del self._jobs[job_id]
+                        if len(self._jobs) <= self.max_jobs:
+                            break
+
+    def get(self, job_id: str):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+
+job_store = ImportJobStore(IMPORT_JOB_HISTORY)
+executor = ThreadPoolExecutor(
+    max_workers=IMPORT_JOB_WORKERS, thread_name_prefix="csv-import"
+)
+
+
+def _run_import_job(job: ImportJob):
+    if job.cancel_requested.is_set():
+        job.set_status("cancelled")
+        os.remove(job.path)
+        return
+
+    job.set_status("running")
+    db = sessionLocal()
+    try:
+        with open(job.path, encoding="utf-8", newline="") as text_stream:
+            import_issues_csv(
+                db,
+                text_stream,
+                on_batch=job.record_batch,
+                is_cancelled=job.cancel_requested.is_set,
+            )
+        if job.cancel_requested.is_set():
+            job.set_status("cancelled")
+        else:
+            job.set_status("completed")
+    except Exception as e:
+        db.rollback()
+        job.set_status("failed", detail=str(e))
+    finally:
+        db.close()
+        os.remove(job.path)
+
+
+def submit_import_job(filename: str, path: str) -> ImportJob:
+    job = ImportJob(filename, path)
+    job_store.add(job)
+    job.future = executor.submit(_run_import_job, job)
+    return job
+
+
+def cancel_import_job(job: ImportJob):
+    """Stop a job before its next batch; batches already committed are kept."""
+    job.cancel_requested.set()
+    if job.future is not None and job.future.cancel():
+        job.set_status("cancelled")
+        os.remove(job.path)
@@ -0,0 +1,59 @@
+import csv
+import io
+import json
+from datetime import datetime
+
+from app.models.issue import ISSUE_COLUMNS
+
+EXPORT_FIELDS = [column.key for column in ISSUE_COLUMNS]
+
+# Rows fetched per round trip from the server-side cursor, and written per chunk
+EXPORT_BATCH_SIZE = 1000
+
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+def _isoformat(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def ndjson_chunk(rows) -> str:
+    return "".join(
+        json.dumps(dict(zip(EXPORT_FIELDS, row)), default=_isoformat) + "\n"
+        for row in rows
+    )
+
+
+def csv_chunk(rows) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerows(
+        [value.isoformat() if isinstance(value, datetime) else value for value in row]
+        for row in rows
+    )
+    return buffer.getvalue()
+
+
+def stream_issue_export(session_factory, statement, format: str):
+    """Yield an export of the rows selected by `statement`, chunk by chunk.
+
+    Rows come from a server-side cursor `EXPORT_BATCH_SIZE` at a time, so
+    memory stays flat however many issues match. The generator owns its session
+    because it keeps running after the request handler has returned.
+    """
+    if format == "csv":
+        yield csv_chunk([EXPORT_FIELDS])
+    serialize = csv_chunk if format == "csv" else ndjson_chunk
+
+    db = session_factory()
+    try:
+        # Plain column rows, no ORM result processing needed
+        result = db.connection().execute(
+            statement.execution_options(yield_per=EXPORT_BATCH_SIZE)
+        )
+        for rows in result.partitions():
+            yield serialize(rows)
+    finally:
+        db.close()
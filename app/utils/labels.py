@@ -0,0 +1,48 @@
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+
+from app.models.label import Label
+
+
+def normalize_label_names(names) -> list:
+    """Strip and lower-case label names, dropping blanks and duplicates."""
+    normalized = []
+    for name in names:
+        name = name.strip().lower()
+        if name and name not in normalized:
+            normalized.append(name)
+    return normalized
+
+
+def resolve_labels(db, names, create: bool = True) -> list:
+    """Return (id, name, color) rows for normalized label names, in order.
+
+    Existing labels are read with a single IN query. With `create`, missing
+    ones are inserted in one INSERT ... ON CONFLICT DO NOTHING RETURNING; a
+    name another transaction created concurrently is read back instead of
+    failing on the unique constraint.
+    """
+    if not names:
+        return []
+    columns = (Label.id, Label.name, Label.color)
+    found = {
+        row.name: row for row in db.execute(select(*columns).where(Label.name.in_(names)))
+    }
+
+    missing = [name for name in names if name not in found]
+    if missing and create:
+        inserted = db.execute(
+            insert(Label)
+            .values([{"name": name} for name in missing])
+            .on_conflict_do_nothing(index_elements=[Label.name])
+            .returning(*columns)
+        )
+        found.update((row.name, row) for row in inserted)
+        raced = [name for name in missing if name not in found]
+        if raced:
+            found.update(
+                (row.name, row)
+                for row in db.execute(select(*columns).where(Label.name.in_(raced)))
+            )
+
+    return [found[name] for name in names if name in found]
@@ -0,0 +1,48 @@
+import base64
+import json
+from datetime import datetime
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+def encode_cursor(sort_by: str, sort_order: str, sort_value, last_id: int) -> str:
+    if isinstance(sort_value, datetime):
+        sort_value = sort_value.isoformat()
+    payload = json.dumps(
+        {"s": sort_by, "o": sort_order, "v": sort_value, "id": last_id},
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str, sort_by: str, sort_order: str):
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        sort_value = payload["v"]
+        last_id = int(payload["id"])
+        cursor_sort_by = payload["s"]
+        cursor_sort_order = payload["o"]
+    except (ValueError, KeyError, TypeError):
+        raise InvalidCursorError("Invalid cursor")
+
+    # A cursor is only meaningful for the ordering it was produced with
+    if cursor_sort_by != sort_by or cursor_sort_order != sort_order:
+        raise InvalidCursorError("Cursor does not match sort_by/sort_order")
+
+    if sort_by in ("created_at", "updated_at"):
+        try:
+            sort_value = datetime.fromisoformat(sort_value)
+        except (ValueError, TypeError):
+            raise InvalidCursorError("Invalid cursor")
+    elif sort_by == "rank":
+        try:
+            sort_value = float(sort_value)
+        except (ValueError, TypeError):
+            raise InvalidCursorError("Invalid cursor")
+    elif not isinstance(sort_value, str):
+        # priority and status are compared as strings
+        raise InvalidCursorError("Invalid cursor")
+
+    return sort_value, last_id
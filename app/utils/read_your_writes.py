@@ -0,0 +1,55 @@
+import hashlib
+import hmac
+import os
+import secrets
+import time
+
+from fastapi import Request, Response
+
+# After a successful write the client reads from the primary for this long, so
+# it never sees a replica that has not caught up with its own change yet
+READ_YOUR_WRITES_SECONDS = float(os.getenv("READ_YOUR_WRITES_SECONDS", "5"))
+# Key signing the pin cookie, so clients cannot pin themselves to the primary.
+# Must be shared by every worker; a random per-process key only suits one
+READ_YOUR_WRITES_SECRET = (
+    os.getenv("READ_YOUR_WRITES_SECRET", "").encode("utf-8")
+    or secrets.token_bytes(32)
+)
+
+PRIMARY_PIN_COOKIE = "read_primary_until"
+WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+
+
+def pin_signature(pinned_until: str) -> str:
+    return hmac.new(
+        READ_YOUR_WRITES_SECRET, pinned_until.encode("utf-8"), hashlib.sha256
+    ).hexdigest()
+
+
+def pin_to_primary(response: Response):
+    if READ_YOUR_WRITES_SECONDS <= 0:
+        return
+    pinned_until = str(time.time() + READ_YOUR_WRITES_SECONDS)
+    response.set_cookie(
+        PRIMARY_PIN_COOKIE,
+        f"{pinned_until}:{pin_signature(pinned_until)}",
+        max_age=int(READ_YOUR_WRITES_SECONDS) + 1,
+        httponly=True,
+    )
+
+
+def is_pinned_to_primary(request: Request) -> bool:
+    cookie = request.cookies.get(PRIMARY_PIN_COOKIE, "")
+    pinned_until, _, signature = cookie.partition(":")
+    if not hmac.compare_digest(
+        signature.encode("utf-8"), pin_signature(pinned_until).encode("utf-8")
+    ):
+        return False
+    try:
+        pinned_until = float(pinned_until)
+    except ValueError:
+        return False
+    now = time.time()
+    # Never longer than a pin issued now, e.g. after READ_YOUR_WRITES_SECONDS
+    # was lowered
+    return min(pinned_until, now + READ_YOUR_WRITES_SECONDS) > now
@@ -0,0 +1,244 @@
+import os
+import random
+from collections import Counter, defaultdict
+
+from sqlalchemy import Date, cast, func, literal, select, text, union_all
+from sqlalchemy.dialects.postgresql import insert
+
+from app.models.issue import Issue
+from app.models.report_stats import (
+    AssigneeIssueCount,
+    IssueDailyRollup,
+    ResolutionStats,
+)
+
+RESOLUTION_STATS_SHARDS = int(os.getenv("RESOLUTION_STATS_SHARDS", "16"))
+ISSUE_ROLLUP_SHARDS = int(os.getenv("ISSUE_ROLLUP_SHARDS", "8"))
+
+# Rollup key used for issues without an assignee
+UNASSIGNED = 0
+
+
+def resolution_seconds(created_at, resolved_at):
+    if resolved_at is None:
+        return None
+    return (resolved_at - created_at).total_seconds()
+
+
+def issue_state(issue) -> dict:
+    """The fields of an issue that the report aggregates depend on."""
+    return {
+        "created_at": issue.created_at,
+        "resolved_at": issue.resolved_at,
+        "priority": issue.priority,
+        "assignee_id": issue.assignee_id,
+    }
+
+
+def adjust_assignee_counts(db, deltas: Counter):
+    """Apply per-assignee issue count changes within the caller's transaction."""
+    rows = [
+        {"assignee_id": assignee_id, "issue_count": delta}
+        for assignee_id, delta in sorted(
+            (assignee_id, delta)
+            for assignee_id, delta in deltas.items()
+            if assignee_id is not None and delta
+        )
+    ]
+    if not rows:
+        return
+    stmt = insert(AssigneeIssueCount).values(rows)
+    db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[AssigneeIssueCount.assignee_id],
+            set_={
+                "issue_count": AssigneeIssueCount.issue_count
+                + stmt.excluded.issue_count
+            },
+        )
+    )
+
+
+def adjust_resolution_stats(db, count_delta: int, seconds_delta: float):
+    """Apply changes to the resolved issue count and total resolution time."""
+    if not count_delta and not seconds_delta:
+        return
+    stmt = insert(ResolutionStats).values(
+        shard=random.randrange(RESOLUTION_STATS_SHARDS),
+        resolved_count=count_delta,
+        total_resolution_seconds=seconds_delta,
+    )
+    db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[ResolutionStats.shard],
+            set_={
+                "resolved_count": ResolutionStats.resolved_count
+                + stmt.excluded.resolved_count,
+                "total_resolution_seconds": ResolutionStats.total_resolution_seconds
+                + stmt.excluded.total_resolution_seconds,
+            },
+        )
+    )
+
+
+def adjust_rollups(db, deltas: dict):
+    """Apply (created, resolved) count changes keyed by (day, priority, assignee)."""
+    # One shard for the whole call keeps the rows in key order across callers
+    shard = random.randrange(ISSUE_ROLLUP_SHARDS)
+    rows = [
+        {
+            "bucket_date": bucket_date,
+            "priority": priority,
+            "assignee_id": assignee_id,
+            "shard": shard,
+            "created_count": created,
+            "resolved_count": resolved,
+        }
+        for (bucket_date, priority, assignee_id), (created, resolved) in sorted(
+            deltas.items()
+        )
+        if created or resolved
+    ]
+    if not rows:
+        return
+    stmt = insert(IssueDailyRollup).values(rows)
+    db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[
+                IssueDailyRollup.bucket_date,
+                IssueDailyRollup.priority,
+                IssueDailyRollup.assignee_id,
+                IssueDailyRollup.shard,
+            ],
+            set_={
+                "created_count": IssueDailyRollup.created_count
+                + stmt.excluded.created_count,
+                "resolved_count": IssueDailyRollup.resolved_count
+                + stmt.excluded.resolved_count,
+            },
+        )
+    )
+
+
+def record_issue_changes(db, changes):
+    """Update every report aggregate for a list of (old, new) issue states.
+
+    `old` is None for a created issue. The contribution of the old state is
+    subtracted and that of the new state added, so unchanged fields net out
+    and only the affected aggregate rows are written, once per call.
+    """
+    assignee_deltas = Counter()
+    rollup_deltas = defaultdict(lambda: [0, 0])
+    resolved_delta = 0
+    seconds_delta = 0.0
+
+    for old, new in changes:
+        for state, sign in ((old, -1), (new, 1)):
+            if state is None:
+                continue
+            assignee_key = state["assignee_id"] or UNASSIGNED
+            assignee_deltas[state["assignee_id"]] += sign
+            created_key = (state["created_at"].date(), state["priority"], assignee_key)
+            rollup_deltas[created_key][0] += sign
+            if state["resolved_at"] is not None:
+                resolved_key = (
+                    state["resolved_at"].date(),
+                    state["priority"],
+                    assignee_key,
+                )
+                rollup_deltas[resolved_key][1] += sign
+                resolved_delta += sign
+                seconds_delta += sign * resolution_seconds(
+                    state["created_at"], state["resolved_at"]
+                )
+
+    adjust_assignee_counts(db, assignee_deltas)
+    adjust_resolution_stats(db, resolved_delta, seconds_delta)
+    adjust_rollups(db, rollup_deltas)
+
+
+def record_issue_change(db, old=None, new=None):
+    record_issue_changes(db, [(old, new)])
+
+
+def rebuild_report_stats(db, only_if_empty: bool = False):
+    """Recompute the report aggregates from the issues table.
+
+    With `only_if_empty` the rebuild is skipped when the aggregates already
+    hold data, which makes it safe to run on every startup.
+    """
+    db.execute(text("LOCK TABLE resolution_stats IN EXCLUSIVE MODE"))
+    if (
+        only_if_empty
+        and db.query(ResolutionStats.shard).first() is not None
+        and db.query(IssueDailyRollup.bucket_date).first() is not None
+    ):
+        db.rollback()
+        return
+
+    db.query(AssigneeIssueCount).delete()
+    db.query(ResolutionStats).delete()
+    db.query(IssueDailyRollup).delete()
+
+    db.execute(
+        insert(AssigneeIssueCount).from_select(
+            ["assignee_id", "issue_count"],
+            select(Issue.assignee_id, func.count(Issue.id))
+            .where(Issue.assignee_id.isnot(None))
+            .group_by(Issue.assignee_id),
+        )
+    )
+    db.execute(
+        insert(ResolutionStats).from_select(
+            ["shard", "resolved_count", "total_resolution_seconds"],
+            select(
+                literal(0),
+                func.count(Issue.id),
+                func.coalesce(
+                    func.sum(func.extract("epoch", Issue.resolved_at - Issue.created_at)),
+                    0,
+                ),
+            ).where(Issue.resolved_at.isnot(None)),
+        )
+    )
+
+    assignee_key = func.coalesce(Issue.assignee_id, UNASSIGNED)
+    events = union_all(
+        select(
+            cast(Issue.created_at, Date).label("bucket_date"),
+            Issue.priority,
+            assignee_key.label("assignee_id"),
+            literal(1).label("created"),
+            literal(0).label("resolved"),
+        ),
+        select(
+            cast(Issue.resolved_at, Date),
+            Issue.priority,
+            assignee_key,
+            literal(0),
+            literal(1),
+        ).where(Issue.resolved_at.isnot(None)),
+    ).subquery()
+    db.execute(
+        insert(IssueDailyRollup).from_select(
+            [
+                "bucket_date",
+                "priority",
+                "assignee_id",
+                "shard",
+                "created_count",
+                "resolved_count",
+            ],
+            select(
+                events.c.bucket_date,
+                events.c.priority,
+                events.c.assignee_id,
+                literal(0),
+                func.sum(events.c.created),
+                func.sum(events.c.resolved),
+            ).group_by(
+                events.c.bucket_date, events.c.priority, events.c.assignee_id
+            ),
+        )
+    )
+    db.commit()
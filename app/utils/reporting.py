@@ -0,0 +1,104 @@
+from datetime import date, datetime, time, timedelta
+
+from sqlalchemy import Date, DateTime, cast, exists, func, literal, select, union_all
+from sqlalchemy.dialects.postgresql import INTERVAL
+
+from app.models.issue import Issue
+from app.models.issue_label import issue_labels
+from app.models.label import Label
+from app.models.report_stats import IssueDailyRollup
+
+REPORT_DEFAULT_DAYS = 30
+
+
+def report_range(start: date = None, end: date = None):
+    """Fill in a missing report range, defaulting to the last 30 days."""
+    end = end or datetime.utcnow().date()
+    start = start or end - timedelta(days=REPORT_DEFAULT_DAYS - 1)
+    return start, end
+
+
+def bucket_of(column, interval: str):
+    return cast(func.date_trunc(interval, cast(column, DateTime)), Date)
+
+
+def bucket_series(interval: str, start: date, end: date):
+    """Every bucket between start and end, so empty buckets are still reported."""
+    series = func.generate_series(
+        func.date_trunc(interval, datetime.combine(start, time.min)),
+        datetime.combine(end, time.min),
+        cast(literal(f"1 {interval}"), INTERVAL),
+    )
+    return select(cast(series, Date).label("bucket")).subquery("buckets")
+
+
+def in_day_range(column, start: date = None, end: date = None):
+    """Conditions keeping a timestamp column within whole days start..end."""
+    conditions = []
+    if start:
+        conditions.append(column >= datetime.combine(start, time.min))
+    if end:
+        conditions.append(column < datetime.combine(end + timedelta(days=1), time.min))
+    return conditions
+
+
+def issue_filters(priority: str = None, assignee_id: int = None, label: str = None):
+    conditions = []
+    if priority:
+        conditions.append(Issue.priority == priority)
+    if assignee_id:
+        conditions.append(Issue.assignee_id == assignee_id)
+    if label:
+        conditions.append(
+            exists().where(
+                issue_labels.c.issue_id == Issue.id,
+                issue_labels.c.label_id == Label.id,
+                Label.name == label,
+            )
+        )
+    return conditions
+
+
+def daily_activity(
+    start: date = None,
+    end: date = None,
+    priority: str = None,
+    assignee_id: int = None,
+    label: str = None,
+):
+    """Issues created and resolved per day as a (day, created, resolved) subquery.
+
+    Reads the daily rollup table, which is keyed by priority and assignee. A
+    label filter is not part of the rollup key, so it falls back to counting
+    the matching issues directly.
+    """
+    if not label:
+        query = select(
+            IssueDailyRollup.bucket_date.label("day"),
+            IssueDailyRollup.created_count.label("created"),
+            IssueDailyRollup.resolved_count.label("resolved"),
+        )
+        if start:
+            query = query.where(IssueDailyRollup.bucket_date >= start)
+        if end:
+            query = query.where(IssueDailyRollup.bucket_date <= end)
+        if priority:
+            query = query.where(IssueDailyRollup.priority == priority)
+        if assignee_id:
+            query = query.where(IssueDailyRollup.assignee_id == assignee_id)
+        return query.subquery("activity")
+
+    conditions = issue_filters(priority, assignee_id, label)
+    created = select(
+        cast(Issue.created_at, Date).label("day"),
+        literal(1).label("created"),
+        literal(0).label("resolved"),
+    ).where(*conditions, *in_day_range(Issue.created_at, start, end))
+    resolved = select(
+        cast(Issue.resolved_at, Date), literal(0), literal(1)
+    ).where(
+        Issue.resolved_at.isnot(None),
+        *conditions,
+        *in_day_range(Issue.resolved_at, start, end),
+    )
+    return union_all(created, resolved).subquery("activity")
@@ -0,0 +1,265 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from fastapi import Request, Response, status
+
+from app.utils.async_db import run_blocking
+
+# memory: per-process cache, invalidated only by writes in the same process
+# postgres: per-process cache, invalidated across workers with LISTEN/NOTIFY
+# redis: one cache shared by every worker (needs the `redis` package)
+RESPONSE_CACHE_BACKEND = os.getenv("RESPONSE_CACHE_BACKEND", "memory")
+RESPONSE_CACHE_TTL_SECONDS = float(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "60"))
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "10000"))
+RESPONSE_CACHE_REDIS_URL = os.getenv(
+    "RESPONSE_CACHE_REDIS_URL", "redis://localhost:6379/0"
+)
+
+# Kinds of cached payloads per issue, all dropped together on invalidation
+ISSUE = "issue"
+TIMELINE = "timeline"
+
+
+class CachedResponse:
+    def __init__(self, etag: str, body: bytes, next_cursor: Optional[str] = None):
+        self.etag = etag
+        self.body = body
+        self.next_cursor = next_cursor
+
+
+class MemoryResponseCache:
+    """LRU + TTL cache of serialized issue responses keyed by (kind, issue_id).
+
+    Writers call `invalidate_issues` after committing. A reader that loaded a
+    payload before that invalidation must not store it afterwards, so every
+    fill carries the `fill_token()` taken before its query and is dropped if
+    the issue was invalidated since.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._entries = OrderedDict()
+        self._sequence = 0
+        # Sequence number of the latest invalidation of each recent issue
+        self._invalidated = OrderedDict()
+        self._forgotten_sequence = 0
+        self._lock = threading.Lock()
+
+    def get(self, key) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] < time.monotonic():
+                del self._entries[key]
+                self.evictions += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def fill_token(self, key) -> int:
+        with self._lock:
+            return self._sequence
+
+    def set(self, key, response: CachedResponse, fill_token: int) -> CachedResponse:
+        _, issue_id = key
+        with self._lock:
+            invalidated_at = self._invalidated.get(issue_id, self._forgotten_sequence)
+            if invalidated_at > fill_token:
+                return response
+            self._entries[key] = (response, time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+            return response
+
+    def invalidate_issues(self, issue_ids):
+        with self._lock:
+            self._sequence += 1
+            for issue_id in issue_ids:
+                self.invalidations += 1
+                for kind in (ISSUE, TIMELINE):
+                    self._entries.pop((kind, issue_id), None)
+                self._invalidated[issue_id] = self._sequence
+                self._invalidated.move_to_end(issue_id)
+            while len(self._invalidated) > self.max_entries:
+                _, sequence = self._invalidated.popitem(last=False)
+                self._forgotten_sequence = max(self._forgotten_sequence, sequence)
+
+    def clear(self):
+        """Drop every entry, e.g. after invalidations may have been missed."""
+        with self._lock:
+            self._sequence += 1
+            self.invalidations += 1
+            self._entries.clear()
+            self._invalidated.clear()
+            self._forgotten_sequence = self._sequence
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "backend": RESPONSE_CACHE_BACKEND,
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+# Only fills whose generation is still current may store, see MemoryResponseCache
+_REDIS_SET_IF_CURRENT = """
+if (redis.call("GET", KEYS[2]) or "0") ~= ARGV[1] then
+    return 0
+end
+redis.call("SET", KEYS[1], ARGV[2], "PX", ARGV[3])
+return 1
+"""
+
+
+class RedisResponseCache:
+    """Response cache stored in Redis and shared by every worker.
+
+    Each issue has a generation counter that invalidation increments; a fill
+    only stores its payload if the generation it read beforehand is current.
+    Hit and miss counters are per process; Redis expires entries on its own.
+    Round trips go through run_blocking, so async handlers do not wait for
+    Redis on the event loop.
+    """
+
+    def __init__(self, url: str, ttl_seconds: float, client=None):
+        if client is None:
+            try:
+                import redis
+            except ImportError:
+                raise RuntimeError(
+                    "RESPONSE_CACHE_BACKEND=redis requires the redis package"
+                )
+            client = redis.Redis.from_url(url)
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._client = client
+        self._set_if_current = client.register_script(_REDIS_SET_IF_CURRENT)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _entry_key(key) -> str:
+        kind, issue_id = key
+        return f"issue-tracker:{kind}:{issue_id}"
+
+    @staticmethod
+    def _generation_key(issue_id: int) -> str:
+        return f"issue-tracker:generation:{issue_id}"
+
+    def _count(self, counter: str, amount: int = 1):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + amount)
+
+    def get(self, key) -> Optional[CachedResponse]:
+        value = run_blocking(self._client.get, self._entry_key(key))
+        if value is None:
+            self._count("misses")
+            return None
+        self._count("hits")
+        etag, next_cursor, body = value.split(b"\n", 2)
+        return CachedResponse(
+            etag=etag.decode(), body=body, next_cursor=next_cursor.decode() or None
+        )
+
+    def fill_token(self, key) -> int:
+        _, issue_id = key
+        return int(run_blocking(self._client.get, self._generation_key(issue_id)) or 0)
+
+    def set(self, key, response: CachedResponse, fill_token: int) -> CachedResponse:
+        _, issue_id = key
+        run_blocking(
+            self._set_if_current,
+            keys=[self._entry_key(key), self._generation_key(issue_id)],
+            args=[
+                fill_token,
+                b"\n".join(
+                    (
+                        response.etag.encode(),
+                        (response.next_cursor or "").encode(),
+                        response.body,
+                    )
+                ),
+                int(self.ttl_seconds * 1000),
+            ],
+        )
+        return response
+
+    def invalidate_issues(self, issue_ids):
+        pipeline = self._client.pipeline(transaction=False)
+        for issue_id in issue_ids:
+            generation_key = self._generation_key(issue_id)
+            pipeline.incr(generation_key)
+            # Outlives any fill started before the invalidation
+            pipeline.pexpire(generation_key, int(self.ttl_seconds * 2000))
+            pipeline.delete(
+                self._entry_key((ISSUE, issue_id)), self._entry_key((TIMELINE, issue_id))
+            )
+        run_blocking(pipeline.execute)
+        self._count("invalidations", len(issue_ids))
+
+    def clear(self):
+        # Entries are shared and invalidated in Redis itself, nothing is local
+        pass
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "backend": RESPONSE_CACHE_BACKEND,
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+            }
+
+
+def create_response_cache():
+    if RESPONSE_CACHE_BACKEND == "redis":
+        return RedisResponseCache(RESPONSE_CACHE_REDIS_URL, RESPONSE_CACHE_TTL_SECONDS)
+    if RESPONSE_CACHE_BACKEND in ("memory", "postgres"):
+        return MemoryResponseCache(
+            RESPONSE_CACHE_TTL_SECONDS, RESPONSE_CACHE_MAX_ENTRIES
+        )
+    raise ValueError(f"Unknown RESPONSE_CACHE_BACKEND: {RESPONSE_CACHE_BACKEND}")
+
+
+response_cache = create_response_cache()
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison, as required for If-None-Match
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in if_none_match.split(",")
+    )
+
+
+def cached_json_response(request: Request, cached: CachedResponse) -> Response:
+    """Serve a cached payload, or 304 if the client already holds this version."""
+    headers = {"ETag": cached.etag}
+    if cached.next_cursor:
+        headers["X-Next-Cursor"] = cached.next_cursor
+    if etag_matches(request, cached.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=cached.body, media_type="application/json", headers=headers)
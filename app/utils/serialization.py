@@ -0,0 +1,24 @@
+import orjson
+
+
+def schema_columns(model, schema) -> tuple:
+    """The columns of `model` behind the fields of `schema`, in field order."""
+    return tuple(getattr(model, name) for name in schema.model_fields)
+
+
+def column_names(columns) -> tuple:
+    return tuple(column.key for column in columns)
+
+
+def rows_to_dicts(fields, rows) -> list:
+    """Plain dicts of column rows, for responses serialized without Pydantic.
+
+    Rows may select more columns than `fields` after them, e.g. for a cursor;
+    only the leading ones are kept.
+    """
+    return [dict(zip(fields, row)) for row in rows]
+
+
+def dump_json(content) -> bytes:
+    """JSON bytes of plain data; datetimes become ISO 8601 like Pydantic's."""
+    return orjson.dumps(content)
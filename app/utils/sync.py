@@ -0,0 +1,155 @@
+import base64
+import json
+import os
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, insert, text, tuple_
+
+from app.models.sync import DeletedRecord
+
+# Rows of each kind (issues, comments, label assignments, tombstones) per page
+SYNC_PAGE_SIZE = int(os.getenv("SYNC_PAGE_SIZE", "1000"))
+# Days tombstones are kept; older sync tokens are rejected (0 keeps everything)
+SYNC_TOMBSTONE_RETENTION_DAYS = int(
+    os.getenv("SYNC_TOMBSTONE_RETENTION_DAYS", "30")
+)
+
+SYNC_KINDS = ("issues", "comments", "label_assignments", "tombstones")
+
+
+class InvalidSyncTokenError(ValueError):
+    pass
+
+
+class ExpiredSyncTokenError(ValueError):
+    pass
+
+
+class SyncToken:
+    """Position of a client in the stream of committed writes.
+
+    Rows are stamped with the id of the transaction that wrote them. A sync
+    returns the rows written by transactions in the window ``[low, high)``,
+    where ``high`` is the oldest transaction still running when the window was
+    opened: everything below it has committed or rolled back, so nothing can
+    appear in the window later. The next window starts at ``high``. Within a
+    window each kind is read in ``(sync_xid, key)`` order; ``positions`` holds
+    where each unfinished kind stopped (empty if it has not started).
+    """
+
+    def __init__(self, low, high=None, low_at=None, high_at=None, positions=None):
+        self.low = low
+        self.high = high
+        self.low_at = low_at
+        self.high_at = high_at
+        self.positions = positions
+
+    def encode(self) -> str:
+        payload = {"l": self.low, "la": self.low_at.isoformat()}
+        if self.high is not None:
+            payload["h"] = self.high
+            payload["ha"] = self.high_at.isoformat()
+            payload["p"] = self.positions
+        payload = json.dumps(payload, separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+    @classmethod
+    def decode(cls, token: str) -> "SyncToken":
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(token.encode("ascii")))
+            sync_token = cls(
+                int(payload["l"]), low_at=datetime.fromisoformat(payload["la"])
+            )
+            if "h" in payload:
+                sync_token.high = int(payload["h"])
+                sync_token.high_at = datetime.fromisoformat(payload["ha"])
+                sync_token.positions = {
+                    kind: [int(value) for value in position]
+                    for kind, position in payload["p"].items()
+                    if kind in SYNC_KINDS
+                }
+        except (ValueError, KeyError, TypeError, AttributeError):
+            raise InvalidSyncTokenError("Invalid sync token")
+
+        if SYNC_TOMBSTONE_RETENTION_DAYS > 0 and sync_token.low_at < (
+            datetime.utcnow() - timedelta(days=SYNC_TOMBSTONE_RETENTION_DAYS)
+        ):
+            # Deletions since then may already be forgotten
+            raise ExpiredSyncTokenError("Sync token expired")
+        return sync_token
+
+
+def commit_horizon(db) -> int:
+    """Oldest running transaction id: every transaction below it has ended."""
+    return db.execute(
+        text("SELECT pg_snapshot_xmin(pg_current_snapshot())::text::bigint")
+    ).scalar()
+
+
+def open_sync_window(db, token: SyncToken = None) -> SyncToken:
+    """Start the window after `token`, or the first one of a full sync."""
+    high = commit_horizon(db)
+    now = datetime.utcnow()
+    if token is None:
+        token = SyncToken(0, low_at=now)
+    kinds = SYNC_KINDS
+    if token.low == 0:
+        # A full sync has nothing to delete on the client
+        kinds = tuple(kind for kind in SYNC_KINDS if kind != "tombstones")
+    return SyncToken(token.low, high, token.low_at, now, {kind: [] for kind in kinds})
+
+
+def fetch_sync_page(db, token: SyncToken, kind: str, statement, key) -> list:
+    """The next page of `kind` in the window of `token`.
+
+    `statement` selects the `key` columns, the first being ``sync_xid``.
+    Advances ``token.positions``, dropping `kind` once it is exhausted.
+    """
+    if kind not in token.positions:
+        return []
+    position = token.positions[kind]
+    statement = statement.where(key[0] >= token.low, key[0] < token.high)
+    if position:
+        statement = statement.where(tuple_(*key) > tuple_(*position))
+    rows = db.execute(statement.order_by(*key).limit(SYNC_PAGE_SIZE + 1)).all()
+    if len(rows) > SYNC_PAGE_SIZE:
+        rows = rows[:SYNC_PAGE_SIZE]
+        token.positions[kind] = [getattr(rows[-1], column.key) for column in key]
+    else:
+        del token.positions[kind]
+    return rows
+
+
+def next_sync_token(token: SyncToken) -> str:
+    """Token for the rest of the window, or for the window after it."""
+    if token.positions:
+        return token.encode()
+    return SyncToken(token.high, low_at=token.high_at).encode()
+
+
+def record_label_removals(db, removed):
+    """Leave tombstones for the (issue_id, label_id) pairs just removed."""
+    if removed:
+        db.execute(
+            insert(DeletedRecord),
+            [
+                {
+                    "record_type": "issue_label",
+                    "issue_id": issue_id,
+                    "record_id": label_id,
+                }
+                for issue_id, label_id in removed
+            ],
+        )
+
+
+def expire_tombstones(db, now: datetime = None) -> int:
+    """Delete tombstones older than the retention; returns how many."""
+    if SYNC_TOMBSTONE_RETENTION_DAYS <= 0:
+        return 0
+    cutoff = (now or datetime.utcnow()) - timedelta(
+        days=SYNC_TOMBSTONE_RETENTION_DAYS
+    )
+    return db.execute(
+        delete(DeletedRecord).where(DeletedRecord.deleted_at < cutoff)
+    ).rowcount
@@ -1,4 +1,36 @@
+import logging
+import os
+import threading
+from collections import deque
+from datetime import datetime
+
+from sqlalchemy import event, insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.database import sessionLocal
 from app.models.issue_event import IssueEvent
+from app.utils.cache_invalidation import invalidate_issues
+
+# transactional: events are written in one INSERT when the request commits
+# buffered: committed events go to an in-memory ring buffer that a background
+#   writer drains; a crash loses at most TIMELINE_BUFFER_SIZE events, and a full
+#   buffer drops its oldest events (counted in /metrics/timeline-events)
+TIMELINE_EVENT_MODE = os.getenv("TIMELINE_EVENT_MODE", "transactional")
+TIMELINE_BUFFER_SIZE = int(os.getenv("TIMELINE_BUFFER_SIZE", "10000"))
+TIMELINE_FLUSH_INTERVAL_SECONDS = float(
+    os.getenv("TIMELINE_FLUSH_INTERVAL_SECONDS", "0.5")
+)
+TIMELINE_FLUSH_BATCH_SIZE = int(os.getenv("TIMELINE_FLUSH_BATCH_SIZE", "1000"))
+
+if TIMELINE_EVENT_MODE not in ("transactional", "buffered"):
+    raise ValueError(f"Unknown TIMELINE_EVENT_MODE: {TIMELINE_EVENT_MODE}")
+
+PENDING_EVENTS = "pending_issue_events"
+# Number of pending events when each open savepoint began
+SAVEPOINT_EVENT_MARKS = "savepoint_issue_event_marks"
+
+logger = logging.getLogger(__name__)
 
 
 def log_issue_event(
@@ -8,10 +40,170 @@ def log_issue_event(
     old_value: str = None,
     new_value: str = None,
 ):
-    event = IssueEvent(
-        issue_id=issue_id,
-        event_type=event_type,
-        old_value=old_value,
-        new_value=new_value,
+    """Record a timeline event for the current transaction of `db_session`.
+
+    Nothing is written here: the events of a transaction are inserted together
+    when it commits, and dropped if it rolls back. Call it before committing.
+    """
+    db_session.info.setdefault(PENDING_EVENTS, []).append(
+        {
+            "issue_id": issue_id,
+            "event_type": event_type,
+            "old_value": old_value,
+            "new_value": new_value,
+            "created_at": datetime.utcnow(),
+        }
+    )
+
+
+@event.listens_for(Session, "before_commit")
+def _write_events(session):
+    # Also fires when a savepoint is released; its events wait for the outer
+    # transaction
+    if TIMELINE_EVENT_MODE != "transactional" or session.in_nested_transaction():
+        return
+    events = session.info.pop(PENDING_EVENTS, None)
+    if events:
+        # The issues the events point at may still be pending
+        session.flush()
+        session.execute(insert(IssueEvent), events)
+
+
+@event.listens_for(Session, "after_commit")
+def _buffer_events(session):
+    if session.in_nested_transaction():
+        return
+    session.info.pop(SAVEPOINT_EVENT_MARKS, None)
+    events = session.info.pop(PENDING_EVENTS, None)
+    if events:
+        event_buffer.extend(events)
+
+
+@event.listens_for(Session, "after_transaction_create")
+def _mark_savepoint(session, transaction):
+    if transaction.nested:
+        session.info.setdefault(SAVEPOINT_EVENT_MARKS, {})[transaction] = len(
+            session.info.get(PENDING_EVENTS, ())
+        )
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_events(session, previous_transaction):
+    if not previous_transaction.nested:
+        session.info.pop(SAVEPOINT_EVENT_MARKS, None)
+        session.info.pop(PENDING_EVENTS, None)
+        return
+    # A rolled back savepoint only discards the events recorded inside it; the
+    # outer transaction's events still commit
+    mark = session.info.get(SAVEPOINT_EVENT_MARKS, {}).pop(previous_transaction, 0)
+    del session.info.get(PENDING_EVENTS, [])[mark:]
+
+
+class EventBuffer:
+    """Bounded ring buffer of committed events waiting for the writer."""
+
+    def __init__(self, max_events: int):
+        self.max_events = max_events
+        self.buffered = 0
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        self._events = deque()
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+
+    def extend(self, events):
+        with self._lock:
+            self._events.extend(events)
+            self.buffered += len(events)
+            overflow = len(self._events) - self.max_events
+            for _ in range(max(overflow, 0)):
+                self._events.popleft()
+            self.dropped += max(overflow, 0)
+            if len(self._events) >= TIMELINE_FLUSH_BATCH_SIZE:
+                self._ready.set()
+
+    def take(self, limit: int) -> list:
+        with self._lock:
+            batch = [
+                self._events.popleft()
+                for _ in range(min(limit, len(self._events)))
+            ]
+            if not self._events:
+                self._ready.clear()
+            return batch
+
+    def wait(self, timeout: float):
+        self._ready.wait(timeout)
+
+    def count(self, counter: str, amount: int):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + amount)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "mode": TIMELINE_EVENT_MODE,
+                "pending": len(self._events),
+                "capacity": self.max_events,
+                "buffered": self.buffered,
+                "written": self.written,
+                "dropped": self.dropped,
+                "failed": self.failed,
+            }
+
+
+event_buffer = EventBuffer(TIMELINE_BUFFER_SIZE)
+
+
+def flush_event_buffer():
+    """Write every buffered event, one INSERT per batch."""
+    while True:
+        batch = event_buffer.take(TIMELINE_FLUSH_BATCH_SIZE)
+        if not batch:
+            return
+        db = sessionLocal()
+        try:
+            db.execute(insert(IssueEvent), batch)
+            # Cached timelines were invalidated before these events existed
+            invalidate_issues(db, {row["issue_id"] for row in batch})
+            db.commit()
+            event_buffer.count("written", len(batch))
+        except SQLAlchemyError:
+            db.rollback()
+            event_buffer.count("failed", len(batch))
+            logger.exception("Dropped %d timeline events", len(batch))
+        finally:
+            db.close()
+
+
+def _write_buffered_events(stop: threading.Event):
+    while not stop.is_set():
+        event_buffer.wait(TIMELINE_FLUSH_INTERVAL_SECONDS)
+        flush_event_buffer()
+    flush_event_buffer()
+
+
+_writer_stop = threading.Event()
+_writer = None
+
+
+def start_event_writer():
+    global _writer
+    if TIMELINE_EVENT_MODE != "buffered":
+        return
+    _writer_stop.clear()
+    _writer = threading.Thread(
+        target=_write_buffered_events,
+        args=(_writer_stop,),
+        name="timeline-event-writer",
+        daemon=True,
     )
-    db_session.add(event)
+    _writer.start()
+
+
+def stop_event_writer():
+    """Stop the writer after it has written what is still buffered."""
+    _writer_stop.set()
+    if _writer is not None:
+        _writer.join()
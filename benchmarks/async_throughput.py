@@ -0,0 +1,111 @@
+"""Throughput of the blocking vs the asyncpg request path (DATABASE_ASYNC).
+
+Starts the API with uvicorn twice, first with DATABASE_ASYNC=false and then
+with DATABASE_ASYNC=true, and for each run keeps --concurrency clients
+sending GET requests to --path for --duration seconds. Reports requests per
+second and p50/p99 latency of both runs. Uses the database of DATABASE_URL,
+which should hold some issues (e.g. from a CSV import).
+
+    python -m benchmarks.async_throughput [--path /issues/?page_size=20]
+        [--concurrency 64] [--duration 10] [--port 8765]
+"""
+
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import time
+
+import httpx
+
+
+def percentile(values, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+def start_server(port: int, database_async: bool) -> subprocess.Popen:
+    env = {**os.environ, "DATABASE_ASYNC": "true" if database_async else "false"}
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "app.main:app",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+        ],
+        env=env,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/docs").raise_for_status()
+            return server
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    server.terminate()
+    raise RuntimeError("The API did not start")
+
+
+async def client_loop(client, path: str, deadline: float, latencies: list):
+    while time.monotonic() < deadline:
+        start = time.perf_counter()
+        response = await client.get(path)
+        response.raise_for_status()
+        latencies.append(time.perf_counter() - start)
+
+
+async def load(base_url: str, path: str, concurrency: int, duration: float) -> list:
+    latencies = []
+    limits = httpx.Limits(max_connections=concurrency)
+    client = httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60)
+    async with client:
+        # One warm-up request per connection
+        await asyncio.gather(*(client.get(path) for _ in range(concurrency)))
+        deadline = time.monotonic() + duration
+        await asyncio.gather(
+            *(
+                client_loop(client, path, deadline, latencies)
+                for _ in range(concurrency)
+            )
+        )
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--path", default="/issues/?page_size=20")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    print(f"GET {args.path}, {args.concurrency} clients for {args.duration:g}s")
+    print(f"{'path':<10}{'req/s':>10}{'p50':>10}{'p99':>10}")
+    for name, database_async in (("sync", False), ("async", True)):
+        server = start_server(args.port, database_async)
+        try:
+            latencies = asyncio.run(
+                load(
+                    f"http://127.0.0.1:{args.port}",
+                    args.path,
+                    args.concurrency,
+                    args.duration,
+                )
+            )
+        finally:
+            server.terminate()
+            server.wait()
+        print(
+            f"{name:<10}{len(latencies) / args.duration:>10.0f}"
+            f"{percentile(latencies, 0.5) * 1000:>8.1f}ms"
+            f"{percentile(latencies, 0.99) * 1000:>8.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
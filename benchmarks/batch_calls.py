@@ -0,0 +1,101 @@
+"""N single create/update calls vs one POST /issues/batch call.
+
+Creates --operations issues with one POST /issues/ each, then updates each of
+them with one PATCH /issues/{id} each, and does the same with
+POST /issues/batch calls of up to BATCH_MAX_OPERATIONS creates, then updates,
+each. Reports the wall time and operations per second of both. Needs the API
+running at --base-url.
+
+    python -m benchmarks.batch_calls [--operations 10000]
+"""
+
+import argparse
+import time
+
+import httpx
+
+from app.schemas.issue import BATCH_MAX_OPERATIONS
+
+
+def chunks(items: list) -> list:
+    return [
+        items[i : i + BATCH_MAX_OPERATIONS]
+        for i in range(0, len(items), BATCH_MAX_OPERATIONS)
+    ]
+
+
+def single_calls(client, count: int) -> tuple:
+    start = time.perf_counter()
+    issues = []
+    for index in range(count):
+        response = client.post("/issues/", json={"title": f"Single call issue {index}"})
+        response.raise_for_status()
+        issues.append(response.json())
+    created = time.perf_counter()
+    for issue in issues:
+        response = client.patch(
+            f"/issues/{issue['id']}",
+            json={"version": issue["version"], "priority": "high"},
+        )
+        response.raise_for_status()
+    return created - start, time.perf_counter() - created
+
+
+def batch_calls(client, count: int) -> tuple:
+    start = time.perf_counter()
+    results = []
+    for indexes in chunks(list(range(count))):
+        response = client.post(
+            "/issues/batch",
+            json={
+                "operations": [
+                    {"op": "create", "title": f"Batch call issue {index}"}
+                    for index in indexes
+                ]
+            },
+        )
+        response.raise_for_status()
+        results.extend(response.json()["results"])
+    assert all(result["result"] == "created" for result in results)
+    created = time.perf_counter()
+    for chunk in chunks(results):
+        response = client.post(
+            "/issues/batch",
+            json={
+                "operations": [
+                    {
+                        "op": "update",
+                        "issue_id": result["issue"]["id"],
+                        "version": result["issue"]["version"],
+                        "priority": "high",
+                    }
+                    for result in chunk
+                ]
+            },
+        )
+        response.raise_for_status()
+        assert response.json()["updated_count"] == len(chunk)
+    return created - start, time.perf_counter() - created
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--operations", type=int, default=10000)
+    args = parser.parse_args()
+    count = args.operations
+
+    print(f"{count} creates and {count} updates")
+    print(f"{'calls':<10}{'create':>12}{'update':>12}{'ops/s':>10}")
+    with httpx.Client(base_url=args.base_url, timeout=120) as client:
+        for name, calls in (("single", single_calls), ("batch", batch_calls)):
+            create_seconds, update_seconds = calls(client, count)
+            print(
+                f"{name:<10}{create_seconds * 1000:>10.0f}ms"
+                f"{update_seconds * 1000:>10.0f}ms"
+                f"{count * 2 / (create_seconds + update_seconds):>10.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
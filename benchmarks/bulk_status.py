@@ -0,0 +1,101 @@
+"""Profile POST /issues/bulk-status on a large set of issues.
+
+Seeds --issues open issues inside a transaction, then resolves all of them
+with one POST /issues/bulk-status on a session joined to that transaction and
+reports the request time and the time of each statement it ran. The
+transaction is rolled back at the end, so the database configured in
+DATABASE_URL is left as it was (the final COMMIT is not measured).
+
+    python -m benchmarks.bulk_status [--issues 50000] [--status resolved]
+"""
+
+import argparse
+import time
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from app.database import engine, get_db
+from app.main import app
+
+SEED_ISSUES = text(
+    """
+    INSERT INTO issues (title, description, status, priority, version,
+                        created_at, updated_at)
+    SELECT 'Bulk status issue ' || n, 'Seeded description', 'open',
+           (ARRAY['low', 'medium', 'high', 'critical'])[1 + n % 4], 1,
+           now() - n * interval '1 minute',
+           now() - n * interval '1 minute'
+    FROM generate_series(1, :issues) AS n
+    RETURNING id
+    """
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--issues", type=int, default=50000)
+    parser.add_argument(
+        "--status", default="resolved", choices=("in_progress", "resolved")
+    )
+    args = parser.parse_args()
+
+    timings = []
+
+    def before(conn, cursor, statement, parameters, context, executemany):
+        conn.info["statement_start"] = time.perf_counter()
+
+    def after(conn, cursor, statement, parameters, context, executemany):
+        seconds = time.perf_counter() - conn.info.pop("statement_start")
+        timings.append((seconds, " ".join(statement.split())))
+
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        try:
+            issue_ids = connection.execute(
+                SEED_ISSUES, {"issues": args.issues}
+            ).scalars().all()
+            connection.execute(text("ANALYZE issues"))
+
+            def seeded_session():
+                session = Session(
+                    bind=connection, join_transaction_mode="create_savepoint"
+                )
+                try:
+                    yield session
+                finally:
+                    session.close()
+
+            app.dependency_overrides[get_db] = seeded_session
+            # Not entered as a context manager: the app's background threads
+            # are not started
+            client = TestClient(app)
+            event.listen(connection, "before_cursor_execute", before)
+            event.listen(connection, "after_cursor_execute", after)
+            start = time.perf_counter()
+            try:
+                response = client.post(
+                    "/issues/bulk-status",
+                    json={"issue_ids": issue_ids, "status": args.status},
+                )
+            finally:
+                elapsed = time.perf_counter() - start
+                event.remove(connection, "before_cursor_execute", before)
+                event.remove(connection, "after_cursor_execute", after)
+            assert response.status_code == 200, response.text
+            assert response.json()["updated_count"] == args.issues
+        finally:
+            app.dependency_overrides.clear()
+            transaction.rollback()
+
+    statement_seconds = sum(seconds for seconds, _ in timings)
+    print(f"{args.issues} issues set to {args.status}: {elapsed * 1000:.0f}ms")
+    print(f"{'ms':>8}  statement")
+    for seconds, statement in timings:
+        print(f"{seconds * 1000:>8.1f}  {statement[:100]}")
+    print(f"{(elapsed - statement_seconds) * 1000:>8.1f}  (outside the database)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Timeline event writes: one INSERT per event vs one batched INSERT.
+
+Commits --transactions transactions of --events-per-transaction events each,
+the way a request logs its timeline events, with three write paths:
+
+- per-event: one INSERT statement per event, as it is executed
+- orm-add: IssueEvent objects added to the session and flushed on commit, the
+  path log_issue_event used before events were batched
+- batched: log_issue_event, whose before_commit hook writes every event of
+  the transaction in one INSERT (TIMELINE_EVENT_MODE=transactional)
+
+Uses the database of DATABASE_URL. The events go to a throwaway issue that is
+deleted, with its events, at the end.
+
+    python -m benchmarks.event_inserts [--transactions 500]
+        [--events-per-transaction 4]
+"""
+
+import argparse
+import time
+
+from sqlalchemy import delete, insert
+
+from app.database import sessionLocal
+from app.models.issue import Issue
+from app.models.issue_event import IssueEvent
+from app.utils.timeline import TIMELINE_EVENT_MODE, log_issue_event
+
+
+def event_values(issue_id: int, index: int) -> dict:
+    return {
+        "issue_id": issue_id,
+        "event_type": "status updated",
+        "old_value": "open",
+        "new_value": f"in_progress {index}",
+    }
+
+
+def per_event(db, issue_id: int, count: int):
+    for index in range(count):
+        db.execute(insert(IssueEvent).values(**event_values(issue_id, index)))
+
+
+def orm_add(db, issue_id: int, count: int):
+    for index in range(count):
+        db.add(IssueEvent(**event_values(issue_id, index)))
+
+
+def batched(db, issue_id: int, count: int):
+    for index in range(count):
+        log_issue_event(db_session=db, **event_values(issue_id, index))
+
+
+def run(write, issue_id: int, transactions: int, events: int) -> float:
+    """Seconds taken to commit every transaction."""
+    db = sessionLocal()
+    try:
+        start = time.perf_counter()
+        for _ in range(transactions):
+            write(db, issue_id, events)
+            db.commit()
+        return time.perf_counter() - start
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--transactions", type=int, default=500)
+    parser.add_argument("--events-per-transaction", type=int, default=4)
+    args = parser.parse_args()
+    if TIMELINE_EVENT_MODE != "transactional":
+        parser.error("Run with TIMELINE_EVENT_MODE=transactional")
+
+    db = sessionLocal()
+    issue = Issue(title="Timeline event insert benchmark")
+    db.add(issue)
+    db.commit()
+    issue_id = issue.id
+    db.close()
+
+    total = args.transactions * args.events_per_transaction
+    print(
+        f"{args.transactions} transactions of "
+        f"{args.events_per_transaction} events each"
+    )
+    print(f"{'path':<12}{'events/s':>10}{'per txn':>12}")
+    try:
+        for name, write in (
+            ("per-event", per_event),
+            ("orm-add", orm_add),
+            ("batched", batched),
+        ):
+            # Warm up connections and statement caches
+            run(write, issue_id, 10, args.events_per_transaction)
+            seconds = run(
+                write, issue_id, args.transactions, args.events_per_transaction
+            )
+            print(
+                f"{name:<12}{total / seconds:>10.0f}"
+                f"{seconds / args.transactions * 1000:>10.2f}ms"
+            )
+    finally:
+        db = sessionLocal()
+        db.execute(delete(IssueEvent).where(IssueEvent.issue_id == issue_id))
+        db.execute(delete(Issue).where(Issue.id == issue_id))
+        db.commit()
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
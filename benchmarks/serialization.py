@@ -0,0 +1,204 @@
+"""Micro-benchmarks of list response serialization.
+
+Times building the JSON body of one page for GET /issues/ (get_issue),
+GET /issues/{id}/comments/ (list_comments) and GET /issues/{id}/timeline
+(get_issue_timeline) from the column rows those endpoints select, next to the
+Pydantic path they used before: ORM objects validated through the response
+models, then encoded by FastAPI's JSONResponse. No database is needed.
+
+    python -m benchmarks.serialization [--rows 100] [--description-size 4000]
+"""
+
+import argparse
+import json
+import os
+import timeit
+from datetime import datetime, timedelta
+
+# The engine is created at import but never connected
+os.environ.setdefault("DATABASE_URL", "postgresql://localhost/benchmarks")
+
+from fastapi.responses import JSONResponse, ORJSONResponse  # noqa: E402
+
+from app.models.comment import Comment  # noqa: E402
+from app.models.issue import Issue  # noqa: E402
+from app.models.issue_event import IssueEvent  # noqa: E402
+from app.routers.comments import COMMENT_FIELDS  # noqa: E402
+from app.routers.issues import ISSUE_FIELDS, TIMELINE_FIELDS  # noqa: E402
+from app.schemas.comment import CommentListResponse  # noqa: E402
+from app.schemas.issue import (  # noqa: E402
+    ExpandedIssueResponse,
+    IssueEventResponse,
+    IssueListResponse,
+    IssueResponse,
+)
+from app.utils.serialization import dump_json, rows_to_dicts  # noqa: E402
+
+# Fields a client listing issues without their descriptions asks for
+SPARSE_FIELDS = tuple(name for name in ISSUE_FIELDS if name != "description")
+
+
+def make_rows(count: int, description_size: int) -> dict:
+    now = datetime(2026, 10, 18, 12, 0, 0, 123456)
+    description = ("lorem ipsum dolor sit amet " * description_size)[:description_size]
+    issues = [
+        (
+            index,
+            f"Issue number {index}",
+            description,
+            "open",
+            "medium",
+            index % 7 or None,
+            3,
+            now - timedelta(minutes=index),
+            now,
+            None,
+        )
+        for index in range(1, count + 1)
+    ]
+    comments = [
+        (index, "A comment body " * 20, 1, 2, now - timedelta(minutes=index))
+        for index in range(1, count + 1)
+    ]
+    events = [
+        (index, 1, "status updated", "open", "done", now + timedelta(seconds=index))
+        for index in range(1, count + 1)
+    ]
+    return {"issues": issues, "comments": comments, "events": events}
+
+
+def issues_orjson(rows, fields=ISSUE_FIELDS) -> bytes:
+    payload = {
+        "total": None,
+        "total_mode": "none",
+        "page": 1,
+        "page_size": len(rows),
+        "next_cursor": None,
+        "issues": rows_to_dicts(fields, rows),
+    }
+    return ORJSONResponse(payload).body
+
+
+def issues_pydantic(issues) -> bytes:
+    response = IssueListResponse(
+        total=None,
+        total_mode="none",
+        page=1,
+        page_size=len(issues),
+        next_cursor=None,
+        issues=[
+            ExpandedIssueResponse.model_validate(
+                IssueResponse.model_validate(issue).model_dump(), from_attributes=True
+            )
+            for issue in issues
+        ],
+    )
+    return JSONResponse(response.model_dump(mode="json", exclude_unset=True)).body
+
+
+def comments_orjson(rows) -> bytes:
+    payload = {
+        "total": None,
+        "total_mode": "none",
+        "page": 1,
+        "page_size": len(rows),
+        "comments": rows_to_dicts(COMMENT_FIELDS, rows),
+    }
+    return ORJSONResponse(payload).body
+
+
+def comments_pydantic(comments) -> bytes:
+    response = CommentListResponse(
+        total=None,
+        total_mode="none",
+        page=1,
+        page_size=len(comments),
+        comments=comments,
+    )
+    return JSONResponse(response.model_dump(mode="json")).body
+
+
+def timeline_orjson(rows) -> bytes:
+    return dump_json(rows_to_dicts(TIMELINE_FIELDS, rows))
+
+
+def timeline_pydantic(events) -> bytes:
+    return json.dumps(
+        [
+            IssueEventResponse.model_validate(event).model_dump(mode="json")
+            for event in events
+        ],
+        separators=(",", ":"),
+    ).encode()
+
+
+def best_time(function, *args, repeat: int = 5) -> float:
+    """Best seconds per call over `repeat` runs of at least 0.2s each."""
+    timer = timeit.Timer(lambda: function(*args))
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--description-size", type=int, default=4000)
+    args = parser.parse_args()
+    rows = make_rows(args.rows, args.description_size)
+
+    # The Pydantic paths start from the ORM objects the endpoints used to load
+    cases = [
+        (
+            "get_issue",
+            issues_pydantic,
+            issues_orjson,
+            Issue,
+            ISSUE_FIELDS,
+            rows["issues"],
+        ),
+        (
+            "list_comments",
+            comments_pydantic,
+            comments_orjson,
+            Comment,
+            COMMENT_FIELDS,
+            rows["comments"],
+        ),
+        (
+            "get_issue_timeline",
+            timeline_pydantic,
+            timeline_orjson,
+            IssueEvent,
+            TIMELINE_FIELDS,
+            rows["events"],
+        ),
+    ]
+    print(f"{args.rows} rows per page, {args.description_size}-character descriptions")
+    print(f"{'endpoint':<28}{'pydantic':>12}{'orjson':>12}{'speedup':>10}{'bytes':>10}")
+    for name, pydantic_path, orjson_path, model, fields, case_rows in cases:
+        objects = [model(**dict(zip(fields, row))) for row in case_rows]
+        # Both paths must produce the same document
+        body = orjson_path(case_rows)
+        assert json.loads(body) == json.loads(pydantic_path(objects)), name
+        before = best_time(pydantic_path, objects)
+        after = best_time(orjson_path, case_rows)
+        print(
+            f"{name:<28}{before * 1e6:>10.0f}us{after * 1e6:>10.0f}us"
+            f"{before / after:>9.1f}x{len(body):>10}"
+        )
+
+    # Rows as selected for fields=..., i.e. without the description column
+    sparse_rows = [
+        tuple(value for name, value in zip(ISSUE_FIELDS, row) if name in SPARSE_FIELDS)
+        for row in rows["issues"]
+    ]
+    sparse = issues_orjson(sparse_rows, SPARSE_FIELDS)
+    print(
+        f"{'get_issue fields=...':<28}{'':>12}"
+        f"{best_time(issues_orjson, sparse_rows, SPARSE_FIELDS) * 1e6:>10.0f}us"
+        f"{'':>10}{len(sparse):>10}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Concurrent PATCH /issues/{id} contention check and latency benchmark.
+
+Creates an issue, then for each round sends --concurrency PATCH requests that
+all carry the issue's current version. update_issue compares and swaps the
+version in one statement, so exactly one request per round must succeed (200)
+and every other one must get 409. Reports p50/p99 latency of the successful
+and the rejected requests. Needs the API running at --base-url.
+
+    python -m benchmarks.update_contention [--concurrency 50] [--rounds 20]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections import Counter
+
+import httpx
+
+
+def percentile(values, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+async def patch(client, issue_id: int, payload: dict):
+    start = time.perf_counter()
+    response = await client.patch(f"/issues/{issue_id}", json=payload)
+    return response.status_code, time.perf_counter() - start
+
+
+async def run(base_url: str, concurrency: int, rounds: int):
+    limits = httpx.Limits(max_connections=concurrency)
+    client = httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60)
+    async with client:
+        response = await client.post(
+            "/issues/", json={"title": "Update contention benchmark"}
+        )
+        response.raise_for_status()
+        issue = response.json()
+
+        latencies = {200: [], 409: []}
+        priorities = ("low", "medium", "high")
+        version = issue["version"]
+        for round_number in range(rounds):
+            results = await asyncio.gather(
+                *(
+                    patch(
+                        client,
+                        issue["id"],
+                        {
+                            "version": version,
+                            "priority": priorities[index % len(priorities)],
+                            "description": f"round {round_number} writer {index}",
+                        },
+                    )
+                    for index in range(concurrency)
+                )
+            )
+            codes = Counter(code for code, _ in results)
+            assert codes == {200: 1, 409: concurrency - 1}, (
+                f"round {round_number}: expected one 200 and "
+                f"{concurrency - 1} 409s, got {dict(codes)}"
+            )
+            for code, seconds in results:
+                latencies[code].append(seconds)
+            version += 1
+
+    print(
+        f"{rounds} rounds of {concurrency} concurrent PATCHes: "
+        f"one 200 and {concurrency - 1} 409s each"
+    )
+    print(f"{'outcome':<12}{'requests':>10}{'p50':>10}{'p99':>10}{'mean':>10}")
+    for code, name in ((200, "updated"), (409, "conflict")):
+        values = latencies[code]
+        if values:
+            print(
+                f"{name:<12}{len(values):>10}"
+                f"{percentile(values, 0.5) * 1000:>8.1f}ms"
+                f"{percentile(values, 0.99) * 1000:>8.1f}ms"
+                f"{statistics.fmean(values) * 1000:>8.1f}ms"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+    if args.concurrency < 2:
+        parser.error("--concurrency must be at least 2")
+    asyncio.run(run(args.base_url, args.concurrency, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Indexes for issue list filters, sorts and timelines
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 09:30:00
+
+Indexes are built with CREATE INDEX CONCURRENTLY so that large ``issues``,
+``comments`` and ``issue_events`` tables stay writable during the upgrade.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, Sequence[str], None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = [
+    ("ix_issues_created_at_id", "issues", ["created_at", "id"], None),
+    ("ix_issues_updated_at_id", "issues", ["updated_at", "id"], None),
+    ("ix_issues_status_id", "issues", ["status", "id"], None),
+    ("ix_issues_priority_id", "issues", ["priority", "id"], None),
+    ("ix_issues_status_created_at_id", "issues", ["status", "created_at", "id"], None),
+    (
+        "ix_issues_priority_created_at_id",
+        "issues",
+        ["priority", "created_at", "id"],
+        None,
+    ),
+    (
+        "ix_issues_assignee_id_updated_at_id",
+        "issues",
+        ["assignee_id", "updated_at", "id"],
+        None,
+    ),
+    (
+        "ix_issues_unresolved_created_at_id",
+        "issues",
+        ["created_at", "id"],
+        "resolved_at IS NULL",
+    ),
+    ("ix_comments_issue_id_created_at", "comments", ["issue_id", "created_at"], None),
+    (
+        "ix_issue_events_issue_id_created_at",
+        "issue_events",
+        ["issue_id", "created_at"],
+        None,
+    ),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_concurrently=True,
+                postgresql_where=sa.text(where) if where else None,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(
+                name, table_name=table, postgresql_concurrently=True, if_exists=True
+            )
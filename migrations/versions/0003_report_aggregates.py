@@ -0,0 +1,60 @@
+"""Incrementally maintained report aggregates
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 11:00:00
+
+Creates the per-assignee issue counts and the sharded resolution time totals
+behind /reports/top-assignees and /reports/average-latency, and backfills them
+from the existing issues.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, Sequence[str], None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "assignee_issue_counts",
+        sa.Column("assignee_id", sa.Integer(), nullable=False),
+        sa.Column("issue_count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["assignee_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("assignee_id"),
+    )
+    op.create_table(
+        "resolution_stats",
+        sa.Column("shard", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("resolved_count", sa.BigInteger(), nullable=False),
+        sa.Column("total_resolution_seconds", sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint("shard"),
+    )
+
+    op.execute("""
+        INSERT INTO assignee_issue_counts (assignee_id, issue_count)
+        SELECT assignee_id, COUNT(id)
+        FROM issues
+        WHERE assignee_id IS NOT NULL
+        GROUP BY assignee_id
+        """)
+    op.execute("""
+        INSERT INTO resolution_stats (shard, resolved_count, total_resolution_seconds)
+        SELECT 0, COUNT(id),
+               COALESCE(SUM(EXTRACT(epoch FROM resolved_at - created_at)), 0)
+        FROM issues
+        WHERE resolved_at IS NOT NULL
+        """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("resolution_stats")
+    op.drop_table("assignee_issue_counts")
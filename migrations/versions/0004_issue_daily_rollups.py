@@ -0,0 +1,75 @@
+"""Daily issue rollups for the bucketed reports
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 12:00:00
+
+Creates the per-day, per-priority, per-assignee created/resolved counts behind
+/reports/throughput and /reports/backlog and backfills them from the existing
+issues, then adds the partial index on resolved issues used by
+/reports/resolution-latency (built CONCURRENTLY).
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, Sequence[str], None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "issue_daily_rollups",
+        sa.Column("bucket_date", sa.Date(), nullable=False),
+        sa.Column("priority", sa.String(length=20), nullable=False),
+        sa.Column("assignee_id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("created_count", sa.Integer(), nullable=False),
+        sa.Column("resolved_count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("bucket_date", "priority", "assignee_id"),
+    )
+
+    op.execute("""
+        INSERT INTO issue_daily_rollups
+            (bucket_date, priority, assignee_id, created_count, resolved_count)
+        SELECT day, priority, assignee_id, SUM(created), SUM(resolved)
+        FROM (
+            SELECT CAST(created_at AS DATE) AS day, priority,
+                   COALESCE(assignee_id, 0) AS assignee_id,
+                   1 AS created, 0 AS resolved
+            FROM issues
+            UNION ALL
+            SELECT CAST(resolved_at AS DATE), priority,
+                   COALESCE(assignee_id, 0), 0, 1
+            FROM issues
+            WHERE resolved_at IS NOT NULL
+        ) AS activity
+        GROUP BY day, priority, assignee_id
+        """)
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_issues_resolved_at_id",
+            "issues",
+            ["resolved_at", "id"],
+            postgresql_concurrently=True,
+            postgresql_where=sa.text("resolved_at IS NOT NULL"),
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_issues_resolved_at_id",
+            table_name="issues",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_table("issue_daily_rollups")
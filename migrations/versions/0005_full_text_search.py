@@ -0,0 +1,75 @@
+"""Full-text search columns for issues and comments
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 13:00:00
+
+Adds generated ``search_vector`` tsvector columns to ``issues`` (weighted
+title and description) and ``comments`` (content) for GET /issues/search,
+with GIN indexes built CONCURRENTLY. Adding a stored generated column
+rewrites the table under an exclusive lock, so schedule this upgrade for a
+maintenance window on large databases.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, Sequence[str], None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SEARCH_COLUMNS = [
+    (
+        "issues",
+        "ix_issues_search_vector",
+        "setweight(to_tsvector('english', coalesce(title, '')), 'A')"
+        " || setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+    ),
+    (
+        "comments",
+        "ix_comments_search_vector",
+        "to_tsvector('english', content)",
+    ),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, _, expression in SEARCH_COLUMNS:
+        op.add_column(
+            table,
+            sa.Column(
+                "search_vector",
+                postgresql.TSVECTOR(),
+                sa.Computed(expression, persisted=True),
+                nullable=True,
+            ),
+        )
+
+    with op.get_context().autocommit_block():
+        for table, index, _ in SEARCH_COLUMNS:
+            op.create_index(
+                index,
+                table,
+                ["search_vector"],
+                postgresql_using="gin",
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for table, index, _ in reversed(SEARCH_COLUMNS):
+            op.drop_index(
+                index, table_name=table, postgresql_concurrently=True, if_exists=True
+            )
+    for table, _, _ in reversed(SEARCH_COLUMNS):
+        op.drop_column(table, "search_vector")
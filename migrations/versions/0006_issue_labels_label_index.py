@@ -0,0 +1,43 @@
+"""Index issue_labels by label for label filters
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18 14:00:00
+
+The primary key ``(issue_id, label_id)`` only serves issue -> labels lookups.
+``labels=`` / ``labels_all=`` on GET /issues/ also go label -> issues, so add
+``(label_id, issue_id)``, built CONCURRENTLY.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: Union[str, Sequence[str], None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_issue_labels_label_id_issue_id",
+            "issue_labels",
+            ["label_id", "issue_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_issue_labels_label_id_issue_id",
+            table_name="issue_labels",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
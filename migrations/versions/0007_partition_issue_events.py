@@ -0,0 +1,138 @@
+"""Partition issue_events by month
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18 15:00:00
+
+Recreates ``issue_events`` as a table partitioned by range of ``created_at``,
+with one partition per month from the oldest event to a few months ahead plus
+a default partition; the app keeps creating new months and expires old ones
+(see app/utils/event_partitions.py). The primary key becomes
+``(id, created_at)``, as PostgreSQL requires the partition key in it, and the
+timeline index gains ``id`` for keyset pagination. Every event is copied, so
+schedule this upgrade for a maintenance window on large databases.
+"""
+
+from datetime import date, datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0007"
+down_revision: Union[str, Sequence[str], None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+MONTHS_AHEAD = 3
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index("ix_issue_events_issue_id_created_at", table_name="issue_events")
+    op.drop_index("ix_issue_events_id", table_name="issue_events")
+    op.rename_table("issue_events", "issue_events_unpartitioned")
+    op.execute(
+        "ALTER TABLE issue_events_unpartitioned "
+        "RENAME CONSTRAINT issue_events_pkey TO issue_events_unpartitioned_pkey"
+    )
+
+    op.create_table(
+        "issue_events",
+        sa.Column(
+            "id",
+            sa.Integer(),
+            server_default=sa.text("nextval('issue_events_id_seq'::regclass)"),
+            nullable=False,
+        ),
+        sa.Column("issue_id", sa.Integer(), nullable=False),
+        sa.Column("event_type", sa.String(length=50), nullable=False),
+        sa.Column("old_value", sa.String(length=255), nullable=True),
+        sa.Column("new_value", sa.String(length=255), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["issue_id"], ["issues.id"]),
+        sa.PrimaryKeyConstraint("id", "created_at"),
+        postgresql_partition_by="RANGE (created_at)",
+    )
+    op.execute("ALTER SEQUENCE issue_events_id_seq OWNED BY issue_events.id")
+
+    oldest = (
+        op.get_bind()
+        .execute(sa.text("SELECT min(created_at) FROM issue_events_unpartitioned"))
+        .scalar()
+    )
+    this_month = datetime.utcnow().date().replace(day=1)
+    month = min(oldest.date().replace(day=1), this_month) if oldest else this_month
+    while month <= add_months(this_month, MONTHS_AHEAD):
+        op.execute(
+            f"CREATE TABLE issue_events_y{month.year}m{month.month:02d} "
+            "PARTITION OF issue_events "
+            f"FOR VALUES FROM ('{month}') TO ('{add_months(month, 1)}')"
+        )
+        month = add_months(month, 1)
+    op.execute("CREATE TABLE issue_events_default PARTITION OF issue_events DEFAULT")
+
+    op.execute(
+        "INSERT INTO issue_events "
+        "(id, issue_id, event_type, old_value, new_value, created_at) "
+        "SELECT id, issue_id, event_type, old_value, new_value, "
+        "coalesce(created_at, now() AT TIME ZONE 'utc') "
+        "FROM issue_events_unpartitioned"
+    )
+    op.drop_table("issue_events_unpartitioned")
+
+    op.create_index("ix_issue_events_id", "issue_events", ["id"])
+    op.create_index(
+        "ix_issue_events_issue_id_created_at_id",
+        "issue_events",
+        ["issue_id", "created_at", "id"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.rename_table("issue_events", "issue_events_partitioned")
+    op.execute(
+        "ALTER TABLE issue_events_partitioned "
+        "RENAME CONSTRAINT issue_events_pkey TO issue_events_partitioned_pkey"
+    )
+
+    op.create_table(
+        "issue_events",
+        sa.Column(
+            "id",
+            sa.Integer(),
+            server_default=sa.text("nextval('issue_events_id_seq'::regclass)"),
+            nullable=False,
+        ),
+        sa.Column("issue_id", sa.Integer(), nullable=False),
+        sa.Column("event_type", sa.String(length=50), nullable=False),
+        sa.Column("old_value", sa.String(length=255), nullable=True),
+        sa.Column("new_value", sa.String(length=255), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["issue_id"], ["issues.id"]),
+        sa.PrimaryKeyConstraint("id", name="issue_events_pkey"),
+    )
+    op.execute("ALTER SEQUENCE issue_events_id_seq OWNED BY issue_events.id")
+    op.execute(
+        "INSERT INTO issue_events "
+        "(id, issue_id, event_type, old_value, new_value, created_at) "
+        "SELECT id, issue_id, event_type, old_value, new_value, created_at "
+        "FROM issue_events_partitioned"
+    )
+    # Drops the partitions with it
+    op.drop_table("issue_events_partitioned")
+
+    op.create_index("ix_issue_events_id", "issue_events", ["id"])
+    op.create_index(
+        "ix_issue_events_issue_id_created_at",
+        "issue_events",
+        ["issue_id", "created_at"],
+    )
@@ -0,0 +1,86 @@
+"""Track writing transactions and deletions for incremental sync
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18 16:00:00
+
+Adds ``sync_xid``, the id of the transaction that last wrote the row, to
+``issues``, ``comments`` and ``issue_labels``, and the ``deleted_records``
+tombstone table, for GET /sync. Existing rows get ``sync_xid`` 0 (added as a
+constant default, so the tables are not rewritten) and are returned by the
+first full sync; new writes default to the current transaction id. The
+indexes on the existing tables are built with CREATE INDEX CONCURRENTLY so
+that they stay writable during the upgrade.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0008"
+down_revision: Union[str, Sequence[str], None] = "0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+CURRENT_XID = sa.text("pg_current_xact_id()::text::bigint")
+
+SYNC_TABLES = (
+    ("issues", "ix_issues_sync_xid_id", ["sync_xid", "id"]),
+    ("comments", "ix_comments_sync_xid_id", ["sync_xid", "id"]),
+    ("issue_labels", "ix_issue_labels_sync_xid", ["sync_xid", "issue_id", "label_id"]),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, index, columns in SYNC_TABLES:
+        op.add_column(
+            table,
+            sa.Column(
+                "sync_xid", sa.BigInteger(), server_default="0", nullable=False
+            ),
+        )
+        op.alter_column(table, "sync_xid", server_default=CURRENT_XID)
+    with op.get_context().autocommit_block():
+        for table, index, columns in SYNC_TABLES:
+            op.create_index(
+                index,
+                table,
+                columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+    op.create_table(
+        "deleted_records",
+        sa.Column("id", sa.BigInteger(), nullable=False),
+        sa.Column("record_type", sa.String(length=20), nullable=False),
+        sa.Column("issue_id", sa.Integer(), nullable=False),
+        sa.Column("record_id", sa.Integer(), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(), nullable=False),
+        sa.Column(
+            "sync_xid", sa.BigInteger(), server_default=CURRENT_XID, nullable=False
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_deleted_records_sync_xid_id", "deleted_records", ["sync_xid", "id"]
+    )
+    op.create_index("ix_deleted_records_deleted_at", "deleted_records", ["deleted_at"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_deleted_records_deleted_at", table_name="deleted_records")
+    op.drop_index("ix_deleted_records_sync_xid_id", table_name="deleted_records")
+    op.drop_table("deleted_records")
+    with op.get_context().autocommit_block():
+        for table, index, _ in reversed(SYNC_TABLES):
+            op.drop_index(
+                index, table_name=table, postgresql_concurrently=True, if_exists=True
+            )
+    for table, _, _ in reversed(SYNC_TABLES):
+        op.drop_column(table, "sync_xid")
@@ -0,0 +1,45 @@
+"""Record the writing transaction of issue events
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-18 18:30:00
+
+Adds ``sync_xid`` to ``issue_events`` with a ``(sync_xid, id)`` index. The
+change feed (GET /issues/changes) publishes events in that order, and only
+those written by transactions below the snapshot xmin, so an event id taken
+before a slow commit is never skipped. Existing events get ``sync_xid`` 0 and
+come first; new ones default to the current transaction id. The column and
+index are added on the partitioned table and cascade to every partition.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0009"
+down_revision: Union[str, Sequence[str], None] = "0008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+CURRENT_XID = sa.text("pg_current_xact_id()::text::bigint")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "issue_events",
+        sa.Column("sync_xid", sa.BigInteger(), server_default="0", nullable=False),
+    )
+    op.alter_column("issue_events", "sync_xid", server_default=CURRENT_XID)
+    op.create_index(
+        "ix_issue_events_sync_xid_id", "issue_events", ["sync_xid", "id"]
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_issue_events_sync_xid_id", table_name="issue_events")
+    op.drop_column("issue_events", "sync_xid")
@@ -0,0 +1,74 @@
+"""Shard the daily issue rollups
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-18 19:00:00
+
+Adds ``shard`` to the primary key of ``issue_daily_rollups``. Every issue
+created on the same day with the same priority and assignee used to upsert one
+row, so concurrent creates queued on its lock; writers now pick one of
+ISSUE_ROLLUP_SHARDS rows at random and the reports sum them. Existing rows
+become shard 0.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0010"
+down_revision: Union[str, Sequence[str], None] = "0009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "issue_daily_rollups",
+        sa.Column(
+            "shard",
+            sa.Integer(),
+            server_default="0",
+            autoincrement=False,
+            nullable=False,
+        ),
+    )
+    op.alter_column("issue_daily_rollups", "shard", server_default=None)
+    op.drop_constraint(
+        "issue_daily_rollups_pkey", "issue_daily_rollups", type_="primary"
+    )
+    op.create_primary_key(
+        "issue_daily_rollups_pkey",
+        "issue_daily_rollups",
+        ["bucket_date", "priority", "assignee_id", "shard"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("""
+        CREATE TEMPORARY TABLE merged_rollups ON COMMIT DROP AS
+        SELECT bucket_date, priority, assignee_id,
+               SUM(created_count) AS created_count,
+               SUM(resolved_count) AS resolved_count
+        FROM issue_daily_rollups
+        GROUP BY bucket_date, priority, assignee_id
+        """)
+    op.execute("DELETE FROM issue_daily_rollups")
+    op.drop_constraint(
+        "issue_daily_rollups_pkey", "issue_daily_rollups", type_="primary"
+    )
+    op.drop_column("issue_daily_rollups", "shard")
+    op.execute("""
+        INSERT INTO issue_daily_rollups
+            (bucket_date, priority, assignee_id, created_count, resolved_count)
+        SELECT bucket_date, priority, assignee_id, created_count, resolved_count
+        FROM merged_rollups
+        """)
+    op.create_primary_key(
+        "issue_daily_rollups_pkey",
+        "issue_daily_rollups",
+        ["bucket_date", "priority", "assignee_id"],
+    )
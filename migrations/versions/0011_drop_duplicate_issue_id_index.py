@@ -0,0 +1,44 @@
+"""Drop the index on issues.id that duplicates the primary key
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-18 19:30:00
+
+``ix_issues_id`` indexes the same column as ``issues_pkey`` and is never
+chosen over it, but every non-HOT update of an issue still has to insert into
+it; on bulk status updates that is one of the indexes the UPDATE maintains
+for every row. Dropped CONCURRENTLY so ``issues`` stays writable.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0011"
+down_revision: Union[str, Sequence[str], None] = "0010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_issues_id",
+            table_name="issues",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_issues_id",
+            "issues",
+            ["id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
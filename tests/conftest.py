@@ -0,0 +1,119 @@
+"""Shared fixtures.
+
+Tests that need a database run against the (migrated) database of
+TEST_DATABASE_URL, and the replica routing tests also against the one of
+TEST_DATABASE_REPLICA_URL, which stands for a replica; both are skipped when
+the variable is unset. Most tests work inside a transaction that is rolled
+back at the end, so the databases are left as they were.
+"""
+
+import itertools
+import os
+
+import pytest
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+TEST_DATABASE_REPLICA_URL = os.getenv("TEST_DATABASE_REPLICA_URL")
+
+# Set before the app is imported, which creates its engines from them. Without
+# TEST_DATABASE_URL the engine is created but never connected
+os.environ["DATABASE_URL"] = TEST_DATABASE_URL or "postgresql://localhost/tests"
+os.environ["DATABASE_REPLICA_URLS"] = ""
+os.environ["DATABASE_ASYNC"] = "false"
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import Session, sessionmaker  # noqa: E402
+
+from app import database  # noqa: E402
+from app.database import engine, get_db, get_read_db  # noqa: E402
+
+
+def rolled_back_connection():
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL is not set")
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        try:
+            yield connection
+        finally:
+            transaction.rollback()
+
+
+def joined_sessions(connection):
+    """A session dependency whose sessions join the transaction of `connection`."""
+
+    def get_session():
+        session = Session(bind=connection, join_transaction_mode="create_savepoint")
+        try:
+            yield session
+        finally:
+            session.close()
+
+    return get_session
+
+
+def joined_client(connection):
+    from app.main import app
+
+    app.dependency_overrides[get_db] = joined_sessions(connection)
+    app.dependency_overrides[get_read_db] = joined_sessions(connection)
+    try:
+        # Not entered as a context manager: the app's background threads are
+        # not started
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def connection():
+    """A primary database connection in a transaction rolled back at the end."""
+    yield from rolled_back_connection()
+
+
+@pytest.fixture
+def client(connection):
+    """API client whose requests read and write inside `connection`."""
+    yield from joined_client(connection)
+
+
+@pytest.fixture(scope="module")
+def module_connection():
+    """Like `connection`, shared by the tests of a module (e.g. for seed data)."""
+    yield from rolled_back_connection()
+
+
+@pytest.fixture(scope="module")
+def module_client(module_connection):
+    yield from joined_client(module_connection)
+
+
+@pytest.fixture
+def live_client():
+    """API client on the app's own sessions; what it commits stays committed."""
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL is not set")
+    from app.main import app
+
+    return TestClient(app)
+
+
+@pytest.fixture
+def replica_engine(monkeypatch):
+    """Route read sessions to the database of TEST_DATABASE_REPLICA_URL."""
+    if not TEST_DATABASE_URL or not TEST_DATABASE_REPLICA_URL:
+        pytest.skip("TEST_DATABASE_URL or TEST_DATABASE_REPLICA_URL is not set")
+    replica_engine = create_engine(TEST_DATABASE_REPLICA_URL)
+    monkeypatch.setattr(database, "replica_engines", [replica_engine])
+    monkeypatch.setattr(
+        database,
+        "replica_sessions",
+        itertools.cycle(
+            [sessionmaker(autocommit=False, autoflush=False, bind=replica_engine)]
+        ),
+    )
+    try:
+        yield replica_engine
+    finally:
+        replica_engine.dispose()
@@ -0,0 +1,20 @@
+"""run_blocking keeps blocking calls of async handlers off the event loop."""
+
+import asyncio
+import threading
+
+from sqlalchemy.util import greenlet_spawn
+
+from app.utils.async_db import run_blocking
+
+
+def test_run_blocking_calls_directly_outside_async_handlers():
+    assert run_blocking(threading.get_ident) == threading.get_ident()
+
+
+def test_run_blocking_uses_the_threadpool_inside_run_sync():
+    async def handler():
+        # What AsyncSession.run_sync does with the handler body
+        return await greenlet_spawn(run_blocking, threading.get_ident)
+
+    assert asyncio.run(handler()) != threading.get_ident()
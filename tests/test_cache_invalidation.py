@@ -0,0 +1,264 @@
+"""Cross-worker response cache invalidation, with in-process fake backends.
+
+Two cache instances stand for two workers. With the postgres backend each has
+its own MemoryResponseCache and hears the other's writes through NOTIFY. The
+writer commits a real Session (on an in-memory SQLite database), so the
+session hooks decide what is published and when; only the NOTIFY statement is
+replaced, by a fake pub/sub. With the redis backend both share one store,
+replaced by a dict-backed fake client.
+"""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.utils import cache_invalidation
+from app.utils.cache_invalidation import (
+    NOTIFY_IDS_PER_PAYLOAD,
+    apply_invalidation_payload,
+    invalidate_issues,
+)
+from app.utils.response_cache import (
+    ISSUE,
+    TIMELINE,
+    CachedResponse,
+    MemoryResponseCache,
+    RedisResponseCache,
+)
+
+
+class FakePubSub:
+    """Delivers every published payload to every subscriber, like NOTIFY."""
+
+    def __init__(self):
+        self.subscribers = []
+        self.published = []
+
+    def subscribe(self, cache):
+        self.subscribers.append(cache)
+
+    def notify(self, session, payloads):
+        # NOTIFY is delivered on commit, which is when the hook sends it
+        for payload in payloads:
+            self.published.append(payload)
+            for cache in self.subscribers:
+                apply_invalidation_payload(cache, payload)
+
+
+def new_cache():
+    return MemoryResponseCache(ttl_seconds=60, max_entries=100)
+
+
+@pytest.fixture
+def pubsub(monkeypatch):
+    pubsub = FakePubSub()
+    monkeypatch.setattr(cache_invalidation, "RESPONSE_CACHE_BACKEND", "postgres")
+    monkeypatch.setattr(cache_invalidation, "notify_invalidations", pubsub.notify)
+    return pubsub
+
+
+@pytest.fixture
+def reader(pubsub):
+    cache = new_cache()
+    pubsub.subscribe(cache)
+    return cache
+
+
+@pytest.fixture
+def writer_cache(pubsub, monkeypatch):
+    """The writing worker's local cache, the one the session hooks update."""
+    cache = new_cache()
+    pubsub.subscribe(cache)
+    monkeypatch.setattr(cache_invalidation, "response_cache", cache)
+    return cache
+
+
+@pytest.fixture
+def writer(writer_cache):
+    """A session of the writing worker."""
+    engine = create_engine("sqlite://")
+    session = Session(engine)
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+def commit_write(session, issue_ids):
+    session.begin()
+    invalidate_issues(session, issue_ids)
+    session.commit()
+
+
+class FakeRedis:
+    """The subset of the redis client RedisResponseCache uses."""
+
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def register_script(self, script):
+        def set_if_current(keys, args):
+            entry_key, generation_key = keys
+            fill_token, value, _ = args
+            if int(self.values.get(generation_key, 0)) != int(fill_token):
+                return 0
+            self.values[entry_key] = value
+            return 1
+
+        return set_if_current
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, client: FakeRedis):
+        self.client = client
+        self.commands = []
+
+    def incr(self, key):
+        self.commands.append(
+            lambda values: values.__setitem__(key, int(values.get(key, 0)) + 1)
+        )
+
+    def pexpire(self, key, milliseconds):
+        pass
+
+    def delete(self, *keys):
+        self.commands.append(
+            lambda values: [values.pop(key, None) for key in keys]
+        )
+
+    def execute(self):
+        for command in self.commands:
+            command(self.client.values)
+
+
+def response(issue_id: int, version: int) -> CachedResponse:
+    return CachedResponse(etag=f'"{issue_id}-{version}"', body=b"{}")
+
+
+def fill(cache, key, version: int):
+    cache.set(key, response(key[1], version), cache.fill_token(key))
+
+
+def test_write_on_one_worker_invalidates_the_other(
+    reader, writer, writer_cache, pubsub
+):
+    fill(reader, (ISSUE, 1), version=1)
+    fill(reader, (TIMELINE, 1), version=1)
+    fill(reader, (ISSUE, 2), version=1)
+    fill(writer_cache, (ISSUE, 1), version=1)
+
+    commit_write(writer, {1})
+
+    assert pubsub.published == ["1"]
+    assert reader.get((ISSUE, 1)) is None
+    assert reader.get((TIMELINE, 1)) is None
+    assert reader.get((ISSUE, 2)).etag == '"2-1"'
+    assert writer_cache.get((ISSUE, 1)) is None
+
+
+def test_stale_fill_racing_an_invalidation_is_rejected(reader, writer):
+    key = (ISSUE, 1)
+
+    # The reader takes its token and loads version 1 ...
+    fill_token = reader.fill_token(key)
+    # ... the writer commits version 2 before the reader stores its result
+    commit_write(writer, {1})
+    reader.set(key, response(1, version=1), fill_token)
+
+    assert reader.get(key) is None
+    fill(reader, key, version=2)
+    assert reader.get(key).etag == '"1-2"'
+
+
+def test_invalidations_are_split_across_payloads(reader, writer, pubsub):
+    issue_ids = range(1, NOTIFY_IDS_PER_PAYLOAD * 2 + 2)
+    for issue_id in issue_ids:
+        fill(reader, (ISSUE, issue_id), version=1)
+
+    commit_write(writer, set(issue_ids))
+
+    assert len(pubsub.published) == 3
+    assert all(reader.get((ISSUE, issue_id)) is None for issue_id in issue_ids)
+
+
+def test_rollback_publishes_nothing(reader, writer, writer_cache, pubsub):
+    fill(reader, (ISSUE, 1), version=1)
+    fill(writer_cache, (ISSUE, 1), version=1)
+
+    writer.begin()
+    invalidate_issues(writer, {1})
+    writer.rollback()
+    # Nothing is left over for the next transaction either
+    commit_write(writer, set())
+
+    assert pubsub.published == []
+    assert reader.get((ISSUE, 1)).etag == '"1-1"'
+    assert writer_cache.get((ISSUE, 1)).etag == '"1-1"'
+
+
+def test_released_savepoint_waits_for_the_outer_commit(
+    reader, writer, writer_cache, pubsub
+):
+    fill(reader, (ISSUE, 1), version=1)
+    fill(writer_cache, (ISSUE, 1), version=1)
+
+    writer.begin()
+    savepoint = writer.begin_nested()
+    invalidate_issues(writer, {1})
+    savepoint.commit()
+
+    assert pubsub.published == []
+    assert reader.get((ISSUE, 1)).etag == '"1-1"'
+    assert writer_cache.get((ISSUE, 1)).etag == '"1-1"'
+
+    writer.commit()
+
+    assert pubsub.published == ["1"]
+    assert reader.get((ISSUE, 1)) is None
+    assert writer_cache.get((ISSUE, 1)) is None
+
+
+def test_rolled_back_savepoint_keeps_the_outer_invalidations(reader, writer, pubsub):
+    writer.begin()
+    invalidate_issues(writer, {1})
+    savepoint = writer.begin_nested()
+    invalidate_issues(writer, {2})
+    savepoint.rollback()
+    writer.commit()
+
+    # The savepoint's own invalidation is kept too: an extra one is harmless
+    assert pubsub.published == ["1,2"]
+
+
+def test_redis_write_invalidates_the_shared_entry():
+    client = FakeRedis()
+    reader = RedisResponseCache("redis://fake", ttl_seconds=60, client=client)
+    writer = RedisResponseCache("redis://fake", ttl_seconds=60, client=client)
+    fill(reader, (ISSUE, 1), version=1)
+    assert writer.get((ISSUE, 1)).etag == '"1-1"'
+
+    writer.invalidate_issues([1])
+
+    assert reader.get((ISSUE, 1)) is None
+
+
+def test_redis_stale_fill_racing_an_invalidation_is_rejected():
+    client = FakeRedis()
+    reader = RedisResponseCache("redis://fake", ttl_seconds=60, client=client)
+    writer = RedisResponseCache("redis://fake", ttl_seconds=60, client=client)
+    key = (TIMELINE, 1)
+
+    fill_token = reader.fill_token(key)
+    writer.invalidate_issues([1])
+    reader.set(key, response(1, version=1), fill_token)
+
+    assert reader.get(key) is None
+    fill(reader, key, version=2)
+    assert writer.get(key).etag == '"1-2"'
@@ -0,0 +1,94 @@
+"""GET /issues/?expand=... runs the same number of statements for every page size.
+
+expand_issues loads each expansion with one query per page, never one per
+issue. Statements are counted with a ``before_cursor_execute`` listener.
+"""
+
+import pytest
+from sqlalchemy import event, text
+
+SEED = [
+    text(
+        """
+        INSERT INTO users (username, email, password_hash)
+        SELECT 'expand-user-' || n, 'expand-user-' || n || '@example.com', 'x'
+        FROM generate_series(1, 20) AS n
+        """
+    ),
+    text(
+        """
+        INSERT INTO labels (name)
+        SELECT 'expand-label-' || n FROM generate_series(1, 10) AS n
+        """
+    ),
+    text(
+        """
+        INSERT INTO issues (title, status, priority, version, assignee_id,
+                            created_at, updated_at)
+        SELECT 'Expanded issue ' || n, 'open', 'low', 1,
+               (SELECT id FROM users WHERE username = 'expand-user-' || (1 + n % 20)),
+               now() + n * interval '1 second',
+               now() + n * interval '1 second'
+        FROM generate_series(1, 100) AS n
+        """
+    ),
+    text(
+        """
+        INSERT INTO issue_labels (issue_id, label_id)
+        SELECT issues.id, labels.id
+        FROM issues, labels
+        WHERE issues.title LIKE 'Expanded issue %'
+          AND labels.name LIKE 'expand-label-%'
+          AND (issues.id + labels.id) % 3 = 0
+        """
+    ),
+    text(
+        """
+        INSERT INTO comments (content, issue_id, author_id, created_at)
+        SELECT 'Comment ' || n, issues.id, issues.assignee_id, now()
+        FROM issues, generate_series(1, 3) AS n
+        WHERE issues.title LIKE 'Expanded issue %'
+        """
+    ),
+]
+
+PAGE_SIZES = (1, 10, 50, 100)
+
+
+def count_statements(connection, client, expand: str, page_size: int) -> int:
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(connection, "before_cursor_execute", record)
+    try:
+        response = client.get(
+            "/issues/",
+            params={"expand": expand, "page_size": page_size, "total_mode": "none"},
+        )
+    finally:
+        event.remove(connection, "before_cursor_execute", record)
+    assert response.status_code == 200, response.text
+    issues = response.json()["issues"]
+    assert len(issues) == page_size
+    for name in expand.split(","):
+        assert all(name in issue for issue in issues)
+    # Savepoints of the joined sessions are not queries of the endpoint
+    return sum(1 for statement in statements if "SAVEPOINT" not in statement)
+
+
+@pytest.mark.parametrize("expand", ["assignee,labels", "labels,assignee,comment_count"])
+def test_expand_statement_count_does_not_grow_with_page_size(
+    connection, client, expand
+):
+    for statement in SEED:
+        connection.execute(statement)
+
+    counts = {
+        page_size: count_statements(connection, client, expand, page_size)
+        for page_size in PAGE_SIZES
+    }
+
+    # The page query, then one query per expansion
+    assert set(counts.values()) == {1 + len(expand.split(","))}, counts
@@ -0,0 +1,194 @@
+"""Issue list and timeline queries are planned on their indexes.
+
+Seeds issues with assignees, labels and timeline events, ANALYZEs them, then
+EXPLAINs the page query that GET /issues/ runs for every sort and order, alone
+and with each filter, and the first timeline page of an issue with many
+events. No plan may
+contain a Seq Scan or a Sort node: every page is read in index order and the
+LIMIT stops the scan.
+"""
+
+import itertools
+import json
+
+import pytest
+from sqlalchemy import event, text
+
+ISSUES = 20000
+USERS = 20
+LABELS = 50
+BUSY_EVENTS = 2000
+
+SEED = [
+    text(
+        """
+        INSERT INTO users (username, email, password_hash)
+        SELECT 'plan-user-' || n, 'plan-user-' || n || '@example.com', 'x'
+        FROM generate_series(1, :users) AS n
+        """
+    ),
+    text(
+        """
+        INSERT INTO labels (name)
+        SELECT 'plan-label-' || n FROM generate_series(1, :labels) AS n
+        """
+    ),
+    text(
+        """
+        INSERT INTO issues (title, description, status, priority, version,
+                            assignee_id, created_at, updated_at)
+        SELECT 'Planned issue ' || n, 'Seeded description',
+               (ARRAY['open', 'in_progress', 'resolved', 'closed'])[1 + n % 4],
+               (ARRAY['low', 'medium', 'high', 'critical'])[1 + n / 7 % 4],
+               1,
+               (SELECT id FROM users
+                WHERE username = 'plan-user-' || (1 + n % :users)),
+               now() - n * interval '1 minute',
+               now() - (n * 7919 % :issues) * interval '1 minute'
+        FROM generate_series(1, :issues) AS n
+        """
+    ),
+    text(
+        """
+        INSERT INTO issue_labels (issue_id, label_id)
+        SELECT DISTINCT issues.id, labels.id
+        FROM issues
+        CROSS JOIN LATERAL (VALUES (issues.id % :labels),
+                                   (issues.id * 7 % :labels)) AS picked (n)
+        JOIN labels ON labels.name = 'plan-label-' || (1 + picked.n)
+        WHERE issues.title LIKE 'Planned issue %'
+        """
+    ),
+    text(
+        """
+        INSERT INTO issue_events (issue_id, event_type, old_value, new_value,
+                                  created_at)
+        SELECT issues.id, 'status updated', 'open', 'in_progress',
+               issues.created_at + n * interval '1 second'
+        FROM issues, generate_series(1, 4) AS n
+        WHERE issues.title LIKE 'Planned issue %'
+        """
+    ),
+    # A timeline of many pages, spread over several monthly partitions
+    text(
+        """
+        INSERT INTO issue_events (issue_id, event_type, old_value, new_value,
+                                  created_at)
+        SELECT issues.id, 'commented', NULL, 'Seeded comment',
+               now() - n * interval '1 hour'
+        FROM issues, generate_series(1, :busy_events) AS n
+        WHERE issues.title = 'Planned issue 1'
+        """
+    ),
+]
+
+SORTS = ("created_at", "updated_at", "priority", "status")
+ORDERS = ("asc", "desc")
+FILTERS = {
+    "none": {},
+    "status": {"status": "open"},
+    "priority": {"priority": "high"},
+    "assignee": {"assignee_id": "plan-user-3"},
+    "label": {"labels": "plan-label-7"},
+}
+
+
+@pytest.fixture(scope="module")
+def seeded(module_connection):
+    for statement in SEED:
+        module_connection.execute(
+            statement,
+            {
+                "issues": ISSUES,
+                "users": USERS,
+                "labels": LABELS,
+                "busy_events": BUSY_EVENTS,
+            },
+        )
+    for table in ("users", "labels", "issues", "issue_labels", "issue_events"):
+        module_connection.execute(text(f"ANALYZE {table}"))
+    return {
+        "assignee_id": module_connection.execute(
+            text("SELECT id FROM users WHERE username = 'plan-user-3'")
+        ).scalar(),
+        "issue_id": module_connection.execute(
+            text("SELECT id FROM issues WHERE title = 'Planned issue 1'")
+        ).scalar(),
+    }
+
+
+def plan_nodes(plan: dict):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from plan_nodes(child)
+
+
+def explain_page_query(connection, client, path: str, params: dict, table: str):
+    """EXPLAIN the query of `path` that read a page (a LIMIT) from `table`."""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(connection, "before_cursor_execute", record)
+    try:
+        response = client.get(path, params=params)
+    finally:
+        event.remove(connection, "before_cursor_execute", record)
+    assert response.status_code == 200, response.text
+
+    statement, parameters = next(
+        (statement, parameters)
+        for statement, parameters in statements
+        if f"FROM {table}" in statement and "LIMIT" in statement
+    )
+    plan = connection.exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {statement}", parameters
+    ).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]["Plan"]
+
+
+def assert_indexed(plan: dict):
+    unwanted = [
+        f"{node['Node Type']} on {node.get('Relation Name', '?')}"
+        if "Scan" in node["Node Type"]
+        else node["Node Type"]
+        for node in plan_nodes(plan)
+        if node["Node Type"] in ("Seq Scan", "Sort", "Incremental Sort")
+    ]
+    assert not unwanted, f"{', '.join(unwanted)}:\n{json.dumps(plan, indent=2)}"
+
+
+@pytest.mark.parametrize(
+    "sort_by,sort_order,filter_name",
+    list(itertools.product(SORTS, ORDERS, FILTERS)),
+)
+def test_issue_list_plan(
+    module_connection, module_client, seeded, sort_by, sort_order, filter_name
+):
+    params = {
+        "sort_by": sort_by,
+        "sort_order": sort_order,
+        "total_mode": "none",
+        **FILTERS[filter_name],
+    }
+    if filter_name == "assignee":
+        params["assignee_id"] = seeded["assignee_id"]
+    plan = explain_page_query(
+        module_connection, module_client, "/issues/", params, "issues"
+    )
+    assert_indexed(plan)
+
+
+def test_issue_timeline_plan(module_connection, module_client, seeded):
+    assert_indexed(
+        explain_page_query(
+            module_connection,
+            module_client,
+            f"/issues/{seeded['issue_id']}/timeline",
+            {},
+            "issue_events",
+        )
+    )
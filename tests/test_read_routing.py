@@ -0,0 +1,110 @@
+"""Replica routing and read-your-writes, against a primary and a replica database.
+
+The replica database is not fed by the primary, so a read can tell which one
+served it: each holds a differently titled issue created in the year 2100.
+"""
+
+import time
+from datetime import datetime
+
+import pytest
+from sqlalchemy import delete, insert, select
+
+from app.database import engine
+from app.models.issue import Issue
+from app.models.issue_event import IssueEvent
+from app.utils import read_your_writes
+from app.utils.read_your_writes import PRIMARY_PIN_COOKIE, READ_YOUR_WRITES_SECONDS
+
+MARKER_CREATED_AT = datetime(2100, 1, 1)
+
+
+def delete_issues(target, issue_ids):
+    with target.begin() as connection:
+        connection.execute(delete(IssueEvent).where(IssueEvent.issue_id.in_(issue_ids)))
+        connection.execute(delete(Issue).where(Issue.id.in_(issue_ids)))
+
+
+@pytest.fixture
+def marker_issues(replica_engine):
+    issue_ids = {}
+    for name, target in (("primary", engine), ("replica", replica_engine)):
+        with target.begin() as connection:
+            issue_ids[name] = connection.execute(
+                insert(Issue)
+                .values(
+                    title=f"Served by the {name}",
+                    version=1,
+                    created_at=MARKER_CREATED_AT,
+                    updated_at=MARKER_CREATED_AT,
+                )
+                .returning(Issue.id)
+            ).scalar()
+    try:
+        yield
+    finally:
+        delete_issues(engine, [issue_ids["primary"]])
+        delete_issues(replica_engine, [issue_ids["replica"]])
+
+
+def read_source(client) -> str:
+    """Which database served an issue list read."""
+    response = client.get(
+        "/issues/", params={"created_after": "2099-12-31T00:00:00"}
+    )
+    assert response.status_code == 200, response.text
+    titles = [issue["title"] for issue in response.json()["issues"]]
+    assert len(titles) == 1, titles
+    return titles[0].rsplit(" ", 1)[-1]
+
+
+def test_reads_go_to_the_replica(live_client, marker_issues):
+    assert read_source(live_client) == "replica"
+
+
+def test_writes_and_pinned_reads_go_to_the_primary(
+    live_client, replica_engine, marker_issues
+):
+    response = live_client.post("/issues/", json={"title": "Written to the primary"})
+    assert response.status_code == 201, response.text
+    issue_id = response.json()["id"]
+    try:
+        with engine.connect() as connection:
+            assert connection.execute(
+                select(Issue.id).where(Issue.id == issue_id)
+            ).scalar()
+        with replica_engine.connect() as connection:
+            assert not connection.execute(
+                select(Issue.id).where(Issue.id == issue_id)
+            ).scalar()
+
+        assert PRIMARY_PIN_COOKIE in live_client.cookies
+        assert read_source(live_client) == "primary"
+    finally:
+        delete_issues(engine, [issue_id])
+
+
+def test_pin_expires(live_client, marker_issues, monkeypatch):
+    response = live_client.post("/issues/", json={"title": "Written to the primary"})
+    assert response.status_code == 201, response.text
+    try:
+        assert read_source(live_client) == "primary"
+
+        later = time.time() + READ_YOUR_WRITES_SECONDS + 1
+
+        class Clock:
+            @staticmethod
+            def time():
+                return later
+
+        monkeypatch.setattr(read_your_writes, "time", Clock)
+        assert read_source(live_client) == "replica"
+    finally:
+        delete_issues(engine, [response.json()["id"]])
+
+
+def test_forged_pin_is_ignored(live_client, marker_issues):
+    live_client.cookies.set(PRIMARY_PIN_COOKIE, "9e18")
+    assert read_source(live_client) == "replica"
+    live_client.cookies.set(PRIMARY_PIN_COOKIE, "9e18:" + "0" * 64)
+    assert read_source(live_client) == "replica"
@@ -0,0 +1,29 @@
+"""GET /sync reads the primary even when read replicas are configured."""
+
+from datetime import datetime
+
+from sqlalchemy import delete, insert
+
+from app.database import engine
+from app.models.issue import Issue
+from app.utils.sync import SyncToken, commit_horizon
+
+
+def test_sync_reads_the_primary(live_client, replica_engine):
+    with engine.connect() as connection:
+        token = SyncToken(commit_horizon(connection), low_at=datetime.utcnow())
+    # Committed on the primary only: the replica database never sees it, like
+    # a replica that has not replayed it yet
+    with engine.begin() as connection:
+        issue_id = connection.execute(
+            insert(Issue)
+            .values(title="Synced from the primary", version=1)
+            .returning(Issue.id)
+        ).scalar()
+    try:
+        response = live_client.get("/sync/", params={"since": token.encode()})
+        assert response.status_code == 200, response.text
+        assert issue_id in [issue["id"] for issue in response.json()["issues"]]
+    finally:
+        with engine.begin() as connection:
+            connection.execute(delete(Issue).where(Issue.id == issue_id))
@@ -0,0 +1,62 @@
+"""Concurrent PATCH /issues/{id} with the same version: one wins, the rest get 409.
+
+The requests go through the app's own sessions, so each runs in its own
+transaction and they really race for the row. The issue is deleted at the end.
+"""
+
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import delete, select
+
+from app.database import engine
+from app.models.issue import Issue
+from app.models.issue_event import IssueEvent
+
+WRITERS = 10
+ROUNDS = 5
+
+
+def test_concurrent_updates_with_the_same_version(live_client):
+    response = live_client.post("/issues/", json={"title": "Update contention test"})
+    assert response.status_code == 201, response.text
+    issue_id = response.json()["id"]
+    version = response.json()["version"]
+    try:
+        with ThreadPoolExecutor(max_workers=WRITERS) as executor:
+            for round_number in range(ROUNDS):
+                start = threading.Barrier(WRITERS)
+
+                def patch(index):
+                    start.wait()
+                    return live_client.patch(
+                        f"/issues/{issue_id}",
+                        json={
+                            "version": version,
+                            "priority": ("low", "medium", "high")[index % 3],
+                            "description": f"round {round_number} writer {index}",
+                        },
+                    )
+
+                responses = list(executor.map(patch, range(WRITERS)))
+
+                codes = Counter(response.status_code for response in responses)
+                assert codes == {200: 1, 409: WRITERS - 1}, (round_number, codes)
+                (winner,) = [r.json() for r in responses if r.status_code == 200]
+                assert winner["version"] == version + 1
+                with engine.connect() as connection:
+                    stored = connection.execute(
+                        select(Issue.version, Issue.description).where(
+                            Issue.id == issue_id
+                        )
+                    ).one()
+                assert stored.version == version + 1
+                assert stored.description == winner["description"]
+                version += 1
+    finally:
+        with engine.begin() as connection:
+            connection.execute(
+                delete(IssueEvent).where(IssueEvent.issue_id == issue_id)
+            )
+            connection.execute(delete(Issue).where(Issue.id == issue_id))